@@ -0,0 +1,87 @@
+"""
+Benchmark and cross-check the image decoder backends.
+
+Without arguments, runs the registry's start-up benchmark on the generated corpus
+and prints per-backend timings. Given a folder of images (e.g. real chapter pages),
+decodes each file with every backend at full size and at 1/3 of its probed
+(pre-rotation) size, reports the time per backend and the largest mean pixel
+difference from the first backend, and flags files where a backend's output
+differs, including scaled outputs of a different size (e.g. EXIF-rotated JPEGs).
+
+Usage: python benchmarks/bench_decoders.py [image_folder]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from PyQt6.QtCore import QSize
+
+from src.utils.decoders import DecoderRegistry, MAX_MEAN_ERROR, _pixels, read_magic, sniff_format
+
+
+def bench_folder(folder: Path):
+    registry = DecoderRegistry.instance()
+    decoders = [registry._decoders[name] for name in registry._default_order]
+    totals = {d.name: 0.0 for d in decoders}
+    worst = {d.name: 0.0 for d in decoders}
+    files = [p for p in sorted(folder.iterdir()) if p.is_file() and sniff_format(read_magic(str(p)))]
+
+    for path in files:
+        data = path.read_bytes()
+        fmt = sniff_format(data[:32])
+        probed = registry.probe(data)
+        target = QSize(max(1, probed.width() // 3), max(1, probed.height() // 3))
+        reference = None
+        scaled_reference = None
+        for decoder in decoders:
+            if fmt not in decoder.formats:
+                continue
+            try:
+                start = time.perf_counter()
+                full = decoder.decode(data)
+                scaled = decoder.decode(data, target)
+                totals[decoder.name] += time.perf_counter() - start
+            except Exception as e:
+                print(f"  {path.name}: {decoder.name} failed: {e}")
+                continue
+            if full.isNull():
+                print(f"  {path.name}: {decoder.name} cannot decode {fmt}")
+                continue
+            if scaled_reference is None:
+                scaled_reference = scaled.size()
+            elif scaled.size() != scaled_reference:
+                print(f"  {path.name}: {decoder.name} scaled size {scaled.width()}x{scaled.height()}"
+                      f" != {scaled_reference.width()}x{scaled_reference.height()}")
+            pixels = _pixels(full)
+            if reference is None:
+                reference = pixels
+                continue
+            if pixels.shape != reference.shape:
+                print(f"  {path.name}: {decoder.name} size {pixels.shape} != {reference.shape}")
+                continue
+            error = float(np.abs(pixels - reference).mean())
+            worst[decoder.name] = max(worst[decoder.name], error)
+            if error > MAX_MEAN_ERROR:
+                print(f"  {path.name}: {decoder.name} differs, mean error {error:.2f}")
+
+    print(f"{len(files)} images in {folder}")
+    for name, total in totals.items():
+        print(f"  {name:8s} {total * 1000:9.1f} ms total, worst mean error {worst[name]:.2f}")
+
+
+def main():
+    if len(sys.argv) > 1:
+        bench_folder(Path(sys.argv[1]))
+        return
+    timings = DecoderRegistry.instance().run_benchmark()
+    for key, per_decoder in sorted(timings.items()):
+        ranked = ", ".join(f"{name} {ms:.1f} ms" for name, ms in per_decoder.items())
+        print(f"  {key:12s} {ranked}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Count filesystem calls per operation on a synthetic series.
+
+Wraps os.stat, os.lstat, os.scandir and os.listdir with counters (pathlib goes
+through them too) and reports how many of each a full series scan, an unchanged
+journal rescan and a chapter load (mtime sort plus alt and translation lookups)
+make. On POSIX, DirEntry type checks come from the listing and cost nothing unless
+the filesystem does not report types.
+
+Usage: python benchmarks/bench_fs.py [chapters] [pages_per_chapter]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import database_utils
+from src.core.library_scanner import LibraryScanner
+from src.workers.view_workers import ChapterLoaderWorker
+
+CALLS = Counter()
+
+
+def counting(name, fn):
+    def wrapper(*args, **kwargs):
+        CALLS[name] += 1
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+for _name in ('stat', 'lstat', 'scandir', 'listdir'):
+    setattr(os, _name, counting(_name, getattr(os, _name)))
+
+
+def build_series(root: Path, chapters: int, pages: int) -> Path:
+    series = root / "Series"
+    info = {}
+    for c in range(chapters):
+        chapter = series / f"Chapter {c}"
+        (chapter / "alts").mkdir(parents=True)
+        for page in range(pages):
+            (chapter / f"{page:03d}.jpg").write_bytes(b"\xff\xd8\xff")
+        # Every fourth page has an alt and a translation, one of them missing
+        info[chapter.name] = {
+            f"{page:03d}.jpg": {"alts": [f"alts/{page:03d}_b.jpg"], "translations": {"en": f"{page:03d}_en.jpg"}}
+            for page in range(0, pages, 4)
+        }
+        for page in range(0, pages, 4):
+            (chapter / "alts" / f"{page:03d}_b.jpg").write_bytes(b"\xff\xd8\xff")
+    (series / "info.json").write_text(json.dumps(info))
+    past = time.time() - 3600
+    for dirpath, dirnames, filenames in os.walk(series):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+    os.utime(series, (past, past))
+    return series
+
+
+def counted(label: str, fn):
+    CALLS.clear()
+    fn()
+    calls = dict(CALLS)
+    print(f"  {label:28s} " + "  ".join(f"{name} {calls.get(name, 0):5d}" for name in ('stat', 'lstat', 'scandir', 'listdir')))
+
+
+def main():
+    chapters = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    pages = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_utils._db_path = lambda: Path(tmp) / "library.db"
+        database_utils.create_tables()
+        scanner = LibraryScanner()
+        scanner.detect_format = lambda series_data: ["Manga"] # image sampling is not what is measured
+        scanner._auto_blacklist_spine_assets = lambda series_path, chapters: None # writes info.json
+        series = build_series(Path(tmp), chapters, pages)
+        print(f"One series, {chapters} chapters x {pages} pages")
+
+        counted("full scan", lambda: scanner.scan_series(str(series)))
+        counted("journal rescan, no changes", lambda: scanner.rescan_series(str(series)))
+        worker = ChapterLoaderWorker(str(series / "Chapter 1"), str(series), False, sort_mode='mtime')
+        counted("chapter load", worker.run)
+        database_utils.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
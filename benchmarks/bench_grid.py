@@ -0,0 +1,116 @@
+"""
+Measure library grid tile churn across filter changes.
+
+Builds a temporary library.db with N series (default 2000), each an existing folder
+tagged with a few of 20 genres, opens the library grid offscreen and walks it through
+a typical filter session after opening it: the whole library, one genre, another genre, both genres,
+back to the whole library, and a title search. For every step it reports the tiles
+the grid created, reused and destroyed (FolderGrid.item_stats) and the time until
+the new tiles were all placed, next to the tiles a full rebuild would have created
+(how every filter change used to work).
+
+Usage: python benchmarks/bench_grid.py [series]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.utils import database_utils
+from src.core.library_manager import LibraryManager
+from src.ui.folder_grid import FolderGrid
+
+
+def populate(root: Path, series_count: int):
+    rng = random.Random(5)
+    conn = database_utils.get_db_connection()
+    rows = []
+    for i in range(1, series_count + 1):
+        folder = root / f"series_{i:05d}"
+        folder.mkdir()
+        rows.append((i, f"Series {i}", str(folder), None))
+    conn.executemany("INSERT INTO series (id, name, path, cover_image) VALUES (?, ?, ?, ?)", rows)
+    conn.executemany("INSERT INTO genres (name) VALUES (?)", [(f"Genre {g}",) for g in range(20)])
+    links = {(i, rng.randrange(1, 21)) for i in range(1, series_count + 1) for _ in range(3)}
+    conn.executemany("INSERT INTO series_genres (series_id, genre_id) VALUES (?, ?)", sorted(links))
+    conn.commit()
+    conn.close()
+
+
+def settle(app: QApplication, grid: FolderGrid, timeout: float = 120.0):
+    """Process events until the grid's loaders have shown every new tile."""
+    deadline = time.perf_counter() + timeout
+    while (grid._active_loaders or grid._place_from is not None) and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+
+
+def main():
+    series_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication(sys.argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        db_file = root / "library.db"
+        database_utils._db_path = lambda: db_file
+        manager = LibraryManager()
+        library = root / "library"
+        library.mkdir()
+        populate(library, series_count)
+
+        start = time.perf_counter()
+        grid = FolderGrid(manager)
+        settle(app, grid)
+        opened = (time.perf_counter() - start) * 1000
+
+        # Every step goes through the calls the search bar and tag tokens make
+        steps = [
+            ("whole library", lambda: grid.load_items()),
+            ("genre: Genre 0", lambda: grid.apply_tag_filter("genre", "Genre 0")),
+            ("genre: Genre 1", lambda: grid.apply_tag_filter("genre", "Genre 1")),
+            ("genres: Genre 1 + Genre 2", lambda: grid.add_token("/genre:", "Genre 2")),
+            ("whole library again", lambda: grid.clear_search()),
+            ("search 'Series 1'", lambda: grid.search_bar.setText("Series 1")),
+        ]
+
+        print(f"Library grid, {series_count} series")
+        print(f"  {'step':28s} {'shown':>6s} {'created':>8s} {'reused':>7s} {'destroyed':>10s} {'rebuild':>8s} {'ms':>8s}")
+        totals = dict(grid.item_stats)
+        rebuild_total = len(grid.items)
+        print(f"  {'open the grid':28s} {len(grid.items):6d} {totals['created']:8d} {totals['reused']:7d} "
+              f"{totals['destroyed']:10d} {len(grid.items):8d} {opened:8.1f}")
+        for label, step in steps:
+            for key in grid.item_stats:
+                grid.item_stats[key] = 0
+            start = time.perf_counter()
+            step()
+            settle(app, grid)
+            elapsed = (time.perf_counter() - start) * 1000
+            stats = dict(grid.item_stats)
+            shown = len(grid.items)
+            for key in totals:
+                totals[key] += stats[key]
+            rebuild_total += shown
+            print(f"  {label:28s} {shown:6d} {stats['created']:8d} {stats['reused']:7d} "
+                  f"{stats['destroyed']:10d} {shown:8d} {elapsed:8.1f}")
+        print(f"  {'total':28s} {'':6s} {totals['created']:8d} {totals['reused']:7d} "
+              f"{totals['destroyed']:10d} {rebuild_total:8d}")
+
+        for loader in grid._active_loaders:
+            loader.abort()
+        grid.close()
+        grid.deleteLater()
+        app.processEvents()
+        database_utils.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
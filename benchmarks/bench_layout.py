@@ -0,0 +1,57 @@
+"""
+Benchmark double-page layout maintenance while spread results stream in.
+
+Simulates spread detection reporting one page at a time on a large chapter and
+compares ReaderModel.set_spreads (incremental re-pairing) with rebuilding the whole
+layout after every result.
+
+Usage: python benchmarks/bench_layout.py [pages] [spread_ratio]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.page import Page
+from src.data.reader_model import ReaderModel
+
+
+def make_model(pages: int) -> ReaderModel:
+    model = ReaderModel(None, [], 0)
+    model.set_images([Page([f"/chapter/{i:05d}.jpg"]) for i in range(pages)])
+    return model
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    ratio = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    rng = random.Random(42)
+    results = [(i, rng.random() < ratio) for i in range(pages)]
+
+    incremental = make_model(pages)
+    start = time.perf_counter()
+    for i, is_spread in results:
+        incremental.set_spreads({i: is_spread})
+    inc_time = time.perf_counter() - start
+
+    full = make_model(pages)
+    start = time.perf_counter()
+    for i, is_spread in results:
+        full.images[i].is_spread = is_spread
+        full._build_double_layout()
+    full_time = time.perf_counter() - start
+
+    def layout_key(model):
+        return [tuple(x.path if isinstance(x, Page) else x for x in pair) for pair in model._layout_pairs]
+
+    same = layout_key(incremental) == layout_key(full) and incremental._page_to_layout_index == full._page_to_layout_index
+    print(f"{pages} pages, {sum(s for _, s in results)} spreads, {len(results)} streamed results")
+    print(f"  full rebuild per result: {full_time * 1000:8.1f} ms total, {full_time / pages * 1e6:7.1f} us/result")
+    print(f"  incremental set_spreads: {inc_time * 1000:8.1f} ms total, {inc_time / pages * 1e6:7.1f} us/result")
+    print(f"  layouts identical: {same}")
+
+
+if __name__ == "__main__":
+    main()
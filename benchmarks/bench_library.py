@@ -0,0 +1,199 @@
+"""
+Benchmark library database operations on a synthetic library.
+
+Builds a temporary library.db with N series (default 20000), each with chapters,
+authors, genres, themes and a format, then times common LibraryManager calls twice:
+once with a fresh connection per call and without the secondary indexes (how the
+library used to run), and once with the pooled connections and the
+current schema. Finally reports the time and peak memory of loading the whole
+library at each level (the grid's summary up to full chapter lists), and the
+throughput of importing and batch-tagging series one call at a time versus in bulk.
+
+Usage: python benchmarks/bench_library.py [series] [chapters_per_series]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import database_utils
+from src.core.library_manager import LibraryManager, LEVELS, SUMMARY
+from src.core.library_scanner import BatchScannerWorker
+
+
+def populate(series_count: int, chapters_per_series: int):
+    rng = random.Random(7)
+    conn = database_utils.get_db_connection()
+    tags = {
+        'authors': [f"Author {i}" for i in range(max(10, series_count // 6))],
+        'genres': [f"Genre {i}" for i in range(40)],
+        'themes': [f"Theme {i}" for i in range(60)],
+        'formats': ["Manga", "Webtoon", "Artbook", "Doujinshi", "Video"],
+    }
+    for table, names in tags.items():
+        conn.executemany(f"INSERT INTO {table} (name) VALUES (?)", [(n,) for n in names])
+    conn.executemany(
+        "INSERT INTO series (id, name, path, cover_image) VALUES (?, ?, ?, ?)",
+        [(i, f"Series {i}", f"/library/series_{i:06d}", None) for i in range(1, series_count + 1)]
+    )
+    conn.executemany(
+        "INSERT INTO chapters (series_id, name, path) VALUES (?, ?, ?)",
+        [(i, f"Chapter {c}", f"/library/series_{i:06d}/chapter_{c:04d}")
+         for i in range(1, series_count + 1) for c in range(chapters_per_series)]
+    )
+    per_series = {'authors': 2, 'genres': 3, 'themes': 2, 'formats': 1}
+    for tag, (table, junction, fk) in LibraryManager._TAG_CONFIG.items():
+        count = len(tags[tag])
+        rows = {(i, rng.randrange(1, count + 1)) for i in range(1, series_count + 1) for _ in range(per_series[tag])}
+        conn.executemany(f"INSERT INTO {junction} (series_id, {fk}) VALUES (?, ?)", sorted(rows))
+    conn.commit()
+    conn.close()
+
+
+def drop_indexes():
+    conn = database_utils.get_db_connection()
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'").fetchall():
+        conn.execute(f"DROP INDEX {name}")
+    for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'series_search_%'").fetchall():
+        conn.execute(f"DROP TRIGGER {name}")
+    conn.execute("DROP TABLE IF EXISTS series_search")
+    conn.commit()
+    conn.close()
+
+
+def restore_indexes():
+    """Re-run the schema versions that create indexes and the search table."""
+    conn = database_utils.get_db_connection()
+    for version, statements in database_utils.SCHEMA_VERSIONS:
+        if version in (1, 2):
+            for statement in statements:
+                conn.execute(statement)
+    conn.commit()
+    conn.close()
+
+
+def fresh_connection():
+    """Close the pooled connections, as if every call opened its own."""
+    with database_utils._connections_lock:
+        connections = list(database_utils._connections)
+        database_utils._connections.clear()
+        database_utils._idle.clear()
+    database_utils._local.conn = None
+    for conn in connections:
+        conn._close()
+
+
+def run(manager: LibraryManager, series_count: int, per_call_connection: bool) -> dict:
+    rng = random.Random(11)
+    sample_ids = [rng.randrange(1, series_count + 1) for _ in range(200)]
+    timings = {}
+
+    def timed(name, fn, repeat=1):
+        start = time.perf_counter()
+        for i in range(repeat):
+            fn(i)
+            if per_call_connection:
+                fresh_connection()
+                manager.facets.invalidate() # tags recomputed on every refresh
+        timings[name] = (time.perf_counter() - start) * 1000.0
+
+    timed("get_series (all)", lambda i: manager.get_series())
+    timed("filter by genre x20", lambda i: manager.search_series_with_filters('', {'genres': [f"Genre {i}"]}), 20)
+    timed("search title x50", lambda i: manager.search_series_with_filters(f"ries {sample_ids[i]}", {}), 50)
+    timed("filter by author x200", lambda i: manager.search_series_with_filters('', {'authors': [f"Author {i}"]}), 200)
+    timed("tag completer x200", lambda i: manager.complete_tag('authors', f"Author {i}"), 200)
+    timed("group counts x50", lambda i: manager.get_field_values_with_counts('genre'), 50)
+    timed("get_series_by_path x200", lambda i: manager.get_series_by_path(f"/library/series_{sample_ids[i]:06d}"), 200)
+    timed("get_chapters x200", lambda i: manager.get_chapters({'id': sample_ids[i]}), 200)
+    timed("update_last_read x200", lambda i: manager.update_last_read_chapter(sample_ids[i], "/x", i), 200)
+    timed("recently opened x50", lambda i: manager.get_recently_opened_series(), 50)
+    return timings
+
+
+def measure_levels(manager: LibraryManager):
+    """Time and peak Python memory of loading the whole library at each level."""
+    print(f"  {'get_series level':28s} {'ms':>10s} {'peak MB':>11s}")
+    for level in LEVELS:
+        start = time.perf_counter()
+        manager.get_series(level)
+        elapsed = (time.perf_counter() - start) * 1000.0
+        tracemalloc.start()
+        manager.get_series(level)
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+        print(f"  {level:28s} {elapsed:10.1f} {peak:11.1f}")
+
+
+def measure_import(manager: LibraryManager, count: int = 5000, chapters: int = 20):
+    """Import and batch-tag count series one call per series, then in bulk."""
+    metadata = {'authors': ["Import Author"], 'genres': ["Genre 1", "Genre 2"], 'themes': ["Theme 3"]}
+
+    def scanned(prefix):
+        return [{'name': f"{prefix} {i}", 'path': f"/{prefix}/series_{i:06d}", 'cover_image': None,
+                 'formats': ["Manga"],
+                 'chapters': [{'name': f"Chapter {c}", 'path': f"/{prefix}/series_{i:06d}/chapter_{c:04d}"}
+                              for c in range(chapters)]}
+                for i in range(count)]
+
+    print(f"  {'import / tag {} series'.format(count):28s} {'per call ms':>10s} {'bulk ms':>11s}")
+    one_by_one, bulk = scanned("single"), scanned("bulk")
+    start = time.perf_counter()
+    for series_data in one_by_one:
+        manager.add_series_from_data(series_data, metadata)
+    single_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    for i in range(0, count, BatchScannerWorker.WRITE_BATCH):
+        manager.add_series_batch(bulk[i:i + BatchScannerWorker.WRITE_BATCH], metadata)
+    bulk_ms = (time.perf_counter() - start) * 1000.0
+    print(f"  {'add series':28s} {single_ms:10.1f} {bulk_ms:11.1f}")
+
+    imported = manager.search_series_with_filters('', {'authors': ["Import Author"]}, SUMMARY)
+    half = len(imported) // 2
+    edit = {'genres': ["Genre 5"], 'themes': ["Theme 7", "Theme 8"]}
+    start = time.perf_counter()
+    for series in imported[:half]:
+        manager.update_series_info(series['id'], edit)
+    single_ms = (time.perf_counter() - start) * 1000.0
+    start = time.perf_counter()
+    manager.update_series_batch(imported[half:], edit)
+    bulk_ms = (time.perf_counter() - start) * 1000.0
+    print(f"  {'batch edit (per half)':28s} {single_ms:10.1f} {bulk_ms:11.1f}")
+
+
+def main():
+    series_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    chapters = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = Path(tmp) / "library.db"
+        database_utils._db_path = lambda: db_file
+        manager = LibraryManager()
+        start = time.perf_counter()
+        populate(series_count, chapters)
+        print(f"Built {series_count} series x {chapters} chapters in {time.perf_counter() - start:.1f}s")
+
+        drop_indexes()
+        manager._search_index = False # LIKE on the name, as before the full-text index
+        fresh_connection()
+        before = run(manager, series_count, per_call_connection=True)
+
+        restore_indexes()
+        manager._search_index = True
+        fresh_connection()
+        after = run(manager, series_count, per_call_connection=False)
+
+        print(f"  {'operation':28s} {'legacy ms':>10s} {'current ms':>11s}")
+        for name in before:
+            print(f"  {name:28s} {before[name]:10.1f} {after[name]:11.1f}")
+        measure_levels(manager)
+        measure_import(manager)
+        database_utils.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Measure the memory of a large chapter's page model.
+
+Builds the virtual paths of an archive chapter with N pages (default 5000), the
+way an archive listing returns them, then reports with tracemalloc what the page
+objects add on top of those paths: once with a plain Page holding a __dict__ and
+an empty translations dict per page (how pages used to be built), once with the
+current slotted Page from AltManager.group_images. Also reports the path strings
+themselves next to (interned archive, member) pairs, i.e. what splitting every
+virtual path would save.
+
+Usage: python benchmarks/bench_pages.py [pages] [archive_path_length]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.alt_manager import AltManager
+
+
+class LegacyPage:
+    def __init__(self, images, translations=None):
+        self.images = images
+        self.translations = translations if translations else {}
+        self.current_variant_index = 0
+        self.active_translation_lang = None
+        self.is_spread = False
+        self.is_spread_explicit = False
+
+
+def traced(build):
+    """(result, bytes allocated by build() that are still alive)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def virtual_paths(pages: int, archive_length: int) -> list:
+    folder = "/library/" + "x" * max(0, archive_length - len("/library/") - len("/chapter.cbz"))
+    archive = f"{folder}/chapter.cbz"
+    return [f"{archive}|images/{page:05d}.jpg" for page in range(pages)]
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    archive_length = int(sys.argv[2]) if len(sys.argv) > 2 else 80
+
+    paths, path_bytes = traced(lambda: virtual_paths(pages, archive_length))
+    print(f"One archive chapter, {pages} pages, archive path of {archive_length} chars")
+    print(f"  {'structure':36s} {'KB':>10s} {'bytes/page':>11s}")
+
+    def report(label, size):
+        print(f"  {label:36s} {size / 1024:10.1f} {size / pages:11.1f}")
+
+    report("virtual path strings", path_bytes)
+
+    def pairs():
+        archive = sys.intern(paths[0].split('|', 1)[0])
+        return [(archive, path.split('|', 1)[1]) for path in paths]
+    _, pair_bytes = traced(pairs)
+    report("(archive, member) pairs", pair_bytes)
+
+    _, legacy_bytes = traced(lambda: [LegacyPage([path]) for path in paths])
+    report("legacy pages (on top of paths)", legacy_bytes)
+    _, current_bytes = traced(lambda: AltManager.group_images(paths, {}))
+    report("current pages (on top of paths)", current_bytes)
+
+
+if __name__ == "__main__":
+    main()
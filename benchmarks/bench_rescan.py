@@ -0,0 +1,85 @@
+"""
+Benchmark library rescans on a synthetic folder tree.
+
+Creates N series folders (default 10000), each with a few chapter folders of small
+image files and a chapter archive, scans them once to fill the scan journal, then
+times rescanning every series from scratch (how rescans used to work), serially and
+on the per-device ScanPool, against a journal rescan with nothing changed and one
+with 1% of the series changed. The temporary folder's device decides the pool size.
+
+Usage: python benchmarks/bench_rescan.py [series] [chapters_per_series]
+"""
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import database_utils
+from src.core.library_scanner import LibraryScanner, ScanPool, FAST_DEVICE_SCANS, SLOW_DEVICE_SCANS
+from src.utils.io_scheduler import IOScheduler
+
+
+def build_tree(root: Path, series_count: int, chapters: int) -> list:
+    paths = []
+    for i in range(series_count):
+        series = root / f"Series {i:05d}"
+        for c in range(chapters):
+            chapter = series / f"Chapter {c}"
+            chapter.mkdir(parents=True)
+            for page in range(3):
+                (chapter / f"{page:03d}.jpg").write_bytes(b"\xff\xd8\xff")
+        with zipfile.ZipFile(series / f"Chapter {chapters}.cbz", "w") as zf:
+            zf.writestr("001.jpg", b"\xff\xd8\xff")
+        paths.append(str(series))
+    # Age everything past the journal's racy window, as on a library that sat on disk
+    past = time.time() - 3600
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+    return paths
+
+
+def timed(label: str, fn, paths: list) -> float:
+    start = time.perf_counter()
+    changed = sum(1 for path in paths if fn(path))
+    elapsed = time.perf_counter() - start
+    print(f"  {label:32s} {elapsed:8.2f} s {changed:8d} changed")
+    return elapsed
+
+
+def main():
+    series_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    chapters = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_utils._db_path = lambda: Path(tmp) / "library.db"
+        database_utils.create_tables()
+        scanner = LibraryScanner()
+        scanner.detect_format = lambda series_data: ["Manga"] # image sampling is not what is measured
+
+        start = time.perf_counter()
+        paths = build_tree(Path(tmp) / "library", series_count, chapters)
+        print(f"Built {series_count} series x {chapters + 1} chapters in {time.perf_counter() - start:.1f}s")
+
+        timed("full scan (fills journal)", lambda p: scanner.scan_series(p) is not None, paths)
+        timed("full rescan", lambda p: scanner.scan_series(p) is not None, paths)
+        workers = SLOW_DEVICE_SCANS if IOScheduler.instance().is_slow(tmp) else FAST_DEVICE_SCANS
+        start = time.perf_counter()
+        scanned = sum(1 for _, result, _ in ScanPool.instance().imap(scanner.scan_series, paths, lambda: False) if result)
+        print(f"  {f'full rescan, {workers} per device':32s} {time.perf_counter() - start:8.2f} s {scanned:8d} changed")
+        timed("journal rescan, no changes", lambda p: scanner.rescan_series(p)[2], paths)
+
+        for path in paths[::100]:
+            extra = Path(path) / f"Chapter {chapters + 1}"
+            extra.mkdir()
+            (extra / "001.jpg").write_bytes(b"\xff\xd8\xff")
+        timed("journal rescan, 1% changed", lambda p: scanner.rescan_series(p)[2], paths)
+        database_utils.close_all_connections()
+
+
+if __name__ == "__main__":
+    main()
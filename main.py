@@ -1,19 +1,6 @@
-import qdarktheme
 import sys
 import json
 import os
-from PyQt6.QtWidgets import QApplication, QMainWindow, QStackedWidget, QWidget
-from PyQt6.QtGui import QKeySequence, QShortcut, QIcon
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtNetwork import QLocalServer, QLocalSocket
-
-from src.ui.folder_grid import FolderGrid
-from src.ui.chapter_list import ChapterListView
-from src.utils.img_utils import get_chapter_number
-from src.utils.resource_utils import resource_path
-from pathlib import Path
-
-from src.ui.reader_view import ReaderView
 
 
 def register_context_menu():
@@ -47,279 +34,26 @@ def register_context_menu():
     except Exception as e:
         print(f"Failed to register context menu: {e}")
 
-from src.core.library_manager import LibraryManager
-
-_SERVER_NAME = "SUzip-instance"
-
-class MainWindow(QMainWindow):
-    def __init__(self, library_manager):
-        super().__init__()
-        self.setWindowTitle("SU.zip")
-        self.library_manager = library_manager
-        self.current_series_has_chapters = False
-        self.reader_view = None # Initialize reader_view attribute
-
-        self.stacked_widget = QStackedWidget()
-        self.setCentralWidget(self.stacked_widget)
-
-        self.folder_grid = FolderGrid(self.library_manager, self)
-        self.folder_grid.series_selected.connect(self.show_chapter_list)
-        self.folder_grid.recent_series_selected.connect(self.show_reader_for_recent)
-        self.stacked_widget.addWidget(self.folder_grid)
-
-        self._privacy_overlay = QWidget(self)
-        self._privacy_overlay.setStyleSheet("background: black;")
-        self._privacy_overlay.hide()
-        self._privacy_was_playing = False
-
-        # Global Escape key shortcut
-        self.escape_shortcut = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
-        self.escape_shortcut.activated.connect(self._handle_escape_key)
-
-        QShortcut(QKeySequence(Qt.Key.Key_QuoteLeft), self, activated=self._toggle_privacy_overlay)
-
-        # Global shortcuts for fullscreen toggle
-        self.fullscreen_shortcut_alt = QShortcut(QKeySequence("Alt+Return"), self)
-        self.fullscreen_shortcut_alt.activated.connect(self.toggle_fullscreen)
-        
-        self.fullscreen_shortcut_f11 = QShortcut(QKeySequence("F11"), self)
-        self.fullscreen_shortcut_f11.activated.connect(self.toggle_fullscreen)
-
-        self._local_server = QLocalServer(self)
-        QLocalServer.removeServer(_SERVER_NAME)
-        self._local_server.listen(_SERVER_NAME)
-        self._local_server.newConnection.connect(self._on_new_instance)
-
-    def _on_new_instance(self):
-        socket = self._local_server.nextPendingConnection()
-        socket.waitForReadyRead(1000)
-        data = socket.readAll().data()
-        socket.deleteLater()
-        try:
-            args = json.loads(data)
-            QTimer.singleShot(0, lambda: self._handle_args(args))
-        except Exception:
-            pass
-
-    def _handle_args(self, args):
-        self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized)
-        self.activateWindow()
-        self.raise_()
-        if len(args) >= 2 and args[0] == "--add-series" and os.path.isdir(args[1]):
-            self.folder_grid.add_single(args[1])
-        elif len(args) >= 1 and os.path.isdir(args[0]):
-            self.open_folder_in_reader(args[0])
-
-    def _handle_escape_key(self):
-        current_widget = self.stacked_widget.currentWidget()
-        
-        if hasattr(self, 'reader_view') and current_widget == self.reader_view:
-            self.reader_view.back_to_grid()
-        elif hasattr(self, 'chapter_list') and current_widget == self.chapter_list:
-            self.chapter_list.go_back()
-
-    def show_chapter_list(self, series):
-        self.current_series = series
-        
-        self.current_series_has_chapters = True
-        self.chapter_list = ChapterListView(series, self.library_manager, self)
-        self.chapter_list.back_to_library.connect(self.show_folder_grid)
-        self.chapter_list.open_reader.connect(self.show_reader_view)
-        self.chapter_list.tag_clicked.connect(self._on_tag_clicked)
-        self.stacked_widget.addWidget(self.chapter_list)
-        self.stacked_widget.setCurrentWidget(self.chapter_list)
-        # else:
-        #     self.current_series_has_chapters = False
-        #     self.show_reader_view(series, None)
-
-    def _on_tag_clicked(self, tag_type, tag_value):
-        self.folder_grid.apply_tag_filter(tag_type, tag_value)
-        self.show_folder_grid()
-
-    def show_reader_for_recent(self, series):
-        if series.get('_is_missing'):
-            from PyQt6.QtWidgets import QMessageBox
-            QMessageBox.warning(self, "Series Missing", f"The series '{series['name']}' is currently missing or inaccessible.\nPath: {series['path']}")
-            return
-
-        last_read_path = series.get('last_read_chapter')
-        if not last_read_path:
-            # If for some reason there is no last read chapter, fall back to chapter list
-            self.show_chapter_list(series)
-            return
-
-        target_chapter = None
-        for chapter in series.get('chapters', []):
-            if chapter['path'] == last_read_path:
-                target_chapter = chapter
-                break
-        
-        if target_chapter:
-            start_page = series.get('last_read_page', 0) or 0
-            self.show_reader_view(series, target_chapter, start_page=start_page)
-        else:
-            # Fallback if chapter not found
-            self.show_chapter_list(series)
-
-    def show_folder_grid(self):
-        self.folder_grid.load_recent_items()
-        self.stacked_widget.setCurrentWidget(self.folder_grid)
-
-    def show_reader_view(self, series, chapter, start_page=0):
-        self.current_series = series
-        if chapter:
-            self.current_series_has_chapters = True
-            # Save the last read chapter
-            self.library_manager.update_last_read_chapter(series['id'], chapter['path'], start_page)
-        else:
-            self.current_series_has_chapters = False
-
-        chapter_extras = {
-            ch['path']: list(ch.get('extra_paths') or [])
-            for ch in series.get('chapters', [])
-            if ch.get('extra_paths')
-        }
-
-        if chapter and chapter in series['chapters']:
-            chapter_files = [ch['path'] for ch in series['chapters']]
-            chapter_index = series['chapters'].index(chapter)
-            start_file = None # Start from the beginning of the chapter
-
-            # Get all images in the chapter
-            full_chapter_path_str = chapter['path']
-            is_virtual = '|' in full_chapter_path_str
-
-            full_chapter_path = Path(full_chapter_path_str)
-
-            if is_virtual or (full_chapter_path.is_file() and full_chapter_path.suffix.lower() in {'.zip', '.cbz'}):
-                images = []
-            else:
-                roots = [full_chapter_path] + [Path(p) for p in chapter_extras.get(full_chapter_path_str, [])]
-                images = []
-                for root in roots:
-                    try:
-                        images.extend(
-                            str(p) for p in root.iterdir()
-                            if p.is_file() and p.suffix.lower() in {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp', '.avif', '.mp4', '.webm', '.mkv', '.avi', '.mov'} and p.stem.lower() != 'cover'
-                        )
-                    except (NotADirectoryError, FileNotFoundError, OSError):
-                        continue
-                images = sorted(images, key=get_chapter_number)
-        else: # No chapters, it's a series of images
-            chapter_files = []
-            chapter_index = 0
-            start_file = None
-            full_series_path = Path(series['path'])
-            if full_series_path.is_file() and full_series_path.suffix.lower() in {'.zip', '.cbz'}:
-                images = []
-            else:
-                try:
-                    images = [str(p) for p in full_series_path.iterdir() if p.is_file() and p.suffix.lower() in {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp', '.avif', '.mp4', '.webm', '.mkv', '.avi', '.mov'} and p.stem.lower() != 'cover']
-                    images = sorted(images, key=get_chapter_number)
-                except (NotADirectoryError, FileNotFoundError):
-                    images = []
-
-        self.reader_view = ReaderView(series, chapter_files, chapter_index, start_file=start_file, images=images, start_page=start_page, chapter_extras=chapter_extras)
-        self.reader_view.back_pressed.connect(self.handle_reader_back)
-        self.reader_view.request_fullscreen_toggle.connect(self.toggle_fullscreen)
-        self.reader_view.current_chapter_changed.connect(self.on_reader_chapter_changed)
-        self.reader_view.hide_chapter_requested.connect(self.on_reader_hide_chapter)
-        self.stacked_widget.addWidget(self.reader_view)
-        self.stacked_widget.setCurrentWidget(self.reader_view)
-
-    def on_reader_hide_chapter(self, series, chapter_dict):
-        series_path = str(series['path'])
-        self.library_manager.hide_chapter(series_path, chapter_dict)
-        # Keep current_series chapters in sync so the chapter list stays correct
-        if chapter_dict in self.current_series.get('chapters', []):
-            self.current_series['chapters'].remove(chapter_dict)
-
-    def on_reader_chapter_changed(self, series, chapter_path):
-        if series and chapter_path:
-            self.library_manager.update_last_read_chapter(series['id'], chapter_path, 0)
-
-    def handle_reader_back(self):
-        if hasattr(self, 'reader_view') and self.reader_view:
-            model = self.reader_view.model
-            chapter = model.manga_dir
-            chapter_path = chapter.get('path') if isinstance(chapter, dict) else str(chapter) if chapter else None
-            if chapter_path and self.current_series and getattr(model, 'images', []):
-                page = getattr(model, 'current_index', 0)
-                images = model.images
-                image_path = images[page].images[0] if page < len(images) else None
-                self.library_manager.update_last_read_chapter(self.current_series['id'], chapter_path, page, image_path)
-
-        if self.current_series_has_chapters:
-            if not hasattr(self, 'chapter_list') or self.chapter_list.series != self.current_series:
-                self.show_chapter_list(self.current_series)
-            else:
-                self.stacked_widget.setCurrentWidget(self.chapter_list)
-        else:
-            self.show_folder_grid()
-
-    def open_folder_in_reader(self, folder_path):
-        path = Path(folder_path)
-        if not path.is_dir():
-            return
-        chapter = str(path)
-        series = {
-            'id': None,
-            'name': path.name,
-            'path': str(path),
-            'chapters': [chapter],
-            'cover_image': None,
-            'last_read_chapter': None,
-            'last_read_page': 0,
-        }
-        self.current_series = series
-        self.current_series_has_chapters = False  # back goes to folder grid, not chapter list
-        self.reader_view = ReaderView(series, [chapter], 0)
-        self.reader_view.back_pressed.connect(self.handle_reader_back)
-        self.reader_view.request_fullscreen_toggle.connect(self.toggle_fullscreen)
-        self.reader_view.current_chapter_changed.connect(self.on_reader_chapter_changed)
-        self.reader_view.hide_chapter_requested.connect(self.on_reader_hide_chapter)
-        self.stacked_widget.addWidget(self.reader_view)
-        self.stacked_widget.setCurrentWidget(self.reader_view)
-
-    def resizeEvent(self, ev):
-        super().resizeEvent(ev)
-        if self._privacy_overlay.isVisible():
-            self._privacy_overlay.setGeometry(self.rect())
-
-    def _toggle_privacy_overlay(self):
-        if self._privacy_overlay.isVisible():
-            self._privacy_overlay.hide()
-        else:
-            player = self._get_media_player()
-            from PyQt6.QtMultimedia import QMediaPlayer
-            self._privacy_was_playing = (
-                player is not None and
-                player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
-            )
-            if self._privacy_was_playing:
-                player.pause()
-            self._privacy_overlay.setGeometry(self.rect())
-            self._privacy_overlay.show()
-            self._privacy_overlay.raise_()
-
-    def _get_media_player(self):
-        rv = getattr(self, 'reader_view', None)
-        if rv and hasattr(rv, 'video_viewer'):
-            return rv.video_viewer.media_player
-        return None
-
-    def toggle_fullscreen(self):
-        if self.isFullScreen():
-            self.showNormal()
-        else:
-            self.showFullScreen()
 
 if __name__ == "__main__":
     import multiprocessing
     multiprocessing.freeze_support()
 
+    # UI imports live here, not at module level: decode worker processes are spawned
+    # and re-import this module, and should only load what decode_process needs
+    import qdarktheme
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtGui import QIcon
+    from PyQt6.QtNetwork import QLocalSocket
+
+    from src.core.library_manager import LibraryManager
+    from src.ui.main_window import MainWindow, SERVER_NAME
+    from src.utils.resource_utils import resource_path
+
     try:
         import PyQt6.QtWebEngineWidgets  # must be imported before QApplication
+        from src.ui.viewer.archive_scheme import register_archive_scheme
+        register_archive_scheme()
     except Exception:
         pass
 
@@ -352,7 +86,7 @@ if __name__ == "__main__":
     # Single-instance check — forward args to running instance and exit
     if len(sys.argv) > 1:
         socket = QLocalSocket()
-        socket.connectToServer(_SERVER_NAME)
+        socket.connectToServer(SERVER_NAME)
         if socket.waitForConnected(500):
             socket.write(json.dumps(sys.argv[1:]).encode())
             socket.waitForBytesWritten(1000)
@@ -364,6 +98,28 @@ if __name__ == "__main__":
     except AttributeError:
         app.setStyleSheet(qdarktheme.load_stylesheet("dark"))
     
+    # Decoded-image memory budget; sheds evictable caches when the system runs low
+    from src.utils.memory_budget import MemoryBudget
+    MemoryBudget.instance().start_pressure_monitor()
+
+    # Pick image decoders per format; benchmark them in the background on first run
+    from src.utils.decoders import DecoderRegistry
+    if not DecoderRegistry.instance().load_benchmark():
+        from src.core.task_scheduler import TaskScheduler, TaskPriority
+        from src.workers.decoder_benchmark_worker import DecoderBenchmarkWorker
+        TaskScheduler.instance().start(DecoderBenchmarkWorker(), TaskPriority.BACKGROUND)
+
+    # Optional decoder processes, isolating crashes in image codecs from the reader
+    from src.core.decode_pool import DecodePool
+    decode_pool = DecodePool.instance()
+    if decode_pool.enabled:
+        DecoderRegistry.instance().process_pool = decode_pool
+        app.aboutToQuit.connect(decode_pool.shutdown)
+
+    # Library connections stay open per thread; close them (and PRAGMA optimize) on quit
+    from src.utils.database_utils import close_all_connections
+    app.aboutToQuit.connect(close_all_connections)
+
     # Start LLM Server
     from src.core.llm_server import LLMServerManager
     llm_manager = LLMServerManager.instance()
@@ -6,6 +6,7 @@ from typing import Dict, List, Union
 
 from src.data.page import Page
 from src.utils.archive_utils import split_virtual_path
+from src.utils import fs_cache
 class AltManager:
     INFO_FILE_NAME = "info.json"
     _file_lock = threading.Lock()
@@ -21,7 +22,7 @@ class AltManager:
         processed_files = set() # Stores filenames that have been processed or are subsidiary
 
         # Map filenames to full paths for easy lookup
-        path_map = {Path(p).name: p for p in image_paths}
+        path_map = {os.path.basename(p): p for p in image_paths}
 
         for main_file_name, entry in alt_config.items():
             # Skip sentinel/internal keys
@@ -50,17 +51,20 @@ class AltManager:
                              processed_files.add(trans_base)
 
         for path in image_paths:
-            name = Path(path).name
+            name = os.path.basename(path)
             
-            if '|' in path:
-                _, internal_path = split_virtual_path(path)
-                internal_parts = [p.lower() for p in Path(internal_path).parts]
-                if 'alts' in internal_parts or 'translations' in internal_parts:
-                    continue
-            else:
-                parts = [p.lower() for p in Path(path).parts]
-                if 'alts' in parts or 'translations' in parts:
-                    continue
+            # Cheap substring test first; only candidates pay for splitting into parts
+            lowered = path.lower()
+            if 'alts' in lowered or 'translations' in lowered:
+                if '|' in path:
+                    _, internal_path = split_virtual_path(path)
+                    internal_parts = [p.lower() for p in Path(internal_path).parts]
+                    if 'alts' in internal_parts or 'translations' in internal_parts:
+                        continue
+                else:
+                    parts = [p.lower() for p in Path(path).parts]
+                    if 'alts' in parts or 'translations' in parts:
+                        continue
                 
             if name in processed_files:
                 continue
@@ -92,7 +96,7 @@ class AltManager:
                             resolved_alt = None
 
                             # Check if alt_name itself is a resolvable relative path (common in new structure)
-                            if (main_dir / alt_name).exists():
+                            if fs_cache.exists(main_dir / alt_name):
                                 resolved_alt = str(main_dir / alt_name)
                             elif alt_base in path_map:
                                 resolved_alt = path_map[alt_base]
@@ -100,7 +104,7 @@ class AltManager:
                             if not resolved_alt:
                                 # Fallback: Check 'alts' folder
                                 alt_path_check = main_dir / "alts" / alt_base
-                                if alt_path_check.exists():
+                                if fs_cache.exists(alt_path_check):
                                     resolved_alt = str(alt_path_check)
 
                             if not resolved_alt:
@@ -111,7 +115,7 @@ class AltManager:
                             fix_rel = alts_fix_map.get(alt_name)
                             if fix_rel:
                                 fix_full = main_dir / fix_rel
-                                if fix_full.exists():
+                                if fs_cache.exists(fix_full):
                                     found_alts.append(str(fix_full))
                                     processed_files.add(Path(fix_full).name)
                                     processed_files.add(alt_base) # Mark original as processed too
@@ -128,10 +132,10 @@ class AltManager:
                             trans_base = Path(trans_file).name
                             
                             # Try relative resolution first
-                            if (main_dir / trans_file).exists():
+                            if fs_cache.exists(main_dir / trans_file):
                                 translations[lang_key] = str(main_dir / trans_file)
                                 processed_files.add(trans_base)
-                            elif (main_dir / "translations" / lang_key / trans_base).exists():
+                            elif fs_cache.exists(main_dir / "translations" / lang_key / trans_base):
                                 translations[lang_key] = str(main_dir / "translations" / lang_key / trans_base)
                                 processed_files.add(trans_base)
                             elif trans_base in path_map:
@@ -179,7 +183,7 @@ class AltManager:
         path_str = str(info_path)
         
         try:
-            mtime = os.path.getmtime(path_str)
+            mtime = fs_cache.getmtime(path_str)
         except OSError:
             return {}
 
@@ -207,6 +211,7 @@ class AltManager:
             try:
                 with open(info_path, 'w', encoding='utf-8') as f:
                     json.dump(data, f, indent=2, ensure_ascii=False)
+                fs_cache.forget(info_path)
             except OSError as e:
                 print(f"Error saving info.json: {e}")
 
@@ -482,12 +487,20 @@ class AltManager:
         AltManager.save_alts(series_path, data)
 
     @staticmethod
-    def save_spread_states(series_path: str, chapter_name: str, updates: Dict[str, bool]):
+    def get_spreads_detected(series_path: str, chapter_name: str) -> bool:
+        """True once automatic spread detection has measured every page of the chapter."""
+        data = AltManager.load_alts(series_path)
+        meta = data.get(chapter_name, {}).get('__meta__', {})
+        return meta.get('spreads_detected', False)
+
+    @staticmethod
+    def save_spread_states(series_path: str, chapter_name: str, updates: Dict[str, bool], mark_detected: bool = False):
         """
         Batch update the is_spread flag for multiple pages.
         updates: Dict mapping main_file_name -> is_spread (bool)
+        mark_detected: also record that the whole chapter has been measured.
         """
-        if not updates:
+        if not updates and not mark_detected:
             return
 
         data = AltManager.load_alts(series_path)
@@ -495,6 +508,12 @@ class AltManager:
             data[chapter_name] = {}
             
         changed = False
+        if mark_detected:
+            meta = data[chapter_name].setdefault('__meta__', {})
+            if not meta.get('spreads_detected'):
+                meta['spreads_detected'] = True
+                changed = True
+
         for main_file, is_spread in updates.items():
             main_name = Path(main_file).name
             
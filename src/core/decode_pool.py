@@ -0,0 +1,214 @@
+import multiprocessing
+import os
+import queue
+import threading
+from multiprocessing import shared_memory
+
+from PyQt6 import sip
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage
+
+import src.utils.app_settings as app_settings
+from src.core.decode_process import worker_main
+from src.utils.img_utils import to_display_format
+
+REQUEST_TIMEOUT_S = 30
+INITIAL_ARENA_BYTES = 16 * 1024 * 1024
+
+_QT_FORMATS = {
+    'RGBA': QImage.Format.Format_RGBA8888,
+    'RGBX': QImage.Format.Format_RGBX8888,
+}
+
+
+def default_decode_processes() -> int:
+    """Processes to use when the pool is switched on: half the cores, 2..4."""
+    return max(2, min((os.cpu_count() or 4) // 2, 4))
+
+
+class DecodeProcessCrashed(Exception):
+    pass
+
+
+class _DecodeProcess:
+    """One worker process with its pipe and the shared-memory arena its pixels come back in."""
+    def __init__(self, ctx):
+        self.ctx = ctx
+        self.process = None
+        self.conn = None
+        self.arena = None
+        self._arena_sent = False
+
+    def start(self):
+        parent_conn, child_conn = self.ctx.Pipe()
+        self.process = self.ctx.Process(target=worker_main, args=(child_conn,), name="decode-worker", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self._arena_sent = False
+
+    def restart(self):
+        self.stop(timeout=0)
+        self.start()
+
+    def stop(self, timeout: float = 1.0):
+        if self.conn is not None:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self.conn.close()
+            self.conn = None
+        if self.process is not None:
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+            self.process = None
+
+    def free_arena(self):
+        if self.arena is not None:
+            self.arena.close()
+            try:
+                self.arena.unlink()
+            except FileNotFoundError:
+                pass
+            self.arena = None
+
+    def ensure_arena(self, nbytes: int):
+        if self.arena is None or self.arena.size < nbytes:
+            self.free_arena()
+            self.arena = shared_memory.SharedMemory(create=True, size=max(nbytes, INITIAL_ARENA_BYTES))
+            self._arena_sent = False
+        if not self._arena_sent:
+            self.conn.send(("arena", self.arena.name))
+            self._arena_sent = True
+
+    def request(self, msg) -> tuple:
+        """Send one request and wait for its reply, growing the arena on demand."""
+        try:
+            self.ensure_arena(0)
+            self.conn.send(msg)
+            while True:
+                if not self.conn.poll(REQUEST_TIMEOUT_S):
+                    raise DecodeProcessCrashed(f"no reply in {REQUEST_TIMEOUT_S}s")
+                reply = self.conn.recv()
+                if reply[0] != "grow":
+                    return reply
+                self.ensure_arena(reply[1])
+        except (EOFError, OSError, ValueError) as e:
+            raise DecodeProcessCrashed(str(e) or type(e).__name__)
+
+    def image_from_arena(self, width: int, height: int, mode: str) -> QImage:
+        # Wrap the arena without copying; the display-format conversion copies the
+        # pixels out before the arena is reused by the next request.
+        view = QImage(sip.voidptr(self.arena.buf), width, height, width * 4, _QT_FORMATS[mode])
+        return to_display_format(view)
+
+
+class DecodePool:
+    """Optional pool of worker processes for decoding and high-quality scaling.
+
+    Pillow decoding, LANCZOS resizing and UnsharpMask run in separate processes, so
+    they neither hold the GIL against the GUI thread nor take the reader down when a
+    corrupt file crashes the decoder; the crashed worker is restarted and the file
+    reported as undecodable. Enabled by the "decode_processes" setting (0 = off).
+    Methods block the calling worker thread and return None when the caller should
+    fall back to decoding in-thread.
+    """
+    _instance = None
+
+    def __init__(self):
+        self.size = max(0, int(app_settings.get("decode_processes", 0) or 0))
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        self._shut_down = False
+        self.crashes = 0
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = DecodePool()
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0 and not self._shut_down
+
+    def _ensure_started(self) -> bool:
+        with self._lock:
+            if self._shut_down:
+                return False
+            if not self._workers:
+                ctx = multiprocessing.get_context('spawn')
+                for _ in range(self.size):
+                    worker = _DecodeProcess(ctx)
+                    try:
+                        worker.start()
+                    except Exception as e:
+                        print(f"DecodePool: cannot start worker process: {e}")
+                        self.size = 0
+                        return False
+                    self._workers.append(worker)
+                    self._idle.put(worker)
+        return True
+
+    def _run(self, msg, describe: str, prepare=None) -> QImage | None:
+        if not self.enabled or not self._ensure_started():
+            return None
+        worker = self._idle.get()
+        try:
+            if worker.process is None:
+                return None # Shut down while we waited
+            if prepare is not None:
+                prepare(worker)
+            reply = worker.request(msg)
+            if reply[0] == "ok":
+                return worker.image_from_arena(*reply[1:])
+            return None # Pillow cannot read it; let the in-thread decoders try
+        except (DecodeProcessCrashed, EOFError, OSError) as e:
+            self.crashes += 1
+            print(f"DecodePool: worker died on {describe} ({e}); restarting it")
+            if not self._shut_down:
+                worker.restart()
+            return QImage()
+        finally:
+            self._idle.put(worker)
+
+    def decode(self, source, size: QSize = None) -> QImage | None:
+        """Decode a file path or bytes, scaled to size if given."""
+        target = (size.width(), size.height()) if size is not None and size.isValid() else None
+        if isinstance(source, (bytes, bytearray)):
+            source = bytes(source)
+            describe = f"{len(source)} bytes of image data"
+        else:
+            source = str(source)
+            describe = source
+        return self._run(("decode", source, target), describe)
+
+    def scale(self, image: QImage, target_width: int, sharpen: bool = True) -> QImage | None:
+        """LANCZOS-scale image to target_width (keeping its aspect), then unsharp-mask it."""
+        if image.isNull() or target_width <= 0:
+            return None
+        fmt = QImage.Format.Format_RGBA8888 if image.hasAlphaChannel() else QImage.Format.Format_RGBX8888
+        src = image.convertToFormat(fmt)
+        nbytes = src.width() * src.height() * 4
+
+        def prepare(worker):
+            worker.ensure_arena(nbytes)
+            ptr = src.constBits()
+            ptr.setsize(nbytes)
+            worker.arena.buf[:nbytes] = ptr
+
+        mode = 'RGBA' if fmt == QImage.Format.Format_RGBA8888 else 'RGBX'
+        msg = ("scale", src.width(), src.height(), mode, target_width, sharpen)
+        return self._run(msg, f"a {src.width()}x{src.height()} scale", prepare)
+
+    def shutdown(self):
+        with self._lock:
+            self._shut_down = True
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+            worker.free_arena()
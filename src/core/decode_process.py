@@ -0,0 +1,118 @@
+"""Entry point of the decode pool's worker processes.
+
+Kept free of Qt imports, and main.py keeps its UI imports under its __main__
+guard, so a spawned worker only loads Pillow. Pixels travel
+through a shared-memory arena owned by the parent; the pipe carries only small
+control messages and, for in-memory sources, the encoded bytes.
+"""
+import io
+from multiprocessing import shared_memory
+
+from PIL import Image, ImageFilter
+
+try:
+    import pillow_avif  # noqa: F401 - registers the AVIF plugin with Pillow
+except ImportError:
+    pass
+
+
+def attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a segment the parent owns, without this process unlinking it on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False) # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        return shm
+
+
+# EXIF orientation -> the transpose that displays the image upright (as ImageOps.exif_transpose)
+ORIENTATION_TRANSPOSE = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+
+def apply_orientation(img, orientation: int):
+    method = ORIENTATION_TRANSPOSE.get(orientation)
+    return img.transpose(method) if method is not None else img
+
+
+def _decode(source, target):
+    # target is in stored (pre-rotation) pixels, as probe() reports them and as
+    # QImageReader.setScaledSize takes them; the image is scaled, then rotated
+    img = Image.open(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source)
+    orientation = img.getexif().get(0x0112, 1)
+    if target and img.format == 'JPEG':
+        img.draft('RGB', tuple(target))
+    img = img.convert('RGBA' if 'A' in img.getbands() or img.mode == 'P' else 'RGBX')
+    if target and img.size != tuple(target):
+        img = img.resize(tuple(target), Image.Resampling.LANCZOS)
+    return apply_orientation(img, orientation)
+
+
+def _scale(arena, width, height, mode, target_width, sharpen):
+    nbytes = width * height * 4
+    img = Image.frombytes(mode, (width, height), bytes(arena.buf[:nbytes]))
+    target_height = max(1, int(height * target_width / width))
+    img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+    if sharpen:
+        img = img.filter(ImageFilter.UnsharpMask(radius=0.8, percent=80, threshold=3))
+    return img
+
+
+def worker_main(conn):
+    """Serve requests until the parent sends None or closes the pipe.
+
+    Requests: ("decode", source, target_size_or_None) and
+    ("scale", width, height, mode, target_width, sharpen), each preceded by the
+    arena to use as ("arena", name, size). Replies: ("ok", width, height, mode),
+    ("grow", nbytes) when the arena is too small, or ("error", message).
+    """
+    arena = None
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        if msg is None:
+            break
+        if msg[0] == "arena":
+            if arena is not None:
+                arena.close()
+            arena = attach_shared_memory(msg[1])
+            continue
+
+        try:
+            if msg[0] == "decode":
+                img = _decode(msg[1], msg[2])
+            elif msg[0] == "scale":
+                img = _scale(arena, *msg[1:])
+            else:
+                conn.send(("error", f"unknown request {msg[0]}"))
+                continue
+            data = img.tobytes('raw', img.mode)
+            if arena is None or len(data) > arena.size:
+                conn.send(("grow", len(data)))
+                reply = conn.recv()
+                if reply is None or reply[0] != "arena":
+                    break
+                if arena is not None:
+                    arena.close()
+                arena = attach_shared_memory(reply[1])
+            arena.buf[:len(data)] = data
+            conn.send(("ok", img.width, img.height, img.mode))
+        except Exception as e:
+            conn.send(("error", str(e)))
+
+    if arena is not None:
+        arena.close()
@@ -0,0 +1,102 @@
+import threading
+from bisect import bisect_left
+
+from src.utils.database_utils import TAG_TABLES, db_cursor
+
+
+class FacetIndex:
+    """In-memory view of the tag vocabulary, shared by every LibraryManager.
+
+    Holds each tag's names with their series counts (materialized in the tag tables),
+    sorted for prefix lookup, to serve the tag completers and group view counts. The
+    series ids behind each tag are loaded on first use by a tag filter, after which
+    filtering by several tags is set arithmetic instead of junction-table subqueries.
+    invalidate() after changing tags; everything reloads lazily on next use.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tags = None # tag -> {'names': [...], 'keys': [lowercase names], 'counts': {name: n}}
+        self._series = None # tag -> {name: frozenset of series ids}
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = FacetIndex()
+        return cls._instance
+
+    def invalidate(self):
+        with self._lock:
+            self._tags = None
+            self._series = None
+
+    def _vocabulary(self):
+        with self._lock:
+            if self._tags is None:
+                tags = {}
+                with db_cursor() as (_, cursor):
+                    for tag, _, _ in TAG_TABLES:
+                        cursor.execute(f"SELECT name, series_count FROM {tag}")
+                        rows = sorted(cursor.fetchall(), key=lambda row: (row['name'].lower(), row['name']))
+                        tags[tag] = {
+                            'names': [row['name'] for row in rows],
+                            'keys': [row['name'].lower() for row in rows],
+                            'counts': {row['name']: row['series_count'] for row in rows},
+                        }
+                self._tags = tags
+            return self._tags
+
+    def _postings(self):
+        with self._lock:
+            if self._series is None:
+                series = {}
+                with db_cursor() as (_, cursor):
+                    for tag, junction, fk in TAG_TABLES:
+                        postings = {}
+                        cursor.execute(f"SELECT t.name, j.series_id FROM {tag} t JOIN {junction} j ON t.id = j.{fk}")
+                        for row in cursor.fetchall():
+                            postings.setdefault(row['name'], set()).add(row['series_id'])
+                        series[tag] = {name: frozenset(ids) for name, ids in postings.items()}
+                self._series = series
+            return self._series
+
+    def names(self, tag: str) -> list:
+        return list(self._vocabulary()[tag]['names'])
+
+    def complete(self, tag: str, text: str) -> list:
+        """Names starting with text, then the other names containing it, case-insensitively."""
+        vocabulary = self._vocabulary()[tag]
+        names, keys = vocabulary['names'], vocabulary['keys']
+        text = text.lower()
+        start = bisect_left(keys, text)
+        end = start
+        while end < len(keys) and keys[end].startswith(text):
+            end += 1
+        prefixed = names[start:end]
+        if not text:
+            return prefixed
+        return prefixed + [name for i, name in enumerate(names) if (i < start or i >= end) and text in keys[i]]
+
+    def counts(self, tag: str) -> list:
+        """[{'name', 'count'}] for the tag's names in use, by name."""
+        vocabulary = self._vocabulary()[tag]
+        counts = vocabulary['counts']
+        return [{'name': name, 'count': counts[name]} for name in vocabulary['names'] if counts[name] > 0]
+
+    def series_ids(self, filters: dict):
+        """Ids of series having any of the listed names for every filtered tag, or None if unfiltered."""
+        if not any(filters.values()):
+            return None
+        postings = self._postings()
+        result = None
+        for tag, values in filters.items():
+            if not values or tag not in postings:
+                continue
+            matched = set()
+            for value in values:
+                matched |= postings[tag].get(value, frozenset())
+            result = matched if result is None else result & matched
+            if not result:
+                return set()
+        return result
@@ -2,8 +2,10 @@ import os
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable
 from PyQt6.QtGui import QPixmap, QImage
-from src.utils.img_utils import is_image_folder, load_thumbnail_from_path, load_thumbnail_from_zip, load_thumbnail_from_virtual_path, get_chapter_number, is_image_monotone
+from src.utils.img_utils import is_image_folder, load_thumbnail_from_path, load_thumbnail_from_zip, load_thumbnail_from_virtual_path, get_chapter_number, is_image_monotone, to_display_format
 from src.utils.archive_utils import ARCHIVE_EXTS
+from src.utils import fs_cache
+from src.core import scan_journal
 
 class ItemLoaderSignals(QObject):
     item_loaded = pyqtSignal(QImage, object, int, int, str)  # qimg, path, idx, gen, item_type
@@ -59,119 +61,135 @@ class ItemLoader(QRunnable):
                 drive_status[drive] = False
                 return False
 
-        for idx, item in enumerate(self.items):
-            if self._is_aborted:
-                return
-            item_type = ''
-            qimg = None
-
-            try:
-                if self.item_type == 'series':
-                    item_type = 'series'
-                    path_str = item.get('path')
+        journal_statuses = None
+
+        def missing_status(path_str):
+            """Status shown for an unreachable series: offline if its drive is not ready, else what the last rescan found."""
+            nonlocal journal_statuses
+            if not path_str or not is_drive_ready(path_str):
+                return scan_journal.OFFLINE
+            if journal_statuses is None:
+                journal_statuses = scan_journal.statuses()
+            return journal_statuses.get(path_str, scan_journal.MISSING)
+
+        # Existence checks, folder listings and thumbnail cache keys of the batch share one stat cache
+        with fs_cache.stat_cache():
+            for idx, item in enumerate(self.items):
+                if self._is_aborted:
+                    return
+                item_type = ''
+                qimg = None
+
+                try:
+                    if self.item_type == 'series':
+                        item_type = 'series'
+                        path_str = item.get('path')
                     
-                    if not path_str or not is_drive_ready(path_str):
-                        item['_is_missing'] = True
-                    else:
-                        series_path = Path(path_str)
-                        if not series_path.exists():
+                        if not path_str or not is_drive_ready(path_str):
                             item['_is_missing'] = True
-                        elif series_path.is_file() and not series_path.suffix.lower() in {'.zip', '.cbz', '.7z', '.rar', '.cbr', '.cb7'}:
-                            item['_is_missing'] = True
-
-                    if not item.get('_is_missing'):
-                        cover_image = item.get('cover_image')
-                        if cover_image:
-                            if '|' in cover_image:
-                                qimg = load_thumbnail_from_virtual_path(cover_image, self.thumb_width, self.thumb_height)
-                            elif is_drive_ready(cover_image):
-                                qimg = load_thumbnail_from_path(cover_image, self.thumb_width, self.thumb_height)
+                        else:
+                            series_path = Path(path_str)
+                            if not fs_cache.exists(series_path):
+                                item['_is_missing'] = True
+                            elif fs_cache.is_file(series_path) and not series_path.suffix.lower() in {'.zip', '.cbz', '.7z', '.rar', '.cbr', '.cb7'}:
+                                item['_is_missing'] = True
+
+                        if item.get('_is_missing'):
+                            item['_missing_status'] = missing_status(path_str)
+                        else:
+                            cover_image = item.get('cover_image')
+                            if cover_image:
+                                if '|' in cover_image:
+                                    qimg = load_thumbnail_from_virtual_path(cover_image, self.thumb_width, self.thumb_height)
+                                elif is_drive_ready(cover_image):
+                                    qimg = load_thumbnail_from_path(cover_image, self.thumb_width, self.thumb_height)
                 
-                elif self.item_type == 'page':
-                    item_type = 'page'
-                    thumbnail_path = item.get('image_path')
-                    series = item.get('_series', {})
-                    series_path_str = series.get('path') if series else None
+                    elif self.item_type == 'page':
+                        item_type = 'page'
+                        thumbnail_path = item.get('image_path')
+                        series = item.get('_series', {})
+                        series_path_str = series.get('path') if series else None
                     
-                    # 1. Check if series path exists (if available)
-                    if series_path_str:
-                        if not is_drive_ready(series_path_str) or not os.path.exists(series_path_str):
-                            item['_is_missing'] = True
+                        # 1. Check if series path exists (if available)
+                        if series_path_str:
+                            if not is_drive_ready(series_path_str) or not fs_cache.exists(series_path_str):
+                                item['_is_missing'] = True
+                                item['_missing_status'] = missing_status(series_path_str)
                     
-                    # 2. Check thumbnail existence
-                    if not item.get('_is_missing') and thumbnail_path:
-                        if '|' in thumbnail_path:
-                            qimg = load_thumbnail_from_virtual_path(thumbnail_path, self.thumb_width, self.thumb_height)
-                        elif is_drive_ready(thumbnail_path) and os.path.exists(thumbnail_path):
-                            qimg = load_thumbnail_from_path(thumbnail_path, self.thumb_width, self.thumb_height)
-                        else:
-                             item['_is_missing'] = True
-
-                elif self.item_type == 'chapter':
-                    item_type = 'chapter'
-                    thumbnail_path = item.get('cover_path')
+                        # 2. Check thumbnail existence
+                        if not item.get('_is_missing') and thumbnail_path:
+                            if '|' in thumbnail_path:
+                                qimg = load_thumbnail_from_virtual_path(thumbnail_path, self.thumb_width, self.thumb_height)
+                            elif is_drive_ready(thumbnail_path) and fs_cache.exists(thumbnail_path):
+                                qimg = load_thumbnail_from_path(thumbnail_path, self.thumb_width, self.thumb_height)
+                            else:
+                                 item['_is_missing'] = True
+
+                    elif self.item_type == 'chapter':
+                        item_type = 'chapter'
+                        thumbnail_path = item.get('cover_path')
                     
-                    if not thumbnail_path:
-                        # discovery might be slow, so check drive
-                        if is_drive_ready(item.get('path')):
-                             thumbnail_path = _get_first_media_path(item)
+                        if not thumbnail_path:
+                            # discovery might be slow, so check drive
+                            if is_drive_ready(item.get('path')):
+                                 thumbnail_path = _get_first_media_path(item)
                     
-                    if thumbnail_path:
-                        if '|' in thumbnail_path:
-                            qimg = load_thumbnail_from_virtual_path(thumbnail_path, self.thumb_width, self.thumb_height)
-                        elif is_drive_ready(thumbnail_path) and os.path.exists(thumbnail_path):
-                            qimg = load_thumbnail_from_path(thumbnail_path, self.thumb_width, self.thumb_height)
+                        if thumbnail_path:
+                            if '|' in thumbnail_path:
+                                qimg = load_thumbnail_from_virtual_path(thumbnail_path, self.thumb_width, self.thumb_height)
+                            elif is_drive_ready(thumbnail_path) and fs_cache.exists(thumbnail_path):
+                                qimg = load_thumbnail_from_path(thumbnail_path, self.thumb_width, self.thumb_height)
+                            else:
+                                item['_is_missing'] = True
+                        
+                            if qimg and not qimg.isNull():
+                                if self.library_manager and 'id' in item:
+                                    self.library_manager.set_chapter_cover_path(item['id'], thumbnail_path)
+                                item['cover_path'] = thumbnail_path
                         else:
                             item['_is_missing'] = True
-                        
-                        if qimg and not qimg.isNull():
-                            if self.library_manager and 'id' in item:
-                                self.library_manager.set_chapter_cover_path(item['id'], thumbnail_path)
-                            item['cover_path'] = thumbnail_path
-                    else:
-                        item['_is_missing'] = True
-
-                else: # Generic file/folder loader
-                    path_str = str(item)
-                    if not is_drive_ready(path_str):
-                        self.signals.item_invalid.emit(idx, self.generation)
-                        continue
-
-                    crop = None
-                    if path_str.endswith("_left"):
-                        path_str = path_str[:-5]
-                        crop = "left"
-                    elif path_str.endswith("_right"):
-                        path_str = path_str[:-6]
-                        crop = "right"
-
-                    media_path = _get_first_media_path(path_str)
-                    if media_path:
-                        if '|' in media_path:
-                            item_type = 'archive' if Path(media_path.split('|')[0]).suffix.lower() in ARCHIVE_EXTS else 'image'
-                            qimg = load_thumbnail_from_virtual_path(media_path, self.thumb_width, self.thumb_height, crop)
-                        elif Path(media_path).is_dir():
-                            item_type = 'folder'
-                            qimg = None 
+
+                    else: # Generic file/folder loader
+                        path_str = str(item)
+                        if not is_drive_ready(path_str):
+                            self.signals.item_invalid.emit(idx, self.generation)
+                            continue
+
+                        crop = None
+                        if path_str.endswith("_left"):
+                            path_str = path_str[:-5]
+                            crop = "left"
+                        elif path_str.endswith("_right"):
+                            path_str = path_str[:-6]
+                            crop = "right"
+
+                        media_path = _get_first_media_path(path_str)
+                        if media_path:
+                            if '|' in media_path:
+                                item_type = 'archive' if Path(media_path.split('|')[0]).suffix.lower() in ARCHIVE_EXTS else 'image'
+                                qimg = load_thumbnail_from_virtual_path(media_path, self.thumb_width, self.thumb_height, crop)
+                            elif fs_cache.is_dir(media_path):
+                                item_type = 'folder'
+                                qimg = None 
+                            else:
+                                item_type = 'image'
+                                qimg = load_thumbnail_from_path(media_path, self.thumb_width, self.thumb_height, crop)
                         else:
-                            item_type = 'image'
-                            qimg = load_thumbnail_from_path(media_path, self.thumb_width, self.thumb_height, crop)
-                    else:
-                        self.signals.item_invalid.emit(idx, self.generation)
-                        continue
-
-                # Fallback to placeholder if missing or failed
-                if item.get('_is_missing') or not qimg or qimg.isNull():
-                    from src.utils.img_utils import empty_placeholder_qimage
-                    qimg = empty_placeholder_qimage(self.thumb_width, self.thumb_height)
-
-                self.signals.item_loaded.emit(qimg, item, idx, self.generation, item_type)
+                            self.signals.item_invalid.emit(idx, self.generation)
+                            continue
+
+                    # Fallback to placeholder if missing or failed
+                    if item.get('_is_missing') or not qimg or qimg.isNull():
+                        from src.utils.img_utils import empty_placeholder_qimage
+                        qimg = empty_placeholder_qimage(self.thumb_width, self.thumb_height)
+
+                    self.signals.item_loaded.emit(to_display_format(qimg), item, idx, self.generation, item_type)
             
-            except Exception as e:
-                print(f"Error in ItemLoader at index {idx}: {e}")
-                import traceback
-                traceback.print_exc()
-                self.signals.item_invalid.emit(idx, self.generation)
+                except Exception as e:
+                    print(f"Error in ItemLoader at index {idx}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    self.signals.item_invalid.emit(idx, self.generation)
         
         self.signals.loading_finished.emit(self.generation)
         
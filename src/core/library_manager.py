@@ -1,7 +1,8 @@
 import json
 from pathlib import Path
 from datetime import datetime
-from src.utils.database_utils import create_tables, db_cursor
+from src.utils.database_utils import TAG_TABLES, create_tables, db_cursor, has_search_index
+from src.core.facet_index import FacetIndex
 from src.utils.img_utils import get_chapter_number
 from src.utils.str_utils import natural_sort_key
 
@@ -20,33 +21,93 @@ def _deserialize_extra_paths(value):
     except (TypeError, ValueError):
         return []
 
+# How much of a series to load. SUMMARY is what a grid tile needs: the series row,
+# chapter_count and themes (for hiding excluded themes). DETAIL adds every tag list,
+# for info and edit dialogs. FULL adds the sorted chapter list, for the chapter list,
+# the reader and the web server. load_level() upgrades an already loaded series.
+SUMMARY, DETAIL, FULL = 'summary', 'detail', 'full'
+LEVELS = (SUMMARY, DETAIL, FULL)
+
+SQL_VARIABLE_CHUNK = 900 # stay under SQLite's bound-parameter limit in IN (...) lists
+
+
+def _fill_temp_table(cursor, name: str, columns: str, rows: list):
+    """(Re)fill a connection-private temp table used to join a batch against the library."""
+    cursor.execute(f"CREATE TEMP TABLE IF NOT EXISTS {name} ({columns})")
+    cursor.execute(f"DELETE FROM {name}")
+    placeholders = ', '.join('?' * len(columns.split(',')))
+    cursor.executemany(f"INSERT INTO {name} VALUES ({placeholders})", rows)
+
+
+def _filter_join(cursor, ids) -> str:
+    """JOIN clause restricting series s to ids (a tag filter result); empty when ids is None."""
+    if ids is None:
+        return ''
+    _fill_temp_table(cursor, '_filter_ids', 'id INTEGER PRIMARY KEY', [(sid,) for sid in ids])
+    return 'JOIN _filter_ids f ON f.id = s.id'
+
+
+def _id_chunks(ids: list):
+    for i in range(0, len(ids), SQL_VARIABLE_CHUNK):
+        yield ids[i:i + SQL_VARIABLE_CHUNK]
+
+# Full-text search tuning
+MIN_MATCH_LENGTH = 3 # the trigram index cannot match shorter words; those use LIKE
+FUZZY_MIN_LENGTH = 4
+FUZZY_CHARS_PER_EDIT = 5 # a typo match may be this many characters of the query per edit (at least one)
+FUZZY_CANDIDATES = 200
+SEARCH_WEIGHTS = "10.0, 4.0, 1.0" # bm25 weights of name, authors, description
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _trigrams(text: str) -> set:
+    text = ' '.join(text.lower().split())
+    return {text[i:i + 3] for i in range(len(text) - 2)} or {text}
+
+
+def _substring_distance(query: str, text: str, limit: int) -> int:
+    """Fewest edits (swapped neighbours count as one) turning query into some substring of text.
+
+    Stops early with a value over limit once no substring can be within it.
+    """
+    # Sellers' algorithm: a match may start anywhere in text, so row 0 is all zeros
+    before, previous = None, [0] * (len(text) + 1)
+    for i, q in enumerate(query, 1):
+        current = [i]
+        for j, t in enumerate(text, 1):
+            cost = min(previous[j - 1] + (q != t), previous[j] + 1, current[j - 1] + 1)
+            if before is not None and j > 1 and q == text[j - 2] and query[i - 2] == t:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1 # rows never get better than their minimum
+        before, previous = previous, current
+    return min(previous)
+
+
 class LibraryManager:
-    _TAG_CONFIG = {
-        'authors': ('authors', 'series_authors', 'author_id'),
-        'genres':  ('genres',  'series_genres',  'genre_id'),
-        'themes':  ('themes',  'series_themes',  'theme_id'),
-        'formats': ('formats', 'series_formats', 'format_id'),
-    }
+    _TAG_CONFIG = {table: (table, junction, fk) for table, junction, fk in TAG_TABLES}
 
     def __init__(self):
         self.init_db()
 
     def init_db(self):
         create_tables()
+        self._search_index = has_search_index()
+        self.facets = FacetIndex.instance()
 
-    def get_series(self):
+    def get_series(self, level=FULL):
         with db_cursor() as (_, cursor):
             cursor.execute("SELECT * FROM series")
             series_list = [dict(row) for row in cursor.fetchall()]
-        self._populate_metadata(series_list)
+        self._populate_metadata(series_list, level)
         return series_list
 
-    def search_series(self, search_term):
-        with db_cursor() as (_, cursor):
-            cursor.execute("SELECT * FROM series WHERE name LIKE ?", (f'%{search_term}%',))
-            series_list = [dict(row) for row in cursor.fetchall()]
-        self._populate_metadata(series_list)
-        return series_list
+    def search_series(self, search_term, level=FULL):
+        return self.search_series_with_filters(search_term, {}, level)
 
     def get_recently_opened_series(self, limit=20):
         with db_cursor() as (_, cursor):
@@ -66,10 +127,11 @@ class LibraryManager:
             return [row['name'] for row in cursor.fetchall()]
 
     def _get_all_tags(self, tag):
-        table = self._TAG_CONFIG[tag][0]
-        with db_cursor() as (_, cursor):
-            cursor.execute(f"SELECT name FROM {table} ORDER BY name")
-            return [row['name'] for row in cursor.fetchall()]
+        return self.facets.names(tag)
+
+    def complete_tag(self, tag, text):
+        """Names of a tag ('authors', 'genres', ...) for a completer: prefix matches first."""
+        return self.facets.complete(tag, text)
 
     def get_authors(self, series_id):  return self._get_tag_list(series_id, 'authors')
     def get_genres(self, series_id):   return self._get_tag_list(series_id, 'genres')
@@ -81,38 +143,76 @@ class LibraryManager:
     def get_all_themes(self):   return self._get_all_tags('themes')
     def get_all_formats(self):  return self._get_all_tags('formats')
 
-    def search_series_with_filters(self, search_term, filters):
-        query = "SELECT DISTINCT s.* FROM series s"
-        params = []
-        has_filter = False
-
-        for key, (table, junction, fk) in self._TAG_CONFIG.items():
-            values = filters.get(key)
-            if not values:
-                continue
-            ph = ', '.join('?' * len(values))
-            clause = (
-                f" WHERE s.id IN (SELECT series_id FROM {junction} j"
-                f" JOIN {table} t ON t.id = j.{fk} WHERE t.name IN ({ph}))"
-                if not has_filter else
-                f" AND s.id IN (SELECT series_id FROM {junction} j"
-                f" JOIN {table} t ON t.id = j.{fk} WHERE t.name IN ({ph}))"
-            )
-            query += clause
-            params.extend(values)
-            has_filter = True
-
-        if search_term:
-            query += " WHERE s.name LIKE ?" if not has_filter else " AND s.name LIKE ?"
-            params.append(f'%{search_term}%')
+    def search_series_with_filters(self, search_term, filters, level=FULL):
+        """Series matching search_term and every tag filter.
 
-        with db_cursor() as (_, cursor):
-            cursor.execute(query, params)
-            series_list = [dict(row) for row in cursor.fetchall()]
+        Tag filters (any of the listed names, for every tag) are resolved by the facet
+        index. With the full-text index, the term matches titles, authors and descriptions as
+        substrings and results come best match first; a term with no exact match falls
+        back to typo-tolerant trigram matching. Otherwise it is a LIKE on the name.
+        """
+        ids = self.facets.series_ids(filters)
+        if ids is not None and not ids:
+            return []
 
-        self._populate_metadata(series_list)
+        search_term = (search_term or '').strip()
+        words = search_term.split()
+        if words and self._search_index and all(len(w) >= MIN_MATCH_LENGTH for w in words):
+            match = ' '.join(_fts_phrase(w) for w in words)
+            series_list = [series for series, _ in self._match_series(match, ids=ids)]
+            if not series_list and len(search_term) >= FUZZY_MIN_LENGTH:
+                series_list = self._fuzzy_match_series(search_term, ids)
+        elif search_term:
+            with db_cursor() as (_, cursor):
+                cursor.execute(f"SELECT s.* FROM series s {_filter_join(cursor, ids)} WHERE s.name LIKE ?",
+                               (f'%{search_term}%',))
+                series_list = [dict(row) for row in cursor.fetchall()]
+        else:
+            with db_cursor() as (_, cursor):
+                cursor.execute(f"SELECT s.* FROM series s {_filter_join(cursor, ids)}")
+                series_list = [dict(row) for row in cursor.fetchall()]
+
+        self._populate_metadata(series_list, level)
         return series_list
 
+    def _match_series(self, match, limit=-1, ids=None):
+        """(series, indexed title and authors) for an FTS5 match expression, best first.
+
+        ids (a tag filter result) is applied in the query, before the limit.
+        """
+        with db_cursor() as (_, cursor):
+            cursor.execute(f"""
+                SELECT s.*, series_search.name AS _fts_name, series_search.authors AS _fts_authors
+                FROM series_search JOIN series s ON s.id = series_search.rowid {_filter_join(cursor, ids)}
+                WHERE series_search MATCH ?
+                ORDER BY bm25(series_search, {SEARCH_WEIGHTS}) LIMIT ?
+            """, (match, limit))
+            rows = [dict(row) for row in cursor.fetchall()]
+        return [(row, f"{row.pop('_fts_name')} {row.pop('_fts_authors')}") for row in rows]
+
+    def _fuzzy_match_series(self, search_term, ids=None):
+        """Series (among ids, if given) within a few typos of search_term, closest first.
+
+        Candidates share a trigram with the term; one edit changes up to three of them,
+        so they are kept by edit distance to the closest part of their title or authors.
+        """
+        query = ' '.join(search_term.lower().split())
+        wanted = _trigrams(query)
+        max_edits = max(1, len(query) // FUZZY_CHARS_PER_EDIT)
+        min_shared = len(wanted) - 3 * max_edits
+        match = ' OR '.join(_fts_phrase(t) for t in wanted)
+        scored = []
+        for series, text in self._match_series(match, FUZZY_CANDIDATES, ids):
+            text = ' '.join(text.lower().split())
+            shared = len(wanted & _trigrams(text))
+            if shared < min_shared:
+                continue # needs more edits than allowed
+            distance = _substring_distance(query, text, max_edits)
+            if distance <= max_edits:
+                scored.append((distance, -shared, series))
+        scored.sort(key=lambda entry: entry[:2])
+        return [series for _, _, series in scored]
+
     def get_series_by_path(self, path):
         normalized_path = str(Path(path))
         with db_cursor() as (_, cursor):
@@ -135,91 +235,103 @@ class LibraryManager:
 
 
     def add_series_from_data(self, series_data, metadata=None):
-        with db_cursor() as (conn, cursor):
-            cursor.execute("SELECT id FROM series WHERE path = ?", (series_data['path'],))
-            if cursor.fetchone():
-                return
+        self.add_series_batch([series_data], metadata)
 
-            try:
-                # Use name from metadata if provided, else use scanning result
-                final_name = series_data['name']
-                if metadata and 'name' in metadata and metadata['name']:
-                    final_name = metadata['name']
+    def add_series_batch(self, series_data_list, metadata=None):
+        """Add scanned series in one transaction, skipping paths already in the library.
 
-                cursor.execute(
+        metadata (name and tag lists, e.g. from the batch add dialog) applies to every
+        series; formats fall back to what the scanner detected.
+        """
+        if not series_data_list:
+            return
+        metadata = metadata or {}
+        with db_cursor() as (conn, cursor):
+            try:
+                existing = self._ids_by_path(cursor, [d['path'] for d in series_data_list])
+                new_series = []
+                for series_data in series_data_list:
+                    if series_data['path'] not in existing:
+                        existing[series_data['path']] = None
+                        new_series.append(series_data)
+                if not new_series:
+                    return
+
+                cursor.executemany(
                     "INSERT INTO series (name, path, cover_image) VALUES (?, ?, ?)",
-                    (final_name, series_data['path'], series_data['cover_image'])
+                    [(metadata.get('name') or d['name'], d['path'], d['cover_image']) for d in new_series]
+                )
+                ids = self._ids_by_path(cursor, [d['path'] for d in new_series])
+                cursor.executemany(
+                    "INSERT INTO chapters (series_id, name, path, extra_paths) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(path) DO NOTHING",
+                    [(ids[d['path']], chapter['name'], chapter['path'], _serialize_extra_paths(chapter))
+                     for d in new_series for chapter in d.get('chapters', [])]
                 )
-                series_id = cursor.lastrowid
-                for chapter in series_data.get('chapters', []):
-                    cursor.execute(
-                        "INSERT INTO chapters (series_id, name, path, extra_paths) VALUES (?, ?, ?, ?)",
-                        (series_id, chapter['name'], chapter['path'], _serialize_extra_paths(chapter))
-                    )
 
-                if metadata:
-                    if 'authors' in metadata and metadata['authors']:
-                        for author_name in metadata['authors']:
-                            cursor.execute("SELECT id FROM authors WHERE name = ?", (author_name,))
-                            author_row = cursor.fetchone()
-                            if not author_row:
-                                cursor.execute("INSERT INTO authors (name) VALUES (?)", (author_name,))
-                                author_id = cursor.lastrowid
-                            else:
-                                author_id = author_row['id']
-                            cursor.execute("INSERT INTO series_authors (series_id, author_id) VALUES (?, ?)", (series_id, author_id))
-
-                    if 'genres' in metadata and metadata['genres']:
-                        for genre_name in metadata['genres']:
-                            cursor.execute("SELECT id FROM genres WHERE name = ?", (genre_name,))
-                            genre_row = cursor.fetchone()
-                            if not genre_row:
-                                cursor.execute("INSERT INTO genres (name) VALUES (?)", (genre_name,))
-                                genre_id = cursor.lastrowid
-                            else:
-                                genre_id = genre_row['id']
-                            cursor.execute("INSERT INTO series_genres (series_id, genre_id) VALUES (?, ?)", (series_id, genre_id))
-
-                    if 'themes' in metadata and metadata['themes']:
-                        for theme_name in metadata['themes']:
-                            cursor.execute("SELECT id FROM themes WHERE name = ?", (theme_name,))
-                            theme_row = cursor.fetchone()
-                            if not theme_row:
-                                cursor.execute("INSERT INTO themes (name) VALUES (?) ", (theme_name,))
-                                theme_id = cursor.lastrowid
-                            else:
-                                theme_id = theme_row['id']
-                            cursor.execute("INSERT INTO series_themes (series_id, theme_id) VALUES (?, ?)", (series_id, theme_id['id']))
-
-                # Formats can come from metadata OR from our auto-detector via series_data
-                formats_to_add = []
-                if metadata and 'formats' in metadata and metadata['formats']:
-                    formats_to_add = metadata['formats']
-                elif 'formats' in series_data and series_data['formats']:
-                    formats_to_add = series_data['formats']
-
-                for format_name in formats_to_add:
-                    cursor.execute("SELECT id FROM formats WHERE name = ?", (format_name,))
-                    format_row = cursor.fetchone()
-                    if not format_row:
-                        cursor.execute("INSERT INTO formats (name) VALUES (?)", (format_name,))
-                        format_id = cursor.lastrowid
-                    else:
-                        format_id = format_row['id']
-                    
-                    if isinstance(format_id, dict):
-                         format_id = format_id['id']
-                    cursor.execute("INSERT INTO series_formats (series_id, format_id) VALUES (?, ?)", (series_id, format_id))
+                links = {tag: [] for tag in self._TAG_CONFIG}
+                for series_data in new_series:
+                    sid = ids[series_data['path']]
+                    for tag in links:
+                        values = metadata.get(tag) or (series_data.get(tag) if tag == 'formats' else None) or []
+                        links[tag].extend((sid, value) for value in values)
+                for tag, pairs in links.items():
+                    self._link_tags(cursor, tag, pairs)
 
                 conn.commit()
+                self.facets.invalidate()
             except Exception as e:
                 print(f"Error adding series: {e}")
                 conn.rollback()
 
+    def _ids_by_path(self, cursor, paths):
+        """{path: id} for the given paths that are in the library."""
+        _fill_temp_table(cursor, '_batch_paths', 'path TEXT', [(p,) for p in paths])
+        cursor.execute("SELECT s.id, s.path FROM series s JOIN _batch_paths b ON b.path = s.path")
+        return {row['path']: row['id'] for row in cursor.fetchall()}
+
+    def _link_tags(self, cursor, tag, pairs):
+        """Link (series_id, tag name) pairs, creating tag names that do not exist yet."""
+        if not pairs:
+            return
+        table, junction, fk = self._TAG_CONFIG[tag]
+        cursor.executemany(
+            f"INSERT INTO {table} (name) VALUES (?) ON CONFLICT(name) DO NOTHING",
+            [(name,) for name in dict.fromkeys(name for _, name in pairs)]
+        )
+        _fill_temp_table(cursor, '_batch_tags', 'series_id INTEGER, name TEXT', pairs)
+        cursor.execute(f"""
+            INSERT OR IGNORE INTO {junction} (series_id, {fk})
+            SELECT b.series_id, t.id FROM _batch_tags b JOIN {table} t ON t.name = b.name
+        """)
 
     def update_series_batch(self, series_list, metadata):
-        for series in series_list:
-            self.update_series_info(series['id'], metadata)
+        """Apply the same name, description, cover and tag lists to every series, in one transaction.
+
+        Tag lists present in metadata replace the series' current ones.
+        """
+        if not series_list:
+            return
+        with db_cursor() as (conn, cursor):
+            try:
+                ids = [series['id'] for series in series_list]
+                _fill_temp_table(cursor, '_batch_ids', 'id INTEGER PRIMARY KEY', [(sid,) for sid in set(ids)])
+                for column in ('name', 'description', 'cover_image'):
+                    if column in metadata:
+                        cursor.execute(f"UPDATE series SET {column} = ? WHERE id IN (SELECT id FROM _batch_ids)",
+                                       (metadata[column],))
+
+                for tag, (table, junction, fk) in self._TAG_CONFIG.items():
+                    if tag not in metadata:
+                        continue
+                    cursor.execute(f"DELETE FROM {junction} WHERE series_id IN (SELECT id FROM _batch_ids)")
+                    self._link_tags(cursor, tag, [(sid, value) for sid in ids for value in metadata[tag]])
+
+                conn.commit()
+                self.facets.invalidate()
+            except Exception as e:
+                print(f"Error updating series info: {e}")
+                conn.rollback()
 
     def hide_chapter(self, series_path: str, chapter: dict):
         """Remove chapter from DB and add to blacklist in info.json so it is not rescanned."""
@@ -245,16 +357,22 @@ class LibraryManager:
         AltManager.blacklist_chapter(series_path, chapter_name)
 
     def remove_series(self, series_to_remove):
+        self.remove_series_batch([series_to_remove])
+
+    def remove_series_batch(self, series_list):
+        if not series_list:
+            return
         with db_cursor() as (conn, cursor):
             try:
-                sid = series_to_remove['id']
-                cursor.execute("DELETE FROM series_authors WHERE series_id = ?", (sid,))
-                cursor.execute("DELETE FROM series_genres WHERE series_id = ?", (sid,))
-                cursor.execute("DELETE FROM series_themes WHERE series_id = ?", (sid,))
-                cursor.execute("DELETE FROM series_formats WHERE series_id = ?", (sid,))
-                cursor.execute("DELETE FROM chapters WHERE series_id = ?", (sid,))
-                cursor.execute("DELETE FROM series WHERE id = ?", (sid,))
+                _fill_temp_table(cursor, '_batch_ids', 'id INTEGER PRIMARY KEY',
+                                 [(sid,) for sid in {series['id'] for series in series_list}])
+                for table in ('series_authors', 'series_genres', 'series_themes', 'series_formats', 'chapters'):
+                    cursor.execute(f"DELETE FROM {table} WHERE series_id IN (SELECT id FROM _batch_ids)")
+                cursor.execute("DELETE FROM scan_journal WHERE path IN"
+                               " (SELECT path FROM series WHERE id IN (SELECT id FROM _batch_ids))")
+                cursor.execute("DELETE FROM series WHERE id IN (SELECT id FROM _batch_ids)")
                 conn.commit()
+                self.facets.invalidate()
             except Exception as e:
                 print(f"Error removing series: {e}")
                 conn.rollback()
@@ -287,59 +405,7 @@ class LibraryManager:
                 conn.rollback()
 
     def update_series_info(self, series_id, new_info):
-        with db_cursor() as (conn, cursor):
-            try:
-                if 'name' in new_info:
-                    cursor.execute("UPDATE series SET name = ? WHERE id = ?", (new_info['name'], series_id))
-                if 'description' in new_info:
-                    cursor.execute("UPDATE series SET description = ? WHERE id = ?", (new_info['description'], series_id))
-                if 'cover_image' in new_info:
-                    cursor.execute("UPDATE series SET cover_image = ? WHERE id = ?", (new_info['cover_image'], series_id))
-
-                if 'authors' in new_info:
-                    cursor.execute("DELETE FROM series_authors WHERE series_id = ?", (series_id,))
-                    for author_name in new_info['authors']:
-                        cursor.execute("SELECT id FROM authors WHERE name = ?", (author_name,))
-                        author_id = cursor.fetchone()
-                        if not author_id:
-                            cursor.execute("INSERT INTO authors (name) VALUES (?) RETURNING id", (author_name,))
-                            author_id = cursor.fetchone()
-                        cursor.execute("INSERT INTO series_authors (series_id, author_id) VALUES (?, ?)", (series_id, author_id['id']))
-
-                if 'genres' in new_info:
-                    cursor.execute("DELETE FROM series_genres WHERE series_id = ?", (series_id,))
-                    for genre_name in new_info['genres']:
-                        cursor.execute("SELECT id FROM genres WHERE name = ?", (genre_name,))
-                        genre_id = cursor.fetchone()
-                        if not genre_id:
-                            cursor.execute("INSERT INTO genres (name) VALUES (?) RETURNING id", (genre_name,))
-                            genre_id = cursor.fetchone()
-                        cursor.execute("INSERT INTO series_genres (series_id, genre_id) VALUES (?, ?)", (series_id, genre_id['id']))
-
-                if 'themes' in new_info:
-                    cursor.execute("DELETE FROM series_themes WHERE series_id = ?", (series_id,))
-                    for theme_name in new_info['themes']:
-                        cursor.execute("SELECT id FROM themes WHERE name = ?", (theme_name,))
-                        theme_id = cursor.fetchone()
-                        if not theme_id:
-                            cursor.execute("INSERT INTO themes (name) VALUES (?) RETURNING id", (theme_name,))
-                            theme_id = cursor.fetchone()
-                        cursor.execute("INSERT INTO series_themes (series_id, theme_id) VALUES (?, ?)", (series_id, theme_id['id']))
-
-                if 'formats' in new_info:
-                    cursor.execute("DELETE FROM series_formats WHERE series_id = ?", (series_id,))
-                    for format_name in new_info['formats']:
-                        cursor.execute("SELECT id FROM formats WHERE name = ?", (format_name,))
-                        format_id = cursor.fetchone()
-                        if not format_id:
-                            cursor.execute("INSERT INTO formats (name) VALUES (?) RETURNING id", (format_name,))
-                            format_id = cursor.fetchone()
-                        cursor.execute("INSERT INTO series_formats (series_id, format_id) VALUES (?, ?)", (series_id, format_id['id']))
-
-                conn.commit()
-            except Exception as e:
-                print(f"Error updating series info: {e}")
-                conn.rollback()
+        self.update_series_batch([{'id': series_id}], new_info)
 
     def rescan_series_from_data(self, series_id, new_path, series_data):
         normalized_path = str(Path(new_path))
@@ -360,31 +426,52 @@ class LibraryManager:
                 print(f"Error rescanning series path from data: {e}")
                 conn.rollback()
 
+    def get_series_locations(self):
+        """[{'id', 'path', 'cover_image'}] of every series, for rescans and folder watching."""
+        with db_cursor() as (_, cursor):
+            cursor.execute("SELECT id, path, cover_image FROM series")
+            return [dict(row) for row in cursor.fetchall()]
+
+    def apply_rescan_batch(self, changes):
+        """Write the chapters a library rescan found added or removed, in one transaction.
+
+        Each change is {'id', 'added': [chapter], 'removed': [path]}, with 'cover_image'
+        when the series' cover follows the scanner's pick.
+        """
+        if not changes:
+            return
+        with db_cursor() as (conn, cursor):
+            try:
+                cursor.executemany(
+                    "DELETE FROM chapters WHERE series_id = ? AND path = ?",
+                    [(change['id'], path) for change in changes for path in change['removed']]
+                )
+                cursor.executemany(
+                    "INSERT INTO chapters (series_id, name, path, extra_paths) VALUES (?, ?, ?, ?)"
+                    " ON CONFLICT(path) DO NOTHING",
+                    [(change['id'], chapter['name'], chapter['path'], _serialize_extra_paths(chapter))
+                     for change in changes for chapter in change['added']]
+                )
+                cursor.executemany(
+                    "UPDATE series SET cover_image = ? WHERE id = ?",
+                    [(change['cover_image'], change['id']) for change in changes if 'cover_image' in change]
+                )
+                conn.commit()
+            except Exception as e:
+                print(f"Error applying rescan: {e}")
+                conn.rollback()
 
     def get_field_values_with_counts(self, field):
         """Returns [{'name': str, 'count': int}] for authors/genres/themes/formats."""
-        field_table = {'author': 'authors', 'genre': 'genres', 'theme': 'themes', 'format': 'formats'}
-        junction = {'author': 'series_authors', 'genre': 'series_genres', 'theme': 'series_themes', 'format': 'series_formats'}
-        id_col = {'author': 'author_id', 'genre': 'genre_id', 'theme': 'theme_id', 'format': 'format_id'}
-        if field not in field_table:
+        if f'{field}s' not in self._TAG_CONFIG:
             return []
-        with db_cursor() as (_, cursor):
-            cursor.execute(f"""
-                SELECT t.name, COUNT(j.series_id) as count
-                FROM {field_table[field]} t
-                JOIN {junction[field]} j ON t.id = j.{id_col[field]}
-                JOIN series s ON j.series_id = s.id
-                GROUP BY t.id, t.name
-                HAVING COUNT(j.series_id) > 0
-                ORDER BY t.name
-            """)
-            return [{'name': row['name'], 'count': row['count']} for row in cursor.fetchall()]
+        return self.facets.counts(f'{field}s')
 
-    def get_series_by_field_value(self, field, value):
+    def get_series_by_field_value(self, field, value, level=FULL):
         """Returns series filtered by a specific field value."""
-        return self.search_series_with_filters('', {f'{field}s': [value]})
+        return self.search_series_with_filters('', {f'{field}s': [value]}, level)
 
-    def get_series_without_field(self, field):
+    def get_series_without_field(self, field, level=FULL):
         """Returns series that have no values for the given field (untagged)."""
         junction = {'author': 'series_authors', 'genre': 'series_genres', 'theme': 'series_themes', 'format': 'series_formats'}
         if field not in junction:
@@ -395,80 +482,91 @@ class LibraryManager:
                 WHERE s.id NOT IN (SELECT DISTINCT series_id FROM {junction[field]})
             """)
             series_list = [dict(row) for row in cursor.fetchall()]
-        self._populate_metadata(series_list)
+        self._populate_metadata(series_list, level)
         return series_list
 
-    def _populate_metadata(self, series_list):
+    def load_level(self, series, level=FULL):
+        """Fill in what a series loaded at a lower level lacks; returns the same dict."""
+        if LEVELS.index(series.get('_level', FULL)) < LEVELS.index(level):
+            self._populate_metadata([series], level)
+        return series
+
+    def _populate_metadata(self, series_list, level=FULL):
+        """Attach to each series what its level needs (see LEVELS) and record the level."""
         if not series_list:
             return
 
         series_map = {series['id']: series for series in series_list}
-        series_ids = list(series_map.keys())
-        
+        tags = ['themes'] if level == SUMMARY else list(self._TAG_CONFIG)
+
         # Initialize default empty lists
         for series in series_list:
-            series['chapters'] = []
-            series['authors'] = []
-            series['genres'] = []
-            series['themes'] = []
-            series['formats'] = []
-
-        if not series_ids:
-            return
-
-        placeholders = ', '.join('?' * len(series_ids))
+            for tag in tags:
+                series[tag] = []
+            if level == FULL:
+                series['chapters'] = []
+            series['chapter_count'] = 0
+            series['_level'] = level
 
         with db_cursor() as (_, cursor):
             try:
-                cursor.execute(f"SELECT * FROM chapters WHERE series_id IN ({placeholders})", series_ids)
-                all_chapters = [dict(row) for row in cursor.fetchall()]
-
-                for chapter in all_chapters:
-                    chapter['extra_paths'] = _deserialize_extra_paths(chapter.get('extra_paths'))
-                    sid = chapter['series_id']
-                    if sid in series_map:
-                        series_map[sid]['chapters'].append(chapter)
-
-                def make_sort_key(x):
-                    path = x.get('path')
-                    name = x.get('name') or ''
-                    if not isinstance(path, str) or not path:
-                        return ('.', natural_sort_key(name))
-                    try:
-                        # Defensive split for virtual paths
-                        if '|' in path:
-                            parts = path.split('|')
-                            if len(parts) > 1:
-                                parent = str(Path(parts[1]).parent)
-                            else:
-                                parent = '.'
-                        else:
-                            parent = str(Path(path).parent)
-                    except (IndexError, TypeError, OSError):
-                        parent = '.'
-                    return (parent, natural_sort_key(name))
-
-                for series in series_list:
-                    try:
-                        series['chapters'].sort(key=make_sort_key)
-                    except Exception as e:
-                        print(f"Error sorting chapters for series {series.get('id')}: {e}")
-
-                def fetch_junction(table, join_table, join_id_col, target_field):
-                    cursor.execute(f"""
-                        SELECT j.series_id, t.name
-                        FROM {table} t
-                        JOIN {join_table} j ON t.id = j.{join_id_col}
-                        WHERE j.series_id IN ({placeholders})
-                    """, series_ids)
-                    for row in cursor.fetchall():
-                        if row['series_id'] in series_map:
-                            series_map[row['series_id']][target_field].append(row['name'])
-
-                for tag, (table, junction, fk) in self._TAG_CONFIG.items():
-                    fetch_junction(table, junction, fk, tag)
+                for chunk in _id_chunks(list(series_map)):
+                    placeholders = ', '.join('?' * len(chunk))
+                    if level == FULL:
+                        cursor.execute(f"SELECT * FROM chapters WHERE series_id IN ({placeholders})", chunk)
+                        for row in cursor.fetchall():
+                            chapter = dict(row)
+                            chapter['extra_paths'] = _deserialize_extra_paths(chapter.get('extra_paths'))
+                            series_map[chapter['series_id']]['chapters'].append(chapter)
+                    else:
+                        cursor.execute(f"""
+                            SELECT series_id, COUNT(*) AS n FROM chapters
+                            WHERE series_id IN ({placeholders}) GROUP BY series_id
+                        """, chunk)
+                        for row in cursor.fetchall():
+                            series_map[row['series_id']]['chapter_count'] = row['n']
+
+                    for tag in tags:
+                        table, junction, fk = self._TAG_CONFIG[tag]
+                        cursor.execute(f"""
+                            SELECT j.series_id, t.name
+                            FROM {table} t
+                            JOIN {junction} j ON t.id = j.{fk}
+                            WHERE j.series_id IN ({placeholders})
+                        """, chunk)
+                        for row in cursor.fetchall():
+                            series_map[row['series_id']][tag].append(row['name'])
 
             except Exception as e:
                 import traceback
                 print(f"Error populating metadata: {e}")
-                traceback.print_exc()
\ No newline at end of file
+                traceback.print_exc()
+
+        if level != FULL:
+            return
+
+        def make_sort_key(x):
+            path = x.get('path')
+            name = x.get('name') or ''
+            if not isinstance(path, str) or not path:
+                return ('.', natural_sort_key(name))
+            try:
+                # Defensive split for virtual paths
+                if '|' in path:
+                    parts = path.split('|')
+                    if len(parts) > 1:
+                        parent = str(Path(parts[1]).parent)
+                    else:
+                        parent = '.'
+                else:
+                    parent = str(Path(path).parent)
+            except (IndexError, TypeError, OSError):
+                parent = '.'
+            return (parent, natural_sort_key(name))
+
+        for series in series_list:
+            series['chapter_count'] = len(series['chapters'])
+            try:
+                series['chapters'].sort(key=make_sort_key)
+            except Exception as e:
+                print(f"Error sorting chapters for series {series.get('id')}: {e}")
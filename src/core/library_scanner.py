@@ -1,11 +1,20 @@
 import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 import re
 from PyQt6.QtCore import QObject, pyqtSignal, QRunnable, pyqtSlot
 from src.core.alt_manager import AltManager
+from src.core import scan_journal
+from src.core.scan_journal import ScanState
 from src.utils.str_utils import natural_sort_key
 import zipfile
 from src.utils.archive_utils import ARCHIVE_EXTS, ZIP_EXTS
+from src.utils.io_scheduler import IOScheduler
+from src.core.task_scheduler import TaskPriority, set_thread_priority
+from src.utils import fs_cache
 
 # prefer treating images and video separately for cover-selection vs listing
 IMAGE_EXTS = {'.png', '.jpg', '.jpeg', '.jpe', '.webp', '.bmp', '.gif', '.avif'}
@@ -33,6 +42,76 @@ def get_chapter_number(path):
     else:
         return find_number(name)
 
+# Series scanned at once per physical device. SSDs serve many small reads in parallel;
+# spinning disks and network shares slow down when several scans seek at once.
+FAST_DEVICE_SCANS = 8
+SLOW_DEVICE_SCANS = 2
+SCANS_IN_FLIGHT = 256 # results may run this far ahead of the oldest unfinished series
+
+class ScanPool:
+    """Per-device thread pools that batch scans run their series on.
+
+    A share or disk that answers slowly only holds up the series stored on it, while
+    series on other devices keep scanning. Within a series, the reads that probe
+    content (archive listings, image sampling) also wait for their device's read
+    slot, so on slow storage at most one scan reads files while the others list
+    folders. The pools live as long as the app: their threads keep their library
+    connections (see database_utils) and sit idle between scans.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools = {} # st_dev (None: unreachable) -> ThreadPoolExecutor
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = ScanPool()
+        return cls._instance
+
+    def _pool_for(self, path: str) -> ThreadPoolExecutor:
+        io = IOScheduler.instance()
+        probe = path if os.path.exists(path) else os.path.dirname(path)
+        device = io.device(probe)
+        with self._lock:
+            pool = self._pools.get(device)
+        if pool is None:
+            slow = device is not None and io.is_slow(probe)
+            workers = SLOW_DEVICE_SCANS if slow else FAST_DEVICE_SCANS
+            with self._lock:
+                pool = self._pools.setdefault(device, ThreadPoolExecutor(
+                    workers, thread_name_prefix="scan",
+                    # Scans are background work: their reads queue behind the pages on screen
+                    initializer=set_thread_priority, initargs=(TaskPriority.BACKGROUND,)))
+        return pool
+
+    def imap(self, fn, paths, is_aborted):
+        """Yield (path, result, error) for fn(path) over paths, in the order of paths.
+
+        Up to SCANS_IN_FLIGHT series are queued ahead. Stops (and drops what is still
+        queued) once is_aborted() returns True.
+        """
+        pending = deque()
+        remaining = iter(paths)
+        try:
+            while True:
+                while len(pending) < SCANS_IN_FLIGHT:
+                    path = next(remaining, None)
+                    if path is None:
+                        break
+                    pending.append((path, self._pool_for(str(path)).submit(fn, path)))
+                if not pending or is_aborted():
+                    return
+                path, future = pending.popleft()
+                try:
+                    yield path, future.result(), None
+                except Exception as e:
+                    yield path, None, e
+        finally:
+            for _, future in pending:
+                future.cancel()
+
 class ScannerSignals(QObject):
     finished = pyqtSignal(dict)
     error = pyqtSignal(str)
@@ -64,10 +143,13 @@ class ScannerWorker(QRunnable):
 class BatchScannerSignals(QObject):
     progress = pyqtSignal(int, int, str) # current, total, path
     series_scanned = pyqtSignal(dict)
+    batch_scanned = pyqtSignal(list) # up to WRITE_BATCH results, for one bulk library write
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
 class BatchScannerWorker(QRunnable):
+    WRITE_BATCH = 100
+
     def __init__(self, scanner: 'LibraryScanner', paths: list):
         super().__init__()
         self.scanner = scanner
@@ -81,24 +163,130 @@ class BatchScannerWorker(QRunnable):
     @pyqtSlot()
     def run(self):
         total = len(self.paths)
-        for i, path in enumerate(self.paths):
+        pending = []
+        scans = ScanPool.instance().imap(self.scanner.scan_series, self.paths, lambda: self._is_aborted)
+        for i, (path, result, error) in enumerate(scans):
             if self._is_aborted:
                 return
-            path_obj = Path(path)
-            try:
-                self.signals.progress.emit(i + 1, total, str(path))
-                result = self.scanner.scan_series(path)
-                if result:
-                    self.signals.series_scanned.emit(result)
-            except Exception as e:
-                print(f"Error scanning {path}: {e}")
+            self.signals.progress.emit(i + 1, total, str(path))
+            if error is not None:
+                print(f"Error scanning {path}: {error}")
                 # Continue with others
-        
+            elif result:
+                self.signals.series_scanned.emit(result)
+                pending.append(result)
+            if len(pending) >= self.WRITE_BATCH:
+                self.signals.batch_scanned.emit(pending)
+                pending = []
+
+        if pending:
+            self.signals.batch_scanned.emit(pending)
         self.signals.finished.emit()
 
+class LibraryRescanSignals(QObject):
+    progress = pyqtSignal(int, int, str) # current, total, path
+    batch_rescanned = pyqtSignal(list) # up to WRITE_BATCH chapter changes, for one bulk library write
+    finished = pyqtSignal(dict) # number of series per outcome
+    error = pyqtSignal(str)
+
+class LibraryRescanWorker(QRunnable):
+    """Rescan library series through the scan journal and report what changed.
+
+    Chapters the previous scan did not see are added and chapters it saw that are gone
+    are removed, so chapters left out when the series was added stay out. A series
+    without a journal entry only has its gone chapters removed; its scan becomes the
+    baseline for the next rescan. A series whose folder is gone is recorded as missing,
+    or offline if its parent folder is gone too, and stays in the library.
+    """
+    WRITE_BATCH = BatchScannerWorker.WRITE_BATCH
+
+    def __init__(self, scanner: 'LibraryScanner', library_manager, series_list: list):
+        super().__init__()
+        self.scanner = scanner
+        self.library_manager = library_manager
+        self.series_list = series_list # [{'id', 'path', 'cover_image'}]
+        self.signals = LibraryRescanSignals()
+        self._is_aborted = False
+        self._parents = {} # parent folder -> reachable, for this run
+
+    def abort(self):
+        self._is_aborted = True
+
+    def _status(self, path: str) -> str:
+        if os.path.exists(path):
+            return scan_journal.OK
+        # One check per parent: an unplugged drive or share can take seconds to answer
+        parent = os.path.dirname(path)
+        if parent not in self._parents:
+            self._parents[parent] = os.path.isdir(parent)
+        return scan_journal.MISSING if self._parents[parent] else scan_journal.OFFLINE
+
+    def _rescan(self, path: str):
+        """(status, series_data, previous series_data, changed) of one series; runs on a ScanPool thread."""
+        status = self._status(path)
+        if status != scan_journal.OK:
+            return status, None, None, False
+        series_data, previous, changed = self.scanner.rescan_series(path)
+        if series_data is None:
+            return scan_journal.MISSING, None, None, False # nothing left to read in the folder
+        return status, series_data, previous, changed
+
+    @pyqtSlot()
+    def run(self):
+        total = len(self.series_list)
+        counts = {'unchanged': 0, 'changed': 0, scan_journal.MISSING: 0, scan_journal.OFFLINE: 0}
+        self._parents = {}
+        pending = []
+        scans = ScanPool.instance().imap(self._rescan, [series['path'] for series in self.series_list],
+                                         lambda: self._is_aborted)
+        for i, (series, (path, result, error)) in enumerate(zip(self.series_list, scans)):
+            if self._is_aborted:
+                return
+            try:
+                self.signals.progress.emit(i + 1, total, path)
+                if error is not None:
+                    raise error
+                status, series_data, previous, changed = result
+                if status != scan_journal.OK:
+                    scan_journal.set_status(path, status)
+                    counts[status] += 1
+                    continue
+                if not changed:
+                    counts['unchanged'] += 1
+                    continue
+
+                if previous is not None:
+                    seen = {chapter['path'] for chapter in previous['chapters']}
+                    added = [chapter for chapter in series_data['chapters'] if chapter['path'] not in seen]
+                else:
+                    # No journal entry yet: this scan (already saved) is the baseline. A chapter
+                    # missing from the library may have been left out on purpose, so none are added
+                    seen = {chapter['path'] for chapter in self.library_manager.get_chapters(series)}
+                    added = []
+                found = {chapter['path'] for chapter in series_data['chapters']}
+                change = {
+                    'id': series['id'],
+                    'added': added,
+                    'removed': sorted(seen - found),
+                }
+                # Only follow the scanner's cover if the series still uses the one it picked last time
+                if previous is not None and series.get('cover_image') == previous.get('cover_image'):
+                    change['cover_image'] = series_data['cover_image']
+                counts['changed'] += 1
+                pending.append(change)
+            except Exception as e:
+                print(f"Error rescanning {path}: {e}")
+            if len(pending) >= self.WRITE_BATCH:
+                self.signals.batch_rescanned.emit(pending)
+                pending = []
+
+        if pending:
+            self.signals.batch_rescanned.emit(pending)
+        self.signals.finished.emit(counts)
+
 class LibraryScanner:
     def is_archive(self, path: Path):
-        return path.is_file() and path.suffix.lower() in ARCHIVE_EXTS
+        return path.suffix.lower() in ARCHIVE_EXTS and fs_cache.is_file(path)
 
     def is_chapter_folder(self, path: Path):
         name = path.name.lower()
@@ -106,18 +294,18 @@ class LibraryScanner:
 
     def is_media_file(self, path: Path):
         """Return True for image or video files (used for scanning)."""
-        return path.is_file() and path.suffix.lower() in ALL_MEDIA_EXTS
+        return path.suffix.lower() in ALL_MEDIA_EXTS and fs_cache.is_file(path)
 
     def is_image_file(self, path: Path):
         """Return True only for actual image file extensions (used for cover selection)."""
-        return path.is_file() and path.suffix.lower() in IMAGE_EXTS
+        return path.suffix.lower() in IMAGE_EXTS and fs_cache.is_file(path)
 
     def _archive_has_media(self, archive_path: Path) -> bool:
         """Return True if the archive contains at least one supported media file."""
         from src.utils.archive_utils import SevenZipHandler
         try:
             if archive_path.suffix.lower() in ZIP_EXTS:
-                with zipfile.ZipFile(archive_path, 'r') as zf:
+                with IOScheduler.instance().read_slot(str(archive_path)), zipfile.ZipFile(archive_path, 'r') as zf:
                     return any(
                         Path(name).suffix.lower() in ALL_MEDIA_EXTS
                         and not name.startswith('__MACOSX')
@@ -136,21 +324,45 @@ class LibraryScanner:
 
     def has_valid_chapter_content(self, chapter_path: Path):
         """Check if chapter folder has media files other than cover.jpg/png."""
-        for item in chapter_path.iterdir():
-            if self.is_media_file(item):
-                if item.name.lower() not in ['cover.jpg', 'cover.png']:
+        for entry in fs_cache.scandir(chapter_path):
+            if os.path.splitext(entry.name)[1].lower() in ALL_MEDIA_EXTS and entry.is_file():
+                if entry.name.lower() not in ['cover.jpg', 'cover.png']:
                     return True
         return False
 
     def scan_series(self, series_path):
-        item = Path(series_path)
-        
+        """Scan a series folder or archive from scratch, recording it in the scan journal."""
+        path = Path(series_path)
+        with fs_cache.stat_cache():
+            return self._scan_series(path, ScanState(path))[0]
+
+    def rescan_series(self, series_path):
+        """Scan a series again, re-walking only what changed since the journal's last scan.
+
+        Returns (series_data, previous series_data or None, changed). An unchanged series
+        returns its previous result without listing any folder or opening any archive.
+        """
+        path = Path(series_path)
+        previous = scan_journal.load(str(path))
+        previous_result = previous['result'] if previous else None
+        with fs_cache.stat_cache():
+            series_data, changed = self._scan_series(path, ScanState(path, previous), previous)
+        return series_data, previous_result, changed
+
+    def _scan_series(self, item: Path, state: ScanState, previous=None):
+        previous_result = previous['result'] if previous and previous['status'] == scan_journal.OK else None
+
         # Case 1: Series is a single archive file (e.g. oneshot.zip)
-        if item.is_file():
-            if self.is_archive(item):
+        if fs_cache.is_file(item):
+            if item.suffix.lower() in ARCHIVE_EXTS:
                 series_name = item.stem
                 
-                chapters = self.scan_archive(item)
+                chapters = state.archive(item)
+                if chapters is None:
+                    chapters = self.scan_archive(item)
+                    state.store_archive(item, chapters)
+                if not state.changed and previous_result is not None:
+                    return previous_result, False
                 
                 if not chapters:
                     chapters = [{
@@ -158,28 +370,33 @@ class LibraryScanner:
                         "path": str(item)
                     }]
                 
-                return {
+                series_data = {
                     "name": series_name,
                     "path": str(item),
                     "cover_image": str(item),
                     "chapters": chapters,
                     "root_dir": str(item.parent)
                 }
-            return None
+                scan_journal.save(str(item), state, series_data)
+                return series_data, True
+            return None, True
 
         # Case 2: Series is a folder
-        if not item.is_dir():
-            return None
+        if not fs_cache.is_dir(item):
+            return None, True
 
         # Recursive scan for chapters
-        chapters = self._scan_chapters_recursive(item, depth=0, max_depth=10)
+        state.track(AltManager._get_info_path(str(item))) # chapter blacklist and sort settings
+        chapters = self._scan_chapters_recursive(item, depth=0, max_depth=10, state=state)
+        if not state.changed and previous_result is not None:
+            return previous_result, False
         
         is_simple_series = False
         if len(chapters) == 1 and chapters[0]['path'] == str(item):
             is_simple_series = True
         
         if not chapters and not is_simple_series:
-            return None
+            return None, True
 
         series_name = item.name
         
@@ -199,6 +416,8 @@ class LibraryScanner:
 
         sorted_chapters = sorted(chapters, key=sort_key)
 
+        same_chapters = previous_result is not None and previous_result['chapters'] == sorted_chapters
+
         cover_image = self.find_cover(item, sorted_chapters)
 
         series_data = {
@@ -209,12 +428,17 @@ class LibraryScanner:
             "root_dir": str(item.parent)
         }
         
-        series_data["formats"] = self.detect_format(series_data)
-        
-        # Post-scan: auto-blacklist Spine assets and unrelated JSON files
-        self._auto_blacklist_spine_assets(str(item), sorted_chapters)
+        if same_chapters:
+            # Only listings or settings moved (e.g. a new cover); keep the sampled format
+            series_data["formats"] = previous_result.get("formats", [])
+        else:
+            series_data["formats"] = self.detect_format(series_data)
+            # Post-scan: auto-blacklist Spine assets and unrelated JSON files
+            self._auto_blacklist_spine_assets(str(item), sorted_chapters)
         
-        return series_data
+        scan_journal.save(str(item), state, series_data)
+        changed = not same_chapters or series_data["cover_image"] != previous_result.get("cover_image")
+        return series_data, changed
         
     def _auto_blacklist_spine_assets(self, series_path: str, chapters: list):
         data = AltManager.load_alts(series_path)
@@ -241,14 +465,13 @@ class LibraryScanner:
 
             is_virtual = '|' in cpath
             if not is_virtual:
-                p = Path(cpath)
-                if p.is_dir():
+                if fs_cache.is_dir(cpath):
                     try:
-                        for f in p.iterdir():
+                        for f in fs_cache.scandir(cpath):
                             if f.is_file():
                                 all_files.append(f.name)
-                                if f.suffix.lower() == '.atlas':
-                                    atlas_files.append((f.name, str(f)))
+                                if os.path.splitext(f.name)[1].lower() == '.atlas':
+                                    atlas_files.append((f.name, f.path))
                     except OSError:
                         pass
             else:
@@ -339,15 +562,18 @@ class LibraryScanner:
         skel_count = 0
         atlas_count = 0
 
-        if '|' not in first_chap_path and Path(first_chap_path).is_dir():
-            for f in Path(first_chap_path).iterdir():
-                if self.is_media_file(f):
+        if '|' not in first_chap_path and fs_cache.is_dir(first_chap_path):
+            for f in fs_cache.scandir(first_chap_path):
+                if not f.is_file():
+                    continue
+                ext = os.path.splitext(f.name)[1].lower()
+                if ext in ALL_MEDIA_EXTS:
                     total_media += 1
-                    if any(str(f).lower().endswith(ext) for ext in VIDEO_EXTS):
+                    if ext in VIDEO_EXTS:
                         video_count += 1
-                elif f.is_file() and f.suffix.lower() == '.skel':
+                elif ext == '.skel':
                     skel_count += 1
-                elif f.is_file() and f.suffix.lower() == '.atlas':
+                elif ext == '.atlas':
                     atlas_count += 1
 
             if total_media > 0 and video_count / total_media >= 0.5:
@@ -373,14 +599,17 @@ class LibraryScanner:
         if series_data.get('cover_image'):
             images_to_sample.append(series_data['cover_image'])
             
-        if '|' not in first_chap_path and Path(first_chap_path).is_dir():
+        if '|' not in first_chap_path and fs_cache.is_dir(first_chap_path):
              try:
-                 images_to_sample.extend([str(f) for f in Path(first_chap_path).iterdir() if self.is_image_file(f)][:5])
+                 images_to_sample.extend([f.path for f in fs_cache.scandir(first_chap_path)
+                                          if os.path.splitext(f.name)[1].lower() in IMAGE_EXTS and f.is_file()][:5])
              except OSError:
                  pass
 
         for path in images_to_sample[:5]: # Max 5 samples
-            ratio = get_image_aspect_ratio(path)
+            # Archive members already wait for their device's read slot while being read
+            with IOScheduler.instance().read_slot(path) if '|' not in path else nullcontext():
+                ratio = get_image_aspect_ratio(path)
             if ratio is not None and ratio > 0:
                  ratios.append(ratio)
         
@@ -427,7 +656,8 @@ class LibraryScanner:
         # 1. Try zipfile with Shift-JIS correction first for .zip/.cbz
         if is_zip:
             try:
-                with zipfile.ZipFile(archive_path, 'r') as zf:
+                # Reading the central directory is the probe; queue for the device like any read
+                with IOScheduler.instance().read_slot(str(archive_path)), zipfile.ZipFile(archive_path, 'r') as zf:
                     for info in zf.infolist():
                         name = info.filename
                         if not (info.flag_bits & 0x800):
@@ -526,53 +756,66 @@ class LibraryScanner:
             self._traverse_zip_tree(child_node, new_path, archive_path, chapters)
 
 
-    def _scan_chapters_recursive(self, folder: Path, depth: int, max_depth: int) -> list:
-        if depth > max_depth:
-            return []
-
-        chapters = []
-
-        # 1. Check if this folder ITSELF is a chapter (has images)
+    def _list_folder(self, folder: Path):
+        """(has_content, [[name, is_archive], ...]) for one folder, or None if it cannot be listed."""
         has_content = False
+        entries = []
         try:
-            for f in folder.iterdir():
-                if self.is_media_file(f):
-                    if f.name.lower() not in ['cover.jpg', 'cover.png']: 
+            # DirEntry types come with the listing, so only symlinks and odd filesystems cost a stat
+            for item in fs_cache.scandir(folder):
+                ext = os.path.splitext(item.name)[1].lower()
+                # 1. Does this folder ITSELF hold a chapter (has images)?
+                if not has_content and ext in ALL_MEDIA_EXTS and item.is_file():
+                    if item.name.lower() not in ['cover.jpg', 'cover.png']:
                         has_content = True
-                        break
+                # 2. Archives (chapters) and subfolders
+                if ext in ARCHIVE_EXTS and item.is_file():
+                    entries.append([item.name, True])
+                elif item.is_dir() and item.name.lower() not in ('alts', 'translations'):
+                    entries.append([item.name, False])
         except (PermissionError, OSError):
-            pass
+            return None
+        return has_content, entries
 
+    def _scan_chapters_recursive(self, folder: Path, depth: int, max_depth: int, state: ScanState = None) -> list:
+        if depth > max_depth:
+            return []
+
+        listing = state.listing(folder) if state else None
+        if listing is None:
+            listing = self._list_folder(folder)
+            if listing is None:
+                return []
+            if state:
+                state.store_listing(folder, *listing)
+        has_content, entries = listing
+
+        chapters = []
         if has_content:
             chapters.append({
                 "name": folder.name,
                 "path": str(folder)
             })
 
-        # 2. Look for archives (chapters) and subfolders
-        try:
-            for item in folder.iterdir():
-                if item.is_dir() and item.name.lower() in ('alts', 'translations'):
-                    continue
-                
-                if self.is_archive(item):
+        for name, is_archive in entries:
+            item = folder / name
+            if is_archive:
+                archive_chapters = state.archive(item) if state else None
+                if archive_chapters is None:
                     # Check inside archive for structure
                     archive_chapters = self.scan_archive(item)
-                    if archive_chapters:
-                        chapters.extend(archive_chapters)
-                    elif self._archive_has_media(item):
+                    if not archive_chapters and self._archive_has_media(item):
                         # Fallback: whole archive is one chapter (all media at root)
-                        chapters.append({
+                        archive_chapters = [{
                             "name": item.stem,
                             "path": str(item)
-                        })
-                        
-                elif item.is_dir():
-                    # Recurse
-                    sub_chapters = self._scan_chapters_recursive(item, depth + 1, max_depth)
-                    chapters.extend(sub_chapters)
-        except (PermissionError, OSError):
-            pass
+                        }]
+                    if state:
+                        state.store_archive(item, archive_chapters)
+                chapters.extend(archive_chapters)
+            else:
+                # Recurse
+                chapters.extend(self._scan_chapters_recursive(item, depth + 1, max_depth, state))
             
         return chapters
 
@@ -593,26 +836,27 @@ class LibraryScanner:
 
     def find_cover(self, series_path: Path, chapters):
         # Look for cover.jpg or cover.png (image only)
-        for item in series_path.iterdir():
-            if item.is_file() and item.name.lower() in ['cover.jpg', 'cover.png']:
-                return item
+        series_entries = fs_cache.scandir(series_path)
+        for entry in series_entries:
+            if entry.name.lower() in ['cover.jpg', 'cover.png'] and entry.is_file():
+                return Path(entry.path)
 
         # If no explicit cover, prefer first image (not video) of first chapter
         if chapters:
             first_chapter = chapters[0]
             first_chapter_path = Path(first_chapter['path'])
             
-            if first_chapter_path.is_dir():
+            if fs_cache.is_dir(first_chapter_path):
                 chapter_name = first_chapter.get('name', first_chapter_path.name)
                 sort_mode = AltManager.get_chapter_sort(str(series_path), chapter_name)
 
-                items = list(first_chapter_path.iterdir())
+                items = [Path(entry.path) for entry in fs_cache.scandir(first_chapter_path)]
                 desc = sort_mode.endswith('_desc')
                 base = sort_mode[:-5] if desc else sort_mode
                 if base == 'mtime':
-                    items.sort(key=lambda p: os.path.getmtime(str(p)), reverse=desc)
+                    items.sort(key=fs_cache.getmtime, reverse=desc)
                 elif base == 'ctime':
-                    items.sort(key=lambda p: os.path.getctime(str(p)), reverse=desc)
+                    items.sort(key=fs_cache.getctime, reverse=desc)
                 else:
                     items.sort(key=lambda p: get_chapter_number(str(p).lower()), reverse=desc)
 
@@ -623,16 +867,17 @@ class LibraryScanner:
                     if self.is_media_file(item):
                         return item
             
-            elif first_chapter_path.is_file():
+            elif fs_cache.is_file(first_chapter_path):
                  return first_chapter_path
 
         # If no chapters, use first image in series folder (prefer images)
-        for item in sorted(series_path.iterdir()):
+        series_items = sorted(Path(entry.path) for entry in series_entries)
+        for item in series_items:
             if self.is_image_file(item):
                 return item
 
         # fallback: any media in series folder
-        for item in sorted(series_path.iterdir()):
+        for item in series_items:
             if self.is_media_file(item):
                 return item
 
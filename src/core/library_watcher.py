@@ -0,0 +1,67 @@
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from src.core import scan_journal
+
+
+class LibraryWatcher(QObject):
+    """Watches library folders and reports which series changed, for targeted rescans.
+
+    Each series folder is watched, then the chapter folders its last scan saw while the
+    MAX_WATCHED budget lasts (inotify and Windows handles are limited). Changes are
+    collected for SETTLE_MS so a copy in progress becomes one rescan.
+    """
+    series_changed = pyqtSignal(list) # series paths
+    SETTLE_MS = 2000
+    MAX_WATCHED = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._watcher.fileChanged.connect(self._on_changed) # archive series
+        self._owner = {} # watched path -> series path
+        self._pending = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.SETTLE_MS)
+        self._timer.timeout.connect(self._flush)
+
+    def watch(self, series_paths: list, refresh=()):
+        """Watch exactly these series. Series in refresh (just rescanned) have their folders re-read."""
+        wanted = set(series_paths)
+        refresh = set(refresh)
+        stale = [path for path, series in self._owner.items() if series not in wanted or series in refresh]
+        if stale:
+            self._watcher.removePaths(stale)
+            for path in stale:
+                del self._owner[path]
+
+        watched = set(self._owner.values())
+        new = [path for path in series_paths if path not in watched]
+        if not new:
+            return
+        folders = scan_journal.directories(new)
+        added = []
+        # Series folders first, so every series gets a watch before any chapter folder does
+        for depth in (0, 1):
+            for series in new:
+                for path in (folders[series][:1] if depth == 0 else folders[series][1:]):
+                    if len(self._owner) >= self.MAX_WATCHED:
+                        break
+                    if path not in self._owner:
+                        self._owner[path] = series
+                        added.append(path)
+        if added:
+            for path in self._watcher.addPaths(added): # the ones that could not be watched
+                self._owner.pop(path, None)
+
+    def _on_changed(self, path: str):
+        series = self._owner.get(path)
+        if series is not None:
+            self._pending.add(series)
+            self._timer.start()
+
+    def _flush(self):
+        paths, self._pending = sorted(self._pending), set()
+        if paths:
+            self.series_changed.emit(paths)
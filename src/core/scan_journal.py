@@ -0,0 +1,160 @@
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.utils.database_utils import db_cursor
+from src.utils import fs_cache
+
+# Status of a series folder at its last check. MISSING: the folder is gone. OFFLINE:
+# the folder holding it is gone too (unplugged drive, unreachable share). Neither
+# removes the series from the library.
+OK, MISSING, OFFLINE = 'ok', 'missing', 'offline'
+
+# FAT keeps mtimes in 2 s steps, so a folder changed this close to its scan could
+# change again without its mtime moving; such folders are listed again next time
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class ScanState:
+    """Folder listings and archive chapters seen by one series scan.
+
+    Given the journal's previous entry, listing() and archive() return the previous
+    result for folders whose mtime and archives whose size and mtime are unchanged, so
+    the scan only re-lists changed folders and re-reads changed archives. changed is
+    set as soon as anything differs from the previous entry.
+    """
+    def __init__(self, root: Path, previous: dict = None):
+        self.root = str(root)
+        self.previous = previous['state'] if previous else {}
+        self.dirs = {} # relative path -> [mtime_ns or None, has_content, [[name, is_archive], ...]]
+        self.archives = {} # relative path -> [size, mtime_ns, chapters]
+        self.files = {} # relative path -> [size, mtime_ns] or None, of files the result depends on
+        self.changed = previous is None
+        self._stats = {}
+        self._racy_after = time.time_ns() - RACY_WINDOW_NS
+
+    def _key(self, path) -> str:
+        # Every path passed in was joined onto the root, so slicing is enough (relpath is slow)
+        path = str(path)
+        return path[len(self.root) + 1:] if path != self.root else '.'
+
+    def _signature(self, path):
+        st = fs_cache.stat(path)
+        return [st.st_size, st.st_mtime_ns] if st is not None else None
+
+    def track(self, path: Path):
+        """Count a change to this file (or its appearing or disappearing) as a change of the series."""
+        key = self._key(path)
+        self.files[key] = self._signature(path)
+        if self.files[key] != self.previous.get('files', {}).get(key):
+            self.changed = True
+
+    def listing(self, folder: Path):
+        """(has_content, entries) of the previous scan if the folder is unchanged, else None."""
+        key = self._key(folder)
+        st = fs_cache.stat(folder)
+        if st is None:
+            self.changed = True
+            return None
+        mtime = st.st_mtime_ns
+        self._stats[key] = mtime if mtime < self._racy_after else None
+        entry = self.previous.get('dirs', {}).get(key)
+        if entry is not None and entry[0] is not None and entry[0] == mtime:
+            self.dirs[key] = entry
+            return entry[1], entry[2]
+        self.changed = True
+        return None
+
+    def store_listing(self, folder: Path, has_content: bool, entries: list):
+        key = self._key(folder)
+        self.dirs[key] = [self._stats.get(key), has_content, entries]
+
+    def archive(self, path: Path):
+        """The archive's chapters from the previous scan if its size and mtime are unchanged, else None."""
+        key = self._key(path)
+        self._stats[key] = self._signature(path)
+        if self._stats[key] is None:
+            self.changed = True
+            return None
+        entry = self.previous.get('archives', {}).get(key)
+        if entry is not None and entry[:2] == self._stats[key]:
+            self.archives[key] = entry
+            return entry[2]
+        self.changed = True
+        return None
+
+    def store_archive(self, path: Path, chapters: list):
+        key = self._key(path)
+        self.archives[key] = list(self._stats.get(key) or [None, None]) + [chapters]
+
+
+def load(path: str):
+    """The journal entry of a series path: {'status', 'state', 'result'}, or None."""
+    with db_cursor() as (_, cursor):
+        cursor.execute("SELECT status, state, result FROM scan_journal WHERE path = ?", (path,))
+        row = cursor.fetchone()
+    if row is None or row['state'] is None:
+        return None
+    try:
+        return {
+            'status': row['status'],
+            'state': json.loads(row['state']),
+            'result': json.loads(row['result']) if row['result'] else None,
+        }
+    except (TypeError, ValueError):
+        return None
+
+
+def save(path: str, state: ScanState, result):
+    with db_cursor() as (conn, cursor):
+        try:
+            cursor.execute("""
+                INSERT INTO scan_journal (path, status, state, result, scanned_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET status = excluded.status, state = excluded.state,
+                    result = excluded.result, scanned_at = excluded.scanned_at
+            """, (path, OK, json.dumps({'dirs': state.dirs, 'archives': state.archives, 'files': state.files}),
+                  json.dumps(result) if result is not None else None, datetime.now()))
+            conn.commit()
+        except Exception as e:
+            print(f"Error saving scan journal for {path}: {e}")
+            conn.rollback()
+
+
+def set_status(path: str, status: str):
+    with db_cursor() as (conn, cursor):
+        try:
+            cursor.execute("""
+                INSERT INTO scan_journal (path, status) VALUES (?, ?)
+                ON CONFLICT(path) DO UPDATE SET status = excluded.status
+            """, (path, status))
+            conn.commit()
+        except Exception as e:
+            print(f"Error saving scan status for {path}: {e}")
+            conn.rollback()
+
+
+def statuses() -> dict:
+    """{path: status} of the series found missing or offline at their last check."""
+    with db_cursor() as (_, cursor):
+        cursor.execute("SELECT path, status FROM scan_journal WHERE status != ?", (OK,))
+        return {row['path']: row['status'] for row in cursor.fetchall()}
+
+
+def directories(paths: list) -> dict:
+    """{series path: [folder paths]} as of each series' last scan, the series folder first."""
+    result = {}
+    with db_cursor() as (_, cursor):
+        for path in paths:
+            cursor.execute("SELECT state FROM scan_journal WHERE path = ?", (path,))
+            row = cursor.fetchone()
+            folders = [path]
+            if row is not None and row['state']:
+                try:
+                    keys = json.loads(row['state'])['dirs']
+                except (TypeError, ValueError, KeyError):
+                    keys = {}
+                folders.extend(os.path.normpath(os.path.join(path, key)) for key in keys if key != '.')
+            result[path] = folders
+    return result
@@ -0,0 +1,324 @@
+import itertools
+import os
+import threading
+from collections import deque
+from enum import IntEnum
+
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+
+_NO_QUEUE = object() # lanes are keyed by TaskLane or None, so "nothing runnable" needs its own marker
+
+
+class TaskPriority(IntEnum):
+    """Priority classes for background work, most urgent first."""
+    VISIBLE = 0     # page currently on screen, chapter loading
+    PREFETCH = 1    # work for pages about to be shown
+    STRIP = 2       # strip-mode neighbors of the visible page
+    THUMBNAIL = 3   # page/chapter/library thumbnails
+    INFO = 4        # metadata, info text, previews
+    BACKGROUND = 5  # scans, indexing, translation, refinement
+
+
+def default_worker_budget() -> int:
+    """One worker per core, leaving a core for the GUI thread (2..8 workers)."""
+    cores = os.cpu_count() or 4
+    return max(2, min(cores - 1, 8))
+
+
+class CancellationToken:
+    """Shared flag telling queued and running workers that their result is no longer wanted.
+
+    Workers check ``cancelled`` between their read/decode/scale stages and stop early.
+    The scheduler drops queued tasks as soon as their token is cancelled.
+    """
+    def __init__(self):
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self):
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def on_cancel(self, callback):
+        """Run callback on cancel, or right away if the token is already cancelled."""
+        with self._lock:
+            if not self._cancelled:
+                self._callbacks.append(callback)
+                return
+        callback()
+
+
+class WorkStats:
+    """Thread-safe counters of useful vs. wasted background work, per worker type.
+
+    Outcomes: ``completed`` (result delivered), ``skipped`` (dropped from the queue
+    before starting), ``aborted.<stage>`` (stopped at a stage checkpoint) and
+    ``discarded`` (ran to completion, but the consumer had moved on).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def record(self, kind: str, outcome: str, stage: str = None):
+        key = outcome if stage is None else f"{outcome}.{stage}"
+        with self._lock:
+            counts = self._counts.setdefault(kind, {})
+            counts[key] = counts.get(key, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {kind: dict(counts) for kind, counts in self._counts.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+
+WORK_STATS = WorkStats()
+
+
+def check_cancelled(token: CancellationToken, kind: str, stage: str) -> bool:
+    """Stage checkpoint for workers: True (and counted as aborted) if the work is stale."""
+    if token is not None and token.cancelled:
+        WORK_STATS.record(kind, "aborted", stage)
+        return True
+    return False
+
+
+_running = threading.local()
+
+
+def current_task_priority() -> TaskPriority:
+    """Priority of the scheduled task running on this thread; VISIBLE elsewhere (e.g. the GUI thread)."""
+    return getattr(_running, "priority", TaskPriority.VISIBLE)
+
+
+def set_thread_priority(priority: TaskPriority):
+    """Run this thread's work at priority; for threads the scheduler does not start (e.g. executor pools)."""
+    _running.priority = TaskPriority(priority)
+
+
+class ScheduledTask(QRunnable):
+    """Wraps a submitted runnable while it waits in, and runs from, the scheduler."""
+    def __init__(self, scheduler, runnable: QRunnable, priority: TaskPriority, lane=None):
+        super().__init__()
+        self.scheduler = scheduler
+        self.runnable = runnable
+        self.priority = TaskPriority(priority)
+        self.lane = lane
+        self.queued = True
+        self.cancelled = False
+
+    def run(self):
+        _running.priority = self.priority
+        try:
+            self.runnable.run()
+        finally:
+            _running.priority = TaskPriority.VISIBLE
+            self.runnable = None
+            self.scheduler._task_done(self)
+
+
+class TaskLane:
+    """A consumer's view of the scheduler with QThreadPool-style ``start``/``clear``.
+
+    Every lane has a default priority and an optional cap on how many of its tasks may
+    run at once, e.g. 1 for work that used to live in a single-threaded pool.
+    """
+    def __init__(self, scheduler, name: str, priority: TaskPriority, max_active: int = None):
+        self.scheduler = scheduler
+        self.name = name
+        self.priority = TaskPriority(priority)
+        self.max_active = max_active
+        self.active = 0
+        self.queued = 0
+
+    def start(self, runnable: QRunnable, priority: TaskPriority = None) -> ScheduledTask:
+        return self.scheduler.start(runnable, self.priority if priority is None else priority, lane=self)
+
+    def clear(self) -> int:
+        """Drop this lane's queued tasks; running tasks are left alone."""
+        return self.scheduler.clear(self)
+
+    def activeThreadCount(self) -> int:
+        return self.active
+
+
+class TaskScheduler:
+    """Application-wide prioritized scheduler for background work.
+
+    All reader, library and dialog workers share one QThreadPool sized by
+    ``default_worker_budget()``. Pending tasks wait in one FIFO per priority class and
+    lane, so a newly submitted visible-page decode is dispatched ahead of any queued
+    thumbnails or scans.
+    Lower classes are also capped cumulatively, which keeps a worker free for
+    VISIBLE/PREFETCH work even when a thumbnail batch is running. BACKGROUND work
+    (scans, rescans, translation) is often long or waits on other pools, so it runs
+    on threads of its own, up to its class limit, and never holds up the rest.
+    """
+    _instance = None
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or default_worker_budget()
+        self.pool = QThreadPool()
+        self._lock = threading.Lock()
+        # priority -> {lane: deque of (seq, task)}; lane-capped work waits without blocking the rest
+        self._queues = {p: {} for p in TaskPriority}
+        self._seq = itertools.count()
+        self._active = 0
+        self._running = {p: 0 for p in TaskPriority}
+        self._queued = {p: 0 for p in TaskPriority}
+
+        n = self.max_workers
+        # Max tasks of this class *or any less urgent class* that may run at once,
+        # BACKGROUND not counted: it has max(1, n // 2) threads beyond the n workers
+        self.class_limits = {
+            TaskPriority.VISIBLE: n,
+            TaskPriority.PREFETCH: n,
+            TaskPriority.STRIP: max(1, n - 1),
+            TaskPriority.THUMBNAIL: max(1, n - 1),
+            TaskPriority.INFO: max(1, n // 2),
+            TaskPriority.BACKGROUND: max(1, n // 2),
+        }
+        self.pool.setMaxThreadCount(n + self.class_limits[TaskPriority.BACKGROUND])
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = TaskScheduler()
+        return cls._instance
+
+    def lane(self, name: str, priority: TaskPriority, max_active: int = None) -> TaskLane:
+        return TaskLane(self, name, priority, max_active)
+
+    def start(self, runnable: QRunnable, priority: TaskPriority = TaskPriority.BACKGROUND, lane: TaskLane = None) -> ScheduledTask:
+        """Queue a runnable at the given priority and dispatch whatever can run now."""
+        task = ScheduledTask(self, runnable, priority, lane)
+        with self._lock:
+            self._queues[task.priority].setdefault(lane, deque()).append((next(self._seq), task))
+            self._queued[task.priority] += 1
+            if lane is not None:
+                lane.queued += 1
+        token = getattr(runnable, 'token', None)
+        if token is not None:
+            # Superseded work leaves the queue without ever taking a worker
+            token.on_cancel(lambda: self._drop_superseded(task))
+        self._dispatch()
+        return task
+
+    def _drop_superseded(self, task: ScheduledTask):
+        runnable = task.runnable
+        if runnable is not None and self.cancel(task):
+            WORK_STATS.record(type(runnable).__name__, "skipped")
+
+    def cancel(self, task: ScheduledTask) -> bool:
+        """Remove a task that has not started yet. Returns False if it already runs."""
+        with self._lock:
+            if not task.queued or task.cancelled:
+                return False
+            self._forget(task)
+            return True
+
+    def clear(self, lane: TaskLane = None) -> int:
+        """Drop queued tasks of one lane, or all queued tasks when lane is None."""
+        removed = 0
+        with self._lock:
+            for lanes in self._queues.values():
+                for task_lane in [lane] if lane is not None else list(lanes):
+                    queue = lanes.pop(task_lane, ())
+                    for _, task in queue:
+                        if task.queued and not task.cancelled:
+                            self._forget(task)
+                            removed += 1
+        return removed
+
+    def queue_depths(self) -> dict:
+        """Number of queued (not yet running) tasks per priority class."""
+        with self._lock:
+            return {p.name.lower(): self._queued[p] for p in TaskPriority}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "active": self._active,
+                "running": {p.name.lower(): self._running[p] for p in TaskPriority},
+                "queued": {p.name.lower(): self._queued[p] for p in TaskPriority},
+            }
+
+    def _forget(self, task: ScheduledTask):
+        # Lazy removal: the queue entry is skipped when it reaches the front
+        task.cancelled = True
+        task.queued = False
+        task.runnable = None
+        self._queued[task.priority] -= 1
+        if task.lane is not None:
+            task.lane.queued -= 1
+
+    def _class_has_room(self, priority: TaskPriority) -> bool:
+        background = self._running[TaskPriority.BACKGROUND]
+        if priority == TaskPriority.BACKGROUND:
+            return background < self.class_limits[priority]
+        if self._active - background >= self.max_workers:
+            return False
+        running_at_or_below = sum(self._running[p] for p in TaskPriority if priority <= p < TaskPriority.BACKGROUND)
+        return running_at_or_below < self.class_limits[priority]
+
+    def _next_queue(self, lanes: dict):
+        """Key of the lane queue holding the oldest runnable task of one class, or _NO_QUEUE."""
+        best = _NO_QUEUE
+        for lane, queue in list(lanes.items()):
+            while queue and queue[0][1].cancelled:
+                queue.popleft()
+            if not queue:
+                del lanes[lane]
+                continue
+            if lane is not None and lane.max_active is not None and lane.active >= lane.max_active:
+                continue
+            if best is _NO_QUEUE or queue[0][0] < lanes[best][0][0]:
+                best = lane
+        return best
+
+    def _dispatch(self):
+        ready = []
+        with self._lock:
+            for priority in TaskPriority:
+                lanes = self._queues[priority]
+                # A class at its limit is skipped whole instead of popping every task in it
+                while lanes and self._class_has_room(priority):
+                    key = self._next_queue(lanes)
+                    if key is _NO_QUEUE:
+                        break
+                    queue = lanes[key]
+                    _, task = queue.popleft()
+                    if not queue:
+                        del lanes[key]
+                    task.queued = False
+                    self._queued[task.priority] -= 1
+                    self._running[task.priority] += 1
+                    self._active += 1
+                    if task.lane is not None:
+                        task.lane.queued -= 1
+                        task.lane.active += 1
+                    ready.append(task)
+
+        for task in ready:
+            self.pool.start(task)
+
+    def _task_done(self, task: ScheduledTask):
+        with self._lock:
+            self._running[task.priority] -= 1
+            self._active -= 1
+            if task.lane is not None:
+                task.lane.active -= 1
+        self._dispatch()
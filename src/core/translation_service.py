@@ -1,5 +1,6 @@
-from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from src.workers.translate_worker import TranslateWorker
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 
 class TranslationService(QObject):
     _instance = None
@@ -7,8 +8,7 @@ class TranslationService(QObject):
 
     def __init__(self):
         super().__init__()
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(1) # Sequential execution
+        self.thread_pool = TaskScheduler.instance().lane("translation", TaskPriority.BACKGROUND, max_active=1) # Sequential execution
         self.tasks = {} # (image_path, lang_code) -> status string
 
     @classmethod
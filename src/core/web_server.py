@@ -10,7 +10,7 @@ from PIL import Image
 import io
 import hashlib
 from src.utils.resource_utils import resource_path
-from src.core.library_manager import LibraryManager
+from src.core.library_manager import LibraryManager, SUMMARY, FULL
 
 
 library_manager = LibraryManager()
@@ -58,16 +58,17 @@ class MangaHandler(http.server.SimpleHTTPRequestHandler):
             return self.serve_static(self.path, 'application/javascript')
 
         elif self.path.startswith('/api/folders'):
-            series = library_manager.get_series()
+            series = library_manager.get_series(SUMMARY)
             self.send_json(series)
             return
 
         elif self.path.startswith('/api/series/'):
             series_name = urllib.parse.unquote(self.path[len('/api/series/'):])
-            all_series = library_manager.get_series()
+            all_series = library_manager.get_series(SUMMARY)
             series = next((s for s in all_series if s['name'] == series_name), None)
 
             if series:
+                library_manager.load_level(series, FULL)
                 # Fill chapters with thumbnails/images
                 valid_chapters = []
                 for chapter in series.get('chapters', []):
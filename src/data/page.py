@@ -2,6 +2,10 @@ from pathlib import Path
 from typing import List
 
 class Page:
+    # Large chapters hold thousands of pages; slots keep each one to a few fixed fields
+    __slots__ = ('images', '_translations', 'current_variant_index', 'active_translation_lang',
+                 'is_spread', 'is_spread_explicit', 'width', 'height')
+
     def __init__(self, images: List[str], translations: dict = None):
         """
         Initialize a Page with a list of image paths (variants).
@@ -9,18 +13,37 @@ class Page:
         translations: Dict[str, str] mapping language code -> file path.
         """
         self.images = images
-        self.translations = translations if translations else {}
+        self._translations = translations if translations else None # Most pages have none
         self.current_variant_index = 0
         self.active_translation_lang = None # Language code if showing translation
         self.is_spread = False # If true, this page should be treated as a double-page spread
         self.is_spread_explicit = False # If true, is_spread was set from config (don't auto-detect)
+        self.width = 0 # Pixel size of the main image, 0 until measured
+        self.height = 0
+
+    @property
+    def translations(self) -> dict:
+        """Dict[str, str] of language code -> path, created on first access."""
+        if self._translations is None:
+            self._translations = {}
+        return self._translations
+
+    @translations.setter
+    def translations(self, value: dict):
+        self._translations = value if value else None
+
+    def has_translation(self, lang: str) -> bool:
+        return self._translations is not None and lang in self._translations
+
+    def translation_paths(self):
+        return self._translations.values() if self._translations else ()
 
     @property
     def path(self) -> str:
         """Return the path of the currently active image (variant or translation)."""
         # If showing translation, return translation path
-        if self.active_translation_lang and self.active_translation_lang in self.translations:
-            return self.translations[self.active_translation_lang]
+        if self.active_translation_lang and self.has_translation(self.active_translation_lang):
+            return self._translations[self.active_translation_lang]
             
         # Otherwise return current variant
         if 0 <= self.current_variant_index < len(self.images):
@@ -47,7 +70,7 @@ class Page:
             
     def set_translation(self, lang: str):
         """Switch to showing a translation."""
-        if lang in self.translations:
+        if self.has_translation(lang):
             self.active_translation_lang = lang
             
     def clear_translation(self):
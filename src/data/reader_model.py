@@ -1,9 +1,6 @@
 from typing import List, Union
 from pathlib import Path
 import os
-import random
-from PyQt6.QtGui import QImageReader
-
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.enums import ViewMode
@@ -11,6 +8,8 @@ from src.utils.img_utils import get_chapter_number
 from src.utils.str_utils import natural_sort_key
 from src.data.page import Page
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import TaskScheduler, TaskPriority, CancellationToken
+from src.workers.view_workers import SpreadDetectionWorker
 
 class ReaderModel(QObject):
     refreshed = pyqtSignal()
@@ -18,6 +17,7 @@ class ReaderModel(QObject):
     double_image_loaded = pyqtSignal(str, str)
     layout_updated = pyqtSignal(ViewMode)
     page_updated = pyqtSignal(int)
+    spreads_updated = pyqtSignal()
 
     def __init__(self, series: object, manga_dirs: List[object], index:int, start_file: str = None, images: List[str] = None, language: str = 'ko', chapter_extras: dict = None):
         super().__init__()
@@ -28,6 +28,7 @@ class ReaderModel(QObject):
         self.view_mode = ViewMode.SINGLE
         self.images: List[Page] = []
         self._image_map = {} # Maps image path -> page_index
+        self._page_positions = {} # Maps id(page) -> page_index
         # Map of chapter_path -> list of additional folder paths whose contents
         # should be loaded together with the chapter. Populated when the user
         # checks "Treat subfolders as part of their parent chapter" at import.
@@ -35,8 +36,12 @@ class ReaderModel(QObject):
         
         # Double Mode Virtual Layout Logic
         self._layout_pairs = []
-        self._page_to_layout_index = {} # Maps Real Page Index -> Layout Index
+        self._layout_starts = [] # Layout Index -> first Real Page Index of the pair
+        self._page_to_layout_index = [] # Real Page Index -> Layout Index
         self._rtl = True  # Right-to-left reading direction (default)
+        self._spread_token = None # Cancels the running spread detection
+        self._spread_updates = {} # main image path -> detected is_spread, saved when done
+        self._spreads_checked_for = None # Chapter path detection last ran for
 
         from src.utils.str_utils import natural_sort_key
         
@@ -107,9 +112,14 @@ class ReaderModel(QObject):
         Set images. 
         Accepts either raw paths (strings) or already grouped Page objects.
         """
+        self._cancel_spread_detection()
+        self._spreads_checked_for = None
         if not images:
             self.images = []
+            self._page_positions = {}
             self._layout_pairs = []
+            self._layout_starts = []
+            self._page_to_layout_index = []
             return
 
         # Check if first item is Page object
@@ -130,25 +140,42 @@ class ReaderModel(QObject):
 
         # Load RTL setting for this chapter
         if self.series and self.manga_dir:
-            if isinstance(self.manga_dir, dict):
-                cp = self.manga_dir.get('path', '')
-                ch_name = self.manga_dir.get('name', Path(cp.split('|')[0]).stem if '|' in cp else Path(cp).name)
-            else:
-                ch_name = Path(str(self.manga_dir)).name
-            series_path_str = str(self.series['path']) if isinstance(self.series, dict) else str(self.series)
-            self._rtl = AltManager.get_chapter_rtl(series_path_str, ch_name)
+            self._rtl = AltManager.get_chapter_rtl(self._series_path(), self._chapter_name())
 
         # Build Layout (Initial)
         self._build_double_layout()
 
+    def _series_path(self) -> str:
+        return str(self.series['path']) if isinstance(self.series, dict) else str(self.series)
+
+    def _chapter_name(self) -> str:
+        """Key of the current chapter in the series' info.json."""
+        if isinstance(self.manga_dir, dict):
+            cp = self.manga_dir.get('path', '')
+            return self.manga_dir.get('name', Path(cp.split('|')[0]).stem if '|' in cp else Path(cp).name)
+        return Path(str(self.manga_dir)).name
+
     def _rebuild_map(self):
-        """Rebuild the hash map for O(1) lookup."""
+        """Rebuild the hash maps for O(1) lookup."""
         self._image_map.clear()
+        self._page_positions = {id(page): i for i, page in enumerate(self.images)}
         for i, page in enumerate(self.images):
-            # Map variants using normalized path
+            # Map variants using normalized path, sharing the page's string when already normal
             for img_path in page.images:
                  norm = os.path.normpath(img_path)
-                 self._image_map[norm] = i
+                 self._image_map[img_path if norm == img_path else norm] = i
+
+    def _index_of(self, page: Page) -> int:
+        """O(1) position of a Page object in self.images, or -1."""
+        idx = self._page_positions.get(id(page), -1)
+        if 0 <= idx < len(self.images) and self.images[idx] is page:
+            return idx
+        # Map is stale (pages replaced without a rebuild)
+        for i, p in enumerate(self.images):
+            if p is page:
+                self._rebuild_map()
+                return i
+        return -1
 
     def get_page_index(self, path: str) -> int:
         """O(1) lookup for page index given a path."""
@@ -166,50 +193,79 @@ class ReaderModel(QObject):
         
         # Apply to ALL pages immediately
         for page in self.images:
-            if self.preferred_language and self.preferred_language in page.translations:
+            if self.preferred_language and page.has_translation(self.preferred_language):
                  page.set_translation(self.preferred_language)
             elif self.preferred_language is None:
                  page.clear_translation()
-            elif self.preferred_language and self.preferred_language not in page.translations:
+            elif self.preferred_language and not page.has_translation(self.preferred_language):
                  # Preference set but translation missing -> revert to original
                  page.clear_translation()
 
         self.refresh() # Trigger full reload
 
-    def _build_double_layout(self):
+    def _build_double_layout(self, start_page: int = 0, last_changed: int = None):
         """
         Builds the virtual layout for double page view.
         Spreads take a full slot. Non-spreads are paired (Right, Left) for RTL.
         Orphans are paired with "placeholder".
+
+        With start_page > 0 only the pairs from the one before start_page's pair onward
+        are rebuilt. Pairing restarts with an empty buffer at that pair's first page,
+        and once the new pairing lines up with an old pair boundary past last_changed,
+        the old tail is reused (shifted) instead of being paired again.
         """
-        self._layout_pairs = []
-        self._page_to_layout_index = {}
-        
+        n = len(self.images)
         if not self.images:
+            self._layout_pairs = []
+            self._layout_starts = []
+            self._page_to_layout_index = []
             return
 
+        pairs = self._layout_pairs
+        starts = self._layout_starts # Layout Index -> first Real Page Index of the pair
+        page_map = self._page_to_layout_index
+        incremental = (start_page > 0 or last_changed is not None) and len(page_map) == n and bool(pairs)
+        if not incremental:
+            pairs, starts, page_map = [], [], [0] * n
+            self._layout_pairs, self._layout_starts, self._page_to_layout_index = pairs, starts, page_map
+            start_layout = begin = 0
+        else:
+            # Step back one pair: a page that stops being a spread may re-absorb the orphan flushed before it
+            start_layout = max(0, page_map[min(start_page, n - 1)] - 1)
+            begin = starts[start_layout]
+        if last_changed is None:
+            last_changed = start_page
+
+        new_pairs = []
+        new_starts = []
+
+        def add_pair(pair, first_idx, *members):
+            new_pairs.append(pair)
+            new_starts.append(first_idx)
+            for idx in members:
+                page_map[idx] = start_layout + len(new_pairs) - 1
+
         buffer = [] # Holds single pages ((index, page)) waiting for a pair
-        
-        for i, page in enumerate(self.images):
+        resume = None # (page index, old layout index) where the old tail takes over
+
+        for i in range(begin, n):
+            page = self.images[i]
+            if incremental and not buffer and i > last_changed:
+                old_layout = page_map[i]
+                if starts[old_layout] == i:
+                    # Same state as the old layout from here on: reuse its tail
+                    resume = (i, old_layout)
+                    break
+
             if page.is_spread:
                 if buffer:
-                    # Flush orphan (Preceding) -> Right side (First slot)
-                    # Pair with Placeholder on Left
-                    # Pair: ("placeholder", OrphanPage) [Left, Right] logic? 
-                    # Existing ReaderView: item2 (Right) is loaded from pair[1]?
-                    # Let's check ReaderModel._load_double_images usage later. 
-                    # Usually RTL: [Left=Next, Right=Curr]. 
-                    # If orphan is 'Right' (First), then Left is 'Placeholder'.
+                    # Flush orphan (Preceding) -> Right side (First slot), placeholder on Left
                     orphan_idx, orphan_page = buffer.pop(0)
-                    pair = ("placeholder", orphan_page)
-                    self._layout_pairs.append(pair)
-                    self._page_to_layout_index[orphan_idx] = len(self._layout_pairs) - 1
-                
+                    add_pair(("placeholder", orphan_page), orphan_idx, orphan_idx)
+
                 # Add Spread (Spread, None)
-                pair = (page, None)
-                self._layout_pairs.append(pair)
-                self._page_to_layout_index[i] = len(self._layout_pairs) - 1
-                
+                add_pair((page, None), i, i)
+
             else:
                 if buffer:
                     # Current (i) is logically AFTER Preceding.
@@ -217,23 +273,45 @@ class ReaderModel(QObject):
                     # LTR: [Left=Preceding(older), Right=Current(newer)]
                     pre_idx, pre_page = buffer.pop(0)
                     pair = (page, pre_page) if self._rtl else (pre_page, page)
-                    self._layout_pairs.append(pair)
-                    self._page_to_layout_index[i] = len(self._layout_pairs) - 1
-                    self._page_to_layout_index[pre_idx] = len(self._layout_pairs) - 1
+                    add_pair(pair, pre_idx, i, pre_idx)
                 else:
                     buffer.append((i, page))
-                    
+
         if buffer:
-            # Trailing orphan -> Right side?
-            # If [P1, P2, P3]. P3 is alone. P3 is Right. Left is Ph.
+            # Trailing orphan -> Right side, placeholder on Left
             orphan_idx, orphan_page = buffer.pop(0)
-            pair = ("placeholder", orphan_page)
-            self._layout_pairs.append(pair)
-            self._page_to_layout_index[orphan_idx] = len(self._layout_pairs) - 1
+            add_pair(("placeholder", orphan_page), orphan_idx, orphan_idx)
+
+        if resume is None:
+            pairs[start_layout:] = new_pairs
+            starts[start_layout:] = new_starts
+        else:
+            i, old_layout = resume
+            pairs[start_layout:old_layout] = new_pairs
+            starts[start_layout:old_layout] = new_starts
+            shift = start_layout + len(new_pairs) - old_layout
+            if shift:
+                page_map[i:] = [idx + shift for idx in page_map[i:]]
+
+    def set_spreads(self, updates: dict):
+        """
+        Apply spread flags {page_index: is_spread} and repair the double layout
+        incrementally. Returns True if any flag changed.
+        """
+        changed = [i for i, flag in updates.items()
+                   if 0 <= i < len(self.images) and self.images[i].is_spread != flag]
+        if not changed:
+            return False
+        for i in changed:
+            self.images[i].is_spread = updates[i]
+        self._build_double_layout(min(changed), max(changed))
+        return True
 
     def _get_current_layout_index(self) -> int:
         if not self._layout_pairs: return -1
-        return self._page_to_layout_index.get(self.current_index, 0)
+        if 0 <= self.current_index < len(self._page_to_layout_index):
+            return self._page_to_layout_index[self.current_index]
+        return 0
 
     def _snap_to_pair_lead(self):
         """
@@ -259,11 +337,9 @@ class ReaderModel(QObject):
             candidate = left_item
 
         if candidate:
-            try:
-                idx = self.images.index(candidate)
+            idx = self._index_of(candidate)
+            if idx >= 0:
                 self.current_index = idx
-            except ValueError:
-                pass
 
     def load_image(self):
         if not self.images:
@@ -306,78 +382,73 @@ class ReaderModel(QObject):
 
     def auto_detect_spreads(self):
         """
-        Detects double-page spreads based on aspect ratio.
+        Detects double-page spreads based on aspect ratio, on a background worker.
+        Results stream into the double layout and are saved, so each chapter is
+        measured once.
         """
         if not self.series or not self.manga_dir or not self.images:
             return
-
-        # 1. Detect if "Manga" (consistent aspect ratio)
-        # Sample random 5 pages from middle 50%
-        valid_indices = range(len(self.images))
-        if len(self.images) > 10:
-            start = len(self.images) // 4
-            end = len(self.images) * 3 // 4
-            valid_indices = range(start, end)
-        
-        # Taking up to 5 samples
-        sample_indices = random.sample(valid_indices, min(5, len(valid_indices)))
-        ratios = []
-        
-        for i in sample_indices:
-            path = self.images[i].path
-            if '|' in path:
-                continue
-            reader = QImageReader(path)
-            size = reader.size()
-            if size.isValid() and size.height() > 0:
-                ratios.append(size.width() / size.height())
-        
-        if not ratios:
+        chapter_path = self.current_chapter_path()
+        if self._spreads_checked_for == chapter_path:
             return
+        self._spreads_checked_for = chapter_path
 
-        median_ratio = sorted(ratios)[len(ratios) // 2]
-        
-        # Check consistency (all within 10% of median)
-        if median_ratio == 0: return
+        chapter_name = self._chapter_name()
+        if AltManager.get_spreads_detected(self._series_path(), chapter_name):
+            return
 
-        is_consistent = all(abs(r - median_ratio) / median_ratio < 0.1 for r in ratios)
-        
-        if not is_consistent:
+        self._cancel_spread_detection()
+        token = CancellationToken()
+        self._spread_token = token
+        self._spread_updates = {}
+
+        pages = [(i, page.images[0]) for i, page in enumerate(self.images) if page.images]
+        skip = {i for i, page in enumerate(self.images) if page.is_spread_explicit}
+        worker = SpreadDetectionWorker(pages, skip, token)
+        worker.signals.measured.connect(lambda batch: self._on_spreads_measured(token, batch))
+        worker.signals.finished.connect(lambda complete: self._on_spread_detection_finished(token, chapter_name, complete))
+        TaskScheduler.instance().start(worker, TaskPriority.INFO)
+
+    def _cancel_spread_detection(self):
+        if self._spread_token is not None:
+            self._spread_token.cancel()
+            self._spread_token = None
+
+    def _on_spreads_measured(self, token: CancellationToken, batch: dict):
+        if token is not self._spread_token or token.cancelled:
             return
-            
-        # 2. Detect spreads
-        common_ratio = median_ratio
-        # Spread is roughly double the width, so ratio should be ~2x common_ratio
-        spread_threshold = common_ratio * 1.5 
-        
-        updates = {}
-        chapter_name = Path(self.manga_dir).name
-        
-        for page in self.images:
-            # Skip if user explicitly set it (loaded from config as explicit) or manually handled
-            if page.is_spread_explicit:
-                continue
-                
-            path = page.path
-            if '|' in path:
+        flags = {}
+        for i, (width, height, is_spread) in batch.items():
+            if not (0 <= i < len(self.images)):
                 continue
+            page = self.images[i]
+            page.width, page.height = width, height
+            if not page.is_spread_explicit and page.is_spread != is_spread:
+                flags[i] = is_spread
+                self._spread_updates[page.images[0]] = is_spread
+        before = self._current_pair()
+        if not self.set_spreads(flags):
+            return
 
-            reader = QImageReader(path)
-            size = reader.size()
-            
-            if size.isValid() and size.height() > 0:
-                 ratio = size.width() / size.height()
-                 
-                 is_spread = ratio > spread_threshold
-                 
-                 if page.is_spread != is_spread:
-                     page.is_spread = is_spread
-                     updates[path] = is_spread
-        
-        # 3. Save updates
-        if updates:
-             AltManager.save_spread_states(str(self.series['path']), chapter_name, updates)
-             self.refresh()
+        if self.view_mode == ViewMode.DOUBLE:
+            self._snap_to_pair_lead()
+            # Only reload if the pair on screen was affected
+            if self._current_pair() != before:
+                self.load_image()
+        self.spreads_updated.emit()
+
+    def _current_pair(self):
+        layout_idx = self._get_current_layout_index()
+        if 0 <= layout_idx < len(self._layout_pairs):
+            return self._layout_pairs[layout_idx]
+        return None
+
+    def _on_spread_detection_finished(self, token: CancellationToken, chapter_name: str, complete: bool):
+        if token is not self._spread_token or token.cancelled:
+            return
+        self._spread_token = None
+        AltManager.save_spread_states(self._series_path(), chapter_name, self._spread_updates, mark_detected=complete)
+        self._spread_updates = {}
 
     def navigate(self, direction: int) -> bool:
         """
@@ -408,13 +479,11 @@ class ReaderModel(QObject):
                       candidate = left
                       
                  if candidate:
-                      try:
-                          idx = self.images.index(candidate)
+                      idx = self._index_of(candidate)
+                      if idx >= 0:
                           self.current_index = idx
                           self.load_image()
                           return True
-                      except ValueError:
-                          pass 
                           
              return False # Boundary
  
@@ -487,6 +556,7 @@ class ReaderModel(QObject):
 
         self.chapter_index = index
         self.manga_dir = self.chapters[self.chapter_index]
+        self._cancel_spread_detection()
         self.images = [] # force reload
         return True
 
@@ -499,6 +569,7 @@ class ReaderModel(QObject):
                 return False
             self.chapter_index = new_index
             self.manga_dir = self.chapters[self.chapter_index]
+            self._cancel_spread_detection()
             self.images = []
             return True
         return False
@@ -517,6 +588,7 @@ class ReaderModel(QObject):
         if self.view_mode == ViewMode.DOUBLE:
             self._build_double_layout()
             self._snap_to_pair_lead()
+            self.auto_detect_spreads()
         self.load_image()
         self.layout_updated.emit(self.view_mode)
 
@@ -4,7 +4,7 @@ from PyQt6.QtGui import (
     QIcon, QPixmap, QPalette, QColor, QAction,
     QPainter, QLinearGradient, QMouseEvent, QImage)
 from PyQt6.QtCore import (
-    Qt, QThreadPool, pyqtSignal, QRectF, 
+    Qt, pyqtSignal, QRectF, 
     QObject, QRunnable, QTimer, QSize
 )
 
@@ -21,6 +21,7 @@ from src.utils.archive_utils import ARCHIVE_EXTS, ZIP_EXTS, split_virtual_path
 from src.ui.styles import FLAT_BUTTON_STYLE, ARCHIVE_BADGE_STYLE, LABEL_WHITE_STYLE
 from src.utils.resource_utils import resource_path
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 
 class ChapterListLoaderSignals(QObject):
     chapter_processed = pyqtSignal(object, int, int)  # chapter, page_count, index
@@ -555,8 +556,7 @@ class ChapterListView(QWidget):
         self.series = series
         self.library_manager = library_manager
         self.chapter_widgets = []
-        self.threadpool = QThreadPool()
-        self.threadpool.setMaxThreadCount(1)
+        self.threadpool = TaskScheduler.instance().lane("library.chapters", TaskPriority.THUMBNAIL, max_active=1)
 
         self.BATCH_SIZE = 20
         self.current_batch_index = 0
@@ -575,7 +575,7 @@ class ChapterListView(QWidget):
         self.background_pixmap = QPixmap()
         cover_image = self.series.get('cover_image')
         if cover_image:
-            # We must keep a reference to worker to prevent GC if needed, but QThreadPool manages it
+            # We must keep a reference to worker to prevent GC if needed, but the scheduler manages it
             worker = BackgroundCoverWorker(cover_image)
             worker.signals.finished.connect(self._on_background_cover_loaded)
             self.threadpool.start(worker)
@@ -1018,7 +1018,7 @@ class ChapterListView(QWidget):
         page_count_loader.signals.chapter_processed.connect(self.on_chapter_page_count_loaded)
         page_count_loader.signals.finished.connect(lambda: self._on_loader_finished(page_count_loader))
         self._active_loaders.append(page_count_loader)
-        self.threadpool.start(page_count_loader)
+        self.threadpool.start(page_count_loader, TaskPriority.INFO)
 
         thumb_loader = ItemLoader(target_chapters, 0, item_type='chapter', thumb_width=150, thumb_height=75, library_manager=self.library_manager)
         thumb_loader.signals.item_loaded.connect(self.on_thumbnail_loaded)
@@ -1068,7 +1068,7 @@ class ChapterListView(QWidget):
         worker.signals.finished.connect(on_finished)
         worker.signals.error.connect(on_error)
         
-        QThreadPool.globalInstance().start(worker)
+        TaskScheduler.instance().start(worker, TaskPriority.BACKGROUND)
 
     def on_add_translation_requested(self, chapter, widget):
         series_path = str(self.series['path'])
@@ -1114,7 +1114,7 @@ class ChapterListView(QWidget):
             worker.signals.finished.connect(on_finished)
             worker.signals.error.connect(on_error)
             
-            QThreadPool.globalInstance().start(worker)
+            TaskScheduler.instance().start(worker, TaskPriority.BACKGROUND)
 
     def on_edit_spreads_requested(self, chapter):
         from src.ui.components.edit_spreads_dialog import EditSpreadsDialog
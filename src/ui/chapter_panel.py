@@ -6,11 +6,12 @@ import subprocess
 from PyQt6.QtWidgets import QLabel, QMenu
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
-from PyQt6.QtGui import QAction, QCursor, QKeySequence, QPixmap
+from PyQt6.QtGui import QAction, QCursor, QKeySequence
 from src.ui.components.collapsible_panel import CollapsiblePanel
 from src.ui.page_thumbnail import PageThumbnail
 from src.workers.thumbnail_worker import ChapterThumbnailWorker
-from src.utils.img_utils import draw_text_on_image, load_thumbnail_from_path, load_thumbnail_from_virtual_path
+from src.utils.img_utils import draw_text_on_image, load_thumbnail_from_path, load_thumbnail_from_virtual_path, pixmap_from_image
+from src.utils.memory_budget import MemoryBudget, image_bytes
 from src.data.reader_model import ReaderModel
 
 class ChapterPanel(CollapsiblePanel):
@@ -31,6 +32,9 @@ class ChapterPanel(CollapsiblePanel):
         self.batch_timer.timeout.connect(self._add_next_batch)
 
         self._thumb_generation = 0
+        # Per panel: every ReaderView has its own chapter panel
+        self._thumbs_consumer = consumer = f"thumbs.chapter#{id(self)}"
+        self.destroyed.connect(lambda: MemoryBudget.instance().release_all(consumer))
 
         self.navigate_first.connect(self._go_first)
         self.navigate_prev.connect(self._go_prev)
@@ -83,6 +87,7 @@ class ChapterPanel(CollapsiblePanel):
         self.current_chapter_thumbnail = None
 
         self._thumb_generation += 1
+        MemoryBudget.instance().release_all(self._thumbs_consumer)
         self.chapters_to_load = chapters
         self.current_batch_index = 0
         self.last_subfolder = None
@@ -131,7 +136,8 @@ class ChapterPanel(CollapsiblePanel):
         if generation != self._thumb_generation:
             return
         if index < len(self.chapter_thumbnail_widgets):
-            pixmap = QPixmap.fromImage(qimg)
+            pixmap = pixmap_from_image(qimg, "thumb.chapter")
+            MemoryBudget.instance().charge(self._thumbs_consumer, index, image_bytes(pixmap), pinned=True)
             self.chapter_thumbnail_widgets[index].set_pixmap(pixmap)
 
     def _update_chapter_selection(self, index):
@@ -1,8 +1,11 @@
 from PyQt6.QtWidgets import QSlider, QStyleOptionSlider, QStyle
-from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtCore import Qt, QRect, QPoint, pyqtSignal
 from PyQt6.QtGui import QPainter, QColor, QBrush
 
 class AltSlider(QSlider):
+    drag_started = pyqtSignal()
+    drag_finished = pyqtSignal()
+
     def __init__(self, orientation=Qt.Orientation.Horizontal, parent=None):
         super().__init__(orientation, parent)
         self.alt_indices = set()
@@ -10,6 +13,15 @@ class AltSlider(QSlider):
         self.hovered_index = -1
         self._dragging = False
 
+    def is_dragging(self) -> bool:
+        return self._dragging
+
+    def handle_center(self) -> QPoint:
+        """Center of the handle in widget coordinates."""
+        opt = QStyleOptionSlider()
+        self.initStyleOption(opt)
+        return self.style().subControlRect(QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderHandle, self).center()
+
     def set_alt_indices(self, indices):
         self.alt_indices = set(indices)
         self.update()
@@ -80,6 +92,7 @@ class AltSlider(QSlider):
             handle_rect = self.style().subControlRect(QStyle.ComplexControl.CC_Slider, opt, QStyle.SubControl.SC_SliderHandle, self)
             if handle_rect.contains(event.position().toPoint()):
                 self._dragging = True
+                self.drag_started.emit()
                 event.accept()
                 return
 
@@ -89,6 +102,7 @@ class AltSlider(QSlider):
                 return
 
             self._dragging = True
+            self.drag_started.emit()
             self.setValue(self._value_from_pos(event.position().x()))
             event.accept()
             return
@@ -98,6 +112,7 @@ class AltSlider(QSlider):
     def mouseReleaseEvent(self, event):
         if self._dragging and event.button() == Qt.MouseButton.LeftButton:
             self._dragging = False
+            self.drag_finished.emit()
             event.accept()
             return
         super().mouseReleaseEvent(event)
@@ -5,12 +5,13 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QCheckBox, QSpinBox, QGroupBox, QComboBox, QScrollArea, QWidget, QFrame, QProgressBar
 )
-from PyQt6.QtCore import Qt, QThreadPool, pyqtSignal, QObject
+from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QPixmap, QImageReader
 
 from src.utils.img_utils import load_thumbnail_from_path
 from src.workers.alt_refiner_worker import AltRefinerWorker
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 
 PREVIEW_W = 120
 PREVIEW_H = 160
@@ -375,7 +376,7 @@ class BatchRefineDialog(QDialog):
             worker.signals.error.connect(lambda m, r=row: r.set_status(f"Error", "#F44336"))
             worker.signals.error.connect(self._check_all_finished)
             
-            QThreadPool.globalInstance().start(worker)
+            TaskScheduler.instance().start(worker, TaskPriority.BACKGROUND)
 
     def _check_all_finished(self):
         active_rows = [row for row in self.rows if row.cb_active.isChecked()]
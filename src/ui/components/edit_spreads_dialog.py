@@ -6,10 +6,11 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QCheckBox, QFrame, QSizePolicy, QComboBox,
     QRadioButton, QButtonGroup
 )
-from PyQt6.QtCore import Qt, QThreadPool, QTimer
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QPixmap
 
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 from src.workers.thumbnail_worker import ThumbnailWorker
 from src.utils.img_utils import load_thumbnail_from_path, load_thumbnail_from_virtual_path
 
@@ -118,8 +119,7 @@ class EditSpreadsDialog(QDialog):
         self.series_path = series_path
         self._chapter = chapter
         self.items: list = []
-        self._pool = QThreadPool()
-        self._pool.setMaxThreadCount(4)
+        self._pool = TaskScheduler.instance().lane("spreads.thumbnails", TaskPriority.THUMBNAIL)
         self._rebuild_timer = QTimer(self)
         self._rebuild_timer.setSingleShot(True)
         self._rebuild_timer.setInterval(30)
@@ -334,17 +334,16 @@ class EditSpreadsDialog(QDialog):
         self._rebuild_pairs_view()
 
     def _auto_detect(self):
-        from PyQt6.QtGui import QImageReader
+        from src.utils.img_utils import read_image_size
 
-        candidates = [p for p in self.pages if '|' not in p.path and not p.is_spread_explicit]
+        candidates = [p for p in self.pages if not p.is_spread_explicit]
         if not candidates:
             return
 
         sample = random.sample(candidates, min(5, len(candidates)))
         ratios = []
         for page in sample:
-            reader = QImageReader(page.path)
-            size = reader.size()
+            size = read_image_size(page.path)
             if size.isValid() and size.height() > 0:
                 ratios.append(size.width() / size.height())
 
@@ -357,10 +356,9 @@ class EditSpreadsDialog(QDialog):
 
         threshold = median_ratio * 1.5
         for item in self.items:
-            if item.page.is_spread_explicit or '|' in item.page.path:
+            if item.page.is_spread_explicit:
                 continue
-            reader = QImageReader(item.page.path)
-            size = reader.size()
+            size = read_image_size(item.page.path)
             if size.isValid() and size.height() > 0:
                 item.spread_check.blockSignals(True)
                 item.spread_check.setChecked((size.width() / size.height()) > threshold)
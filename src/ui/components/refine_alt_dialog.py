@@ -5,13 +5,14 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QCheckBox, QSpinBox, QGroupBox, QComboBox
 )
-from PyQt6.QtCore import Qt, QThreadPool
+from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap, QImageReader
 import cv2
 
 from src.utils.img_utils import load_thumbnail_from_path
 from src.workers.alt_refiner_worker import AltRefinerWorker
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 
 PREVIEW_W = 240
 PREVIEW_H = 320
@@ -273,7 +274,7 @@ class RefineAltDialog(QDialog):
         )
         worker.signals.finished.connect(self._on_preview_ready)
         worker.signals.error.connect(self._on_error)
-        QThreadPool.globalInstance().start(worker)
+        TaskScheduler.instance().start(worker, TaskPriority.VISIBLE)
 
     def _on_preview_ready(self, temp_path):
         qimg = load_thumbnail_from_path(temp_path, PREVIEW_W, PREVIEW_H)
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QFrame, QLabel, QVBoxLayout
+from PyQt6.QtCore import Qt, QPoint
+
+from src.workers.thumbnail_worker import ThumbnailWorker
+from src.core.task_scheduler import CancellationToken, TaskPriority
+from src.utils.img_utils import pixmap_from_image
+from src.utils.memory_budget import MemoryBudget, image_bytes
+
+
+class ScrubPreview(QFrame):
+    """
+    Floating page thumbnail shown above the page slider while its handle is dragged.
+
+    Thumbnails come from the thumbnail cache through ThumbnailWorker, so scrubbing
+    never starts a full-page decode. The page under the handle is requested at
+    THUMBNAIL priority and evenly spaced pages are prefetched at BACKGROUND priority,
+    so a fast scrub always finds a nearby page to show.
+    """
+    THUMB_WIDTH = 150
+    THUMB_HEIGHT = 200
+    PREFETCH_COUNT = 48
+    MAX_CACHED = 256
+
+    def __init__(self, parent, lane, load_func):
+        super().__init__(parent)
+        self.lane = lane
+        self.load_func = load_func # path -> QImage, e.g. PagePanel._load_thumbnail
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setStyleSheet("QFrame { background-color: rgba(0, 0, 0, 200); border-radius: 4px; }")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(2)
+        self.image_label = QLabel()
+        self.image_label.setFixedSize(self.THUMB_WIDTH, self.THUMB_HEIGHT)
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setStyleSheet("background: transparent;")
+        self.page_label = QLabel()
+        self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.page_label.setStyleSheet("background: transparent; color: white;")
+        layout.addWidget(self.image_label)
+        layout.addWidget(self.page_label)
+        self.adjustSize()
+        self.hide()
+
+        self._paths = [] # slider value -> thumbnail path
+        self._cache = OrderedDict() # path -> QPixmap, LRU first
+        self._requested = set()
+        self._token = CancellationToken()
+        self._current = -1
+        # Per instance: every ReaderView has its own preview
+        self._consumer = consumer = f"thumbs.scrub#{id(self)}"
+        MemoryBudget.instance().register(consumer, self._evict)
+        self.destroyed.connect(lambda: MemoryBudget.instance().unregister(consumer))
+
+    def begin(self, paths: list):
+        """Start a scrub over the given slider positions and prefetch a spread of them."""
+        self._token.cancel()
+        self._token = CancellationToken()
+        self._requested.clear()
+        self._paths = paths
+        self._current = -1
+        if not paths:
+            return
+        step = max(1, len(paths) // self.PREFETCH_COUNT)
+        for value in range(0, len(paths), step):
+            self._request(value, TaskPriority.BACKGROUND)
+
+    def show_value(self, value: int, anchor: QPoint):
+        """Show the preview for a slider value, centered above anchor (parent coordinates)."""
+        if not (0 <= value < len(self._paths)):
+            return
+        self._current = value
+        self.page_label.setText(str(value + 1))
+        pixmap = self._cache.get(self._paths[value])
+        if pixmap is None:
+            self._request(value, TaskPriority.THUMBNAIL)
+            pixmap = self._nearest_cached(value)
+        else:
+            self._cache.move_to_end(self._paths[value])
+        if pixmap is not None:
+            self.image_label.setPixmap(pixmap)
+
+        x = anchor.x() - self.width() // 2
+        x = max(0, min(x, self.parentWidget().width() - self.width()))
+        self.move(x, anchor.y() - self.height())
+        self.show()
+        self.raise_()
+
+    def end(self):
+        """Hide the preview and drop requests that have not started yet."""
+        self._token.cancel()
+        self._token = CancellationToken()
+        self._requested.clear()
+        self._current = -1
+        self.hide()
+
+    def _nearest_cached(self, value: int):
+        step = max(1, len(self._paths) // self.PREFETCH_COUNT)
+        for offset in range(1, step + 1):
+            for candidate in (value - offset, value + offset):
+                if 0 <= candidate < len(self._paths):
+                    pixmap = self._cache.get(self._paths[candidate])
+                    if pixmap is not None:
+                        return pixmap
+        return None
+
+    def _request(self, value: int, priority: TaskPriority):
+        path = self._paths[value]
+        if not path or path in self._cache or path in self._requested:
+            return
+        self._requested.add(path)
+        worker = ThumbnailWorker(value, path, self.load_func, self._token)
+        worker.signals.finished.connect(lambda idx, img, p=path: self._on_thumbnail_loaded(p, idx, img))
+        self.lane.start(worker, priority)
+
+    def _on_thumbnail_loaded(self, path: str, value: int, qimg):
+        pixmap = pixmap_from_image(qimg, "thumb.scrub")
+        self._cache[path] = pixmap
+        MemoryBudget.instance().charge(self._consumer, path, image_bytes(pixmap))
+        while len(self._cache) > self.MAX_CACHED:
+            old_path, _ = self._cache.popitem(last=False)
+            MemoryBudget.instance().release(self._consumer, old_path)
+        if value == self._current and self.isVisible():
+            self.image_label.setPixmap(pixmap)
+
+    def _evict(self, path: str):
+        self._cache.pop(path, None)
+
+    def clear(self):
+        """Forget cached thumbnails, e.g. when the chapter changes."""
+        self.end()
+        self._cache.clear()
+        self._paths = []
+        MemoryBudget.instance().release_all(self._consumer)
@@ -1,5 +1,6 @@
 from pathlib import Path
 import multiprocessing
+from bisect import bisect_left
 import os
 import socket
 import io
@@ -9,15 +10,18 @@ from PyQt6.QtWidgets import (
     QMessageBox, QFileDialog, QLineEdit, QHBoxLayout, QDialog, QMenu, QApplication, QGridLayout, QCompleter, QStackedWidget
 )
 from PyQt6.QtGui import QPixmap, QShortcut, QKeySequence, QIcon, QCursor, QPainter, QBrush, QColor, QImage
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThreadPool, QSize, QStringListModel, QPropertyAnimation, QEasingCurve, QEvent
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QSize, QStringListModel, QPropertyAnimation, QEasingCurve, QEvent
 
 from src.ui.reader_view import ReaderView
 from src.ui.thumbnail_widget import ThumbnailWidget, RECENT_THUMB_H
 from src.ui.group_view import GroupView
 from src.core.item_loader import ItemLoader
-from src.utils.img_utils import get_chapter_number
+from src.core.library_manager import SUMMARY
+from src.core.task_scheduler import TaskScheduler, TaskPriority
+from src.utils.img_utils import get_chapter_number, pixmap_from_image
 from src.utils.archive_utils import ARCHIVE_EXTS
-from src.core.library_scanner import LibraryScanner, ScannerWorker, BatchScannerWorker
+from src.core.library_scanner import LibraryScanner, ScannerWorker, BatchScannerWorker, LibraryRescanWorker
+from src.core.library_watcher import LibraryWatcher
 from src.ui.filter_token import FilterToken
 from src.ui.batch_metadata_dialog import BatchMetadataDialog
 from src.ui.info_dialog import InfoDialog
@@ -81,23 +85,30 @@ class FolderGrid(QWidget):
         self.loading_generation = 0
         self.recent_loading_generation = 0
         self.loader = None
-        self.received_items = {}
-        self.next_item_to_display = 0
         self.total_items_to_load = 0
         self.language = 'ko'
         self.current_view = 'series' # or 'chapters'
         self.current_series = None
-        self.items = []
+        self.items = [] # library tiles, in display order
+        self._item_widgets = {} # series id -> tile in self.items
+        self._item_rank = {} # series id -> position in the current listing
+        self._placed_cells = {} # tile -> (row, col) it occupies in grid_layout
+        self._place_from = None # first index of self.items awaiting placement
+        self.item_stats = {'created': 0, 'reused': 0, 'destroyed': 0} # tile churn across loads
         self.tokens = {}
         self.recent_items = []
         self.recent_loader = None
         
-        self.threadpool = QThreadPool()
-        self.threadpool.setMaxThreadCount(3)
+        # Item loaders run as thumbnail work, scanners as background indexing
+        self.threadpool = TaskScheduler.instance().lane("library.grid", TaskPriority.THUMBNAIL, max_active=3)
         self._active_loaders = [] # Track regular item loaders
         self._active_recent_loaders = [] # Track recent item loaders
         self._active_scanners = [] # Track scanner workers
         self.scanner = LibraryScanner()
+        self.watcher = None
+        if app_settings.get("watch_library", False):
+            self.watcher = LibraryWatcher(self)
+            self.watcher.series_changed.connect(self.rescan_library)
         self.web_server_process = None
 
         self.is_in_selection_mode = False
@@ -428,7 +439,7 @@ class FolderGrid(QWidget):
             self.recent_label.show()
             self.recent_scroll_container.show()
 
-        series_list = self.library_manager.search_series_with_filters(search_text, filters)
+        series_list = self.library_manager.search_series_with_filters(search_text, filters, SUMMARY)
         self.load_items(series_list)
 
     def apply_tag_filter(self, tag_type, tag_value):
@@ -442,22 +453,9 @@ class FolderGrid(QWidget):
     def search_items(self, text):
         if text.startswith("/"):
             filtered = []
-            if text.startswith("/author:"):
-                value = text.split(":", 1)[1]
-                authors = self.library_manager.get_all_authors()
-                filtered = [author for author in authors if value.lower() in author.lower()]
-            elif text.startswith("/genre:"):
-                value = text.split(":", 1)[1]
-                genres = self.library_manager.get_all_genres()
-                filtered = [genre for genre in genres if value.lower() in genre.lower()]
-            elif text.startswith("/theme:"):
-                value = text.split(":", 1)[1]
-                themes = self.library_manager.get_all_themes()
-                filtered = [theme for theme in themes if value.lower() in theme.lower()]
-            elif text.startswith("/format:"):
-                value = text.split(":", 1)[1]
-                formats = self.library_manager.get_all_formats()
-                filtered = [format for format in formats if value.lower() in format.lower()]
+            if text.startswith(("/author:", "/genre:", "/theme:", "/format:")):
+                prefix, value = text[1:].split(":", 1)
+                filtered = self.library_manager.complete_tag(f"{prefix}s", value)
             else:
                 filtered = [tag for tag in ["/author:", "/genre:", "/theme:", "/format:"] if text.lower() in tag.lower()]
             self.completer.setModel(QStringListModel(filtered))
@@ -470,12 +468,13 @@ class FolderGrid(QWidget):
         self.language = self.lang_combo.currentData()
     
     def load_items(self, series_list=None):
-        self.loading_generation += 1
+        """Show series_list (default: the whole library), reconciling tiles by series id.
 
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        Tiles of series that stay keep their widget and loaded cover and are only moved;
+        tiles of series that left are destroyed. Only new series go to an ItemLoader,
+        and their tiles are inserted in place as their covers arrive.
+        """
+        self.loading_generation += 1
 
         # Abort existing loaders
         for loader in self._active_loaders:
@@ -483,7 +482,9 @@ class FolderGrid(QWidget):
         self._active_loaders.clear()
 
         if series_list is None:
-            series_list = self.library_manager.get_series()
+            series_list = self.library_manager.get_series(SUMMARY)
+            if self.watcher:
+                self.watcher.watch([series['path'] for series in series_list])
 
         excluded = app_settings.get("excluded_themes", [])
         if excluded and not app_settings.get("show_hidden_themes", False):
@@ -493,16 +494,33 @@ class FolderGrid(QWidget):
 
         self.total_items_to_load = len(series_list)
         self.all_series_label.setText(f"All ({self.total_items_to_load})")
-        self.received_items.clear()
-        self.next_item_to_display = 0
-        self.items.clear()
-
-        if not series_list:
-            return
 
+        self._item_rank = {series['id']: rank for rank, series in enumerate(series_list)}
+        kept = {}
         items_to_load = []
         for series in series_list:
-            items_to_load.append(series)
+            widget = self._item_widgets.get(series['id'])
+            # A changed cover needs reloading; missing series are checked again
+            if widget is not None and not widget.series.get('_is_missing') \
+                    and widget.series.get('cover_image') == series.get('cover_image'):
+                widget.set_series(series)
+                kept[series['id']] = widget
+            else:
+                items_to_load.append(series)
+
+        for series_id, widget in self._item_widgets.items():
+            if series_id not in kept:
+                self.grid_layout.removeWidget(widget)
+                self._placed_cells.pop(widget, None)
+                widget.deleteLater()
+                self.item_stats['destroyed'] += 1
+        self.item_stats['reused'] += len(kept)
+        self._item_widgets = kept
+        self.items = list(kept.values()) # already in the new order
+        self._place_items()
+
+        if not items_to_load:
+            return
 
         loader = ItemLoader(items_to_load, self.loading_generation, item_type='series')
         if self.loader:
@@ -579,11 +597,11 @@ class FolderGrid(QWidget):
         widget = ThumbnailWidget(series, self.library_manager, height=RECENT_THUMB_H)
         
         if item.get('_is_missing'):
-            widget.set_as_missing()
+            widget.set_as_missing(item.get('_missing_status'))
             widget.clicked.connect(lambda s=series, w=widget: self.missing_item_selected(s, w))
         else:
             if qimg and not qimg.isNull():
-                pixmap = QPixmap.fromImage(qimg)
+                pixmap = pixmap_from_image(qimg, "thumb.recent")
                 widget.set_pixmap(pixmap)
             widget.set_progress(series)
             widget.clicked.connect(self.recent_series_selected)
@@ -653,50 +671,61 @@ class FolderGrid(QWidget):
     def on_item_loaded(self, qimg, series, idx, generation, item_type):
         if generation != self.loading_generation:
             return
-        self.received_items[idx] = (qimg, series, item_type)
-        self._display_pending_items()
+        series_id = series['id']
+        if series_id not in self._item_rank or series_id in self._item_widgets:
+            return
+
+        widget = ThumbnailWidget(series, self.library_manager)
+        if series.get('_is_missing'):
+            widget.set_as_missing(series.get('_missing_status'))
+            widget.clicked.connect(lambda s=series, w=widget: self.missing_item_selected(s, w))
+        else:
+            if qimg and not qimg.isNull():
+                pixmap = pixmap_from_image(qimg, "thumb.library")
+                widget.set_pixmap(pixmap)
+            widget.clicked.connect(self.item_selected)
+
+        widget.remove_requested.connect(self.remove_series)
+        widget.rescan_requested.connect(self.rescan_series)
+        widget.clear_cache_requested.connect(self.clear_series_cache)
+        widget.checkbox.toggled.connect(self.update_selection_count)
+        if self.is_in_selection_mode:
+            widget.set_selection_mode(True)
+        self.item_stats['created'] += 1
+
+        index = bisect_left(self.items, self._item_rank[series_id],
+                            key=lambda w: self._item_rank[w.series['id']])
+        self.items.insert(index, widget)
+        self._item_widgets[series_id] = widget
+        # Tiles of one batch of loaded covers are placed together on the next event loop pass
+        if self._place_from is None:
+            QTimer.singleShot(0, self._place_pending_items)
+            self._place_from = index
+        else:
+            self._place_from = min(self._place_from, index)
 
     def on_item_invalid(self, idx, generation):
-        if generation != self.loading_generation:
-            return
-        self.received_items[idx] = None
-        self._display_pending_items()
+        # Series that cannot be shown get no tile; the next load tries them again
+        pass
 
-    def _display_pending_items(self):
-        if not self.total_items_to_load:
-            return
+    def _place_pending_items(self):
+        start, self._place_from = self._place_from, None
+        if start is not None:
+            self._place_items(start)
 
+    def _place_items(self, start=0):
+        """Move the tiles from index start on into their cells, leaving placed ones alone."""
         num_cols = max(1, self.scroll.viewport().width() // 160)
-        
-        while self.next_item_to_display < self.total_items_to_load and \
-              self.next_item_to_display in self.received_items:
-            
-            item_data = self.received_items.pop(self.next_item_to_display)
-            
-            if item_data is not None:
-                qimg, series, item_type = item_data
-                widget = ThumbnailWidget(series, self.library_manager)
-                
-                if series.get('_is_missing'):
-                    widget.set_as_missing()
-                    widget.clicked.connect(lambda s=series, w=widget: self.missing_item_selected(s, w))
-                else:
-                    if qimg and not qimg.isNull():
-                        pixmap = QPixmap.fromImage(qimg)
-                        widget.set_pixmap(pixmap)
-                    widget.clicked.connect(self.item_selected)
-
-                widget.remove_requested.connect(self.remove_series)
-                widget.rescan_requested.connect(self.rescan_series)
-                widget.clear_cache_requested.connect(self.clear_series_cache)
-                widget.checkbox.toggled.connect(self.update_selection_count)
-                self.items.append(widget)
-                
-                row = self.next_item_to_display // num_cols
-                col = self.next_item_to_display % num_cols
-                self.grid_layout.addWidget(widget, row, col)
-            
-            self.next_item_to_display += 1
+        for i in range(start, len(self.items)):
+            widget = self.items[i]
+            cell = divmod(i, num_cols)
+            placed = self._placed_cells.get(widget)
+            if placed == cell:
+                continue
+            if placed is not None:
+                self.grid_layout.removeWidget(widget)
+            self.grid_layout.addWidget(widget, *cell)
+            self._placed_cells[widget] = cell
 
     def item_selected(self, series: object):
         self.series_selected.emit(series)
@@ -723,7 +752,7 @@ class FolderGrid(QWidget):
             worker.signals.finished.connect(lambda data: self._on_loader_finished(worker, self._active_scanners))
             worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
             self._active_scanners.append(worker)
-            self.threadpool.start(worker)
+            self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def _on_rescan_finished(self, series_id, new_path, series_data):
         if not series_data:
@@ -753,7 +782,40 @@ class FolderGrid(QWidget):
         worker.signals.finished.connect(lambda data: self._on_loader_finished(worker, self._active_scanners))
         worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
         self._active_scanners.append(worker)
-        self.threadpool.start(worker)
+        self.threadpool.start(worker, TaskPriority.BACKGROUND)
+
+    def rescan_library(self, paths=None):
+        """Rescan the library (or the series at paths) for added and removed chapters."""
+        series_list = self.library_manager.get_series_locations()
+        if paths is not None:
+            wanted = set(paths)
+            series_list = [series for series in series_list if series['path'] in wanted]
+        if not series_list:
+            return
+        worker = LibraryRescanWorker(self.scanner, self.library_manager, series_list)
+
+        def on_progress(current, total, path):
+            if paths is None:
+                self.show_info(f"Rescanning ({current}/{total}): {Path(path).name}")
+
+        def on_finished(counts):
+            if paths is None or counts['changed']:
+                parts = [f"{counts['changed']} updated"]
+                parts += [f"{counts[status]} {status}" for status in ('missing', 'offline') if counts[status]]
+                self.show_info("Rescan finished: " + ", ".join(parts))
+            if self.watcher and paths is not None:
+                self.watcher.watch([series['path'] for series in self.library_manager.get_series_locations()],
+                                   refresh=paths)
+            if counts['changed']:
+                self.load_items()
+                self.load_recent_items()
+
+        worker.signals.batch_rescanned.connect(self.library_manager.apply_rescan_batch)
+        worker.signals.progress.connect(on_progress)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.finished.connect(lambda counts: self._on_loader_finished(worker, self._active_scanners))
+        self._active_scanners.append(worker)
+        self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def show_info(self, text):
         self.info_label.setText(text)
@@ -804,41 +866,6 @@ class FolderGrid(QWidget):
         self.show_info(f"Cache cleared for {series['name']}")
         QTimer.singleShot(2000, self.hide_info)
 
-    def display_chapters(self, chapters):
-        self.loading_generation += 1
-
-        while self.flow_layout.count():
-            item = self.flow_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-
-        self.total_items_to_load = len(chapters)
-        self.received_items.clear()
-        self.next_item_to_display = 0
-
-        # Abort existing loaders
-        for loader in self._active_loaders:
-            loader.abort()
-        self._active_loaders.clear()
-
-        if not chapters:
-            return
-
-        loader = ItemLoader(chapters, self.loading_generation, item_type='chapter')
-        if self.loader:
-            try:
-                self.loader.signals.item_loaded.disconnect()
-                self.loader.signals.item_invalid.disconnect()
-                self.loader.signals.loading_finished.disconnect()
-            except TypeError:
-                pass
-        self.loader = loader
-        loader.signals.item_loaded.connect(self.on_item_loaded)
-        loader.signals.item_invalid.connect(self.on_item_invalid)
-        loader.signals.loading_finished.connect(lambda: self._on_loader_finished(loader))
-        self._active_loaders.append(loader)
-        self.threadpool.start(loader)
-
     def _on_loader_finished(self, loader, loaders_list=None):
         if loaders_list is None:
             loaders_list = self._active_loaders
@@ -948,12 +975,15 @@ class FolderGrid(QWidget):
     def show_more_options_menu(self):
         menu = QMenu(self)
         edit_action = menu.addAction("Edit")
+        rescan_action = menu.addAction("Rescan Library")
         show_hidden_action = menu.addAction("Show Hidden")
         show_hidden_action.setCheckable(True)
         show_hidden_action.setChecked(app_settings.get("show_hidden_themes", False))
         action = menu.exec(self.more_options_btn.mapToGlobal(self.more_options_btn.rect().bottomLeft()))
         if action == edit_action:
             self.toggle_selection_mode(True)
+        elif action == rescan_action:
+            self.rescan_library()
         elif action == show_hidden_action:
             app_settings.set("show_hidden_themes", show_hidden_action.isChecked())
             self.apply_filters()
@@ -971,7 +1001,7 @@ class FolderGrid(QWidget):
             worker.signals.finished.connect(lambda data: self._on_loader_finished(worker, self._active_scanners))
             worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
             self._active_scanners.append(worker)
-            self.threadpool.start(worker)
+            self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def on_scan_finished(self, series_data, original_path):
         if not series_data:
@@ -1016,7 +1046,7 @@ class FolderGrid(QWidget):
             worker.signals.finished.connect(lambda data: self._on_loader_finished(worker, self._active_scanners))
             worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
             self._active_scanners.append(worker)
-            self.threadpool.start(worker)
+            self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def _on_archive_scan_finished(self, series_data, original_path):
         if not series_data:
@@ -1053,8 +1083,8 @@ class FolderGrid(QWidget):
                 
                 worker = BatchScannerWorker(self.scanner, subfolders)
                 
-                def on_series_scanned(series_data):
-                    self.library_manager.add_series_from_data(series_data, metadata)
+                def on_batch_scanned(series_data_list):
+                    self.library_manager.add_series_batch(series_data_list, metadata)
 
                 def on_progress(current, total, path):
                     self.show_info(f"Scanning ({current}/{total}): {Path(path).name}")
@@ -1064,7 +1094,7 @@ class FolderGrid(QWidget):
                     self.load_recent_items()
                     self.load_items()
 
-                worker.signals.series_scanned.connect(on_series_scanned)
+                worker.signals.batch_scanned.connect(on_batch_scanned)
                 worker.signals.progress.connect(on_progress)
                 worker.signals.finished.connect(on_finished)
                 worker.signals.error.connect(lambda err: QMessageBox.warning(self, "Batch Scan Error", err))
@@ -1072,7 +1102,7 @@ class FolderGrid(QWidget):
                 worker.signals.finished.connect(lambda: self._on_loader_finished(worker, self._active_scanners))
                 worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
                 self._active_scanners.append(worker)
-                self.threadpool.start(worker)
+                self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def show_info(self, message):
         self.info_label.setText(message)
@@ -1109,7 +1139,7 @@ class FolderGrid(QWidget):
         worker.signals.finished.connect(lambda data: self._on_loader_finished(worker, self._active_scanners))
         worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
         self._active_scanners.append(worker)
-        self.threadpool.start(worker)
+        self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def add_multiple(self, paths):
         dialog = BatchMetadataDialog(self.library_manager, self)
@@ -1120,8 +1150,8 @@ class FolderGrid(QWidget):
             
             worker = BatchScannerWorker(self.scanner, paths)
             
-            def on_series_scanned(series_data):
-                self.library_manager.add_series_from_data(series_data, metadata)
+            def on_batch_scanned(series_data_list):
+                self.library_manager.add_series_batch(series_data_list, metadata)
 
             def on_progress(current, total, path):
                 self.show_info(f"Scanning ({current}/{total}): {Path(path).name}")
@@ -1131,7 +1161,7 @@ class FolderGrid(QWidget):
                 self.load_recent_items()
                 self.load_items()
 
-            worker.signals.series_scanned.connect(on_series_scanned)
+            worker.signals.batch_scanned.connect(on_batch_scanned)
             worker.signals.progress.connect(on_progress)
             worker.signals.finished.connect(on_finished)
             worker.signals.error.connect(lambda err: QMessageBox.warning(self, "Batch Scan Error", err))
@@ -1139,7 +1169,7 @@ class FolderGrid(QWidget):
             worker.signals.finished.connect(lambda: self._on_loader_finished(worker, self._active_scanners))
             worker.signals.error.connect(lambda err: self._on_loader_finished(worker, self._active_scanners))
             self._active_scanners.append(worker)
-            self.threadpool.start(worker)
+            self.threadpool.start(worker, TaskPriority.BACKGROUND)
 
     def toggle_selection_mode(self, enabled):
         self.is_in_selection_mode = enabled
@@ -1199,8 +1229,7 @@ class FolderGrid(QWidget):
         reply = QMessageBox.question(self, 'Confirm Removal', confirm_msg, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
-            for series in selected_series:
-                self.library_manager.remove_series(series)
+            self.library_manager.remove_series_batch(selected_series)
         self.toggle_selection_mode(False)
         self.load_recent_items()
         self.load_items()
@@ -1216,20 +1245,7 @@ class FolderGrid(QWidget):
         self.update_scroll_buttons_visibility()
 
     def relayout_items(self):
-        if not self.items:
-            return
-
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                # This is important to avoid deleting the widgets
-                item.widget().setParent(None)
-
-        num_cols = max(1, self.scroll.viewport().width() // 160)
-        for i, widget in enumerate(self.items):
-            row = i // num_cols
-            col = i % num_cols
-            self.grid_layout.addWidget(widget, row, col)
+        self._place_items()
 
     def remove_last_token(self):
         if not self.tokens:
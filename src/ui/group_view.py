@@ -4,10 +4,12 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QGridLayout, QStackedWidget
 )
 from PyQt6.QtGui import QPixmap
-from PyQt6.QtCore import Qt, pyqtSignal, QThreadPool
+from PyQt6.QtCore import Qt, pyqtSignal
 
 from src.ui.thumbnail_widget import ThumbnailWidget
 from src.core.item_loader import ItemLoader
+from src.core.library_manager import SUMMARY
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 from src.ui.styles import FLAT_BUTTON_STYLE
 
 class GroupCard(QWidget):
@@ -76,8 +78,7 @@ class GroupView(QWidget):
         self.library_manager = library_manager
         self.current_field = None
         self.current_group = None
-        self.threadpool = QThreadPool()
-        self.threadpool.setMaxThreadCount(3)
+        self.threadpool = TaskScheduler.instance().lane("library.groups", TaskPriority.THUMBNAIL, max_active=3)
         self._active_loaders = []
         self.loading_generation = 0
         self.received_items = {}
@@ -155,7 +156,7 @@ class GroupView(QWidget):
                 item.widget().deleteLater()
 
         groups = self.library_manager.get_field_values_with_counts(self.current_field)
-        untagged = self.library_manager.get_series_without_field(self.current_field)
+        untagged = self.library_manager.get_series_without_field(self.current_field, SUMMARY)
 
         num_cols = max(1, self.group_scroll.viewport().width() // 160)
         idx = 0
@@ -185,7 +186,7 @@ class GroupView(QWidget):
             series_list = group['_series']
         else:
             series_list = self.library_manager.get_series_by_field_value(
-                self.current_field, group['name']
+                self.current_field, group['name'], SUMMARY
             )
         self._load_series(series_list)
 
@@ -271,10 +272,10 @@ class GroupView(QWidget):
         else:
             if self.current_group and '_series' not in self.current_group:
                 series_list = self.library_manager.get_series_by_field_value(
-                    self.current_field, self.current_group['name']
+                    self.current_field, self.current_group['name'], SUMMARY
                 )
             else:
-                series_list = self.library_manager.get_series_without_field(self.current_field)
+                series_list = self.library_manager.get_series_without_field(self.current_field, SUMMARY)
             if series_list:
                 count = len(series_list)
                 self.header_label.setText(f"{self.current_group['name']}  ({count})")
@@ -9,9 +9,11 @@ from src.ui.components.collapsible_panel import CollapsiblePanel
 from src.ui.page_thumbnail import PageThumbnail
 from src.ui.double_page_thumbnail import DoublePageThumbnail
 from src.workers.thumbnail_worker import ThumbnailWorker
+from src.core.task_scheduler import CancellationToken, WORK_STATS
 from src.data.reader_model import ReaderModel
 from src.enums import ViewMode
-from src.utils.img_utils import empty_placeholder, load_thumbnail_from_path, load_thumbnail_from_virtual_path
+from src.utils.img_utils import empty_placeholder, load_thumbnail_from_path, load_thumbnail_from_virtual_path, pixmap_from_image
+from src.utils.memory_budget import MemoryBudget, image_bytes
 from src.utils.archive_utils import split_virtual_path
 from src.core.alt_manager import AltManager
 from src.ui.components.drag_drop_alt_dialog import DragDropAltDialog
@@ -26,6 +28,10 @@ class PagePanel(CollapsiblePanel):
         self.thumbnails_layout.setSpacing(0)
         self.thread_pool = thread_pool
         self._thumb_generation = 0
+        self._thumb_token = CancellationToken()
+        # Per panel: every ReaderView has its own page panel
+        self._thumbs_consumer = consumer = f"thumbs.page#{id(self)}"
+        self.destroyed.connect(lambda: MemoryBudget.instance().release_all(consumer))
         self.model = model
         self.on_page_changed = on_page_changed
         self.page_thumbnail_widgets = []
@@ -102,13 +108,24 @@ class PagePanel(CollapsiblePanel):
             return load_thumbnail_from_path(resolved, 150, 200)
 
     def stop_loading_thumbnails(self):
-        self.batch_timer.stop()
-        self._thumb_generation += 1
+        self._new_thumb_generation()
         self.image_paths_to_load = []
         
-    def _update_page_thumbnails(self, model:ReaderModel):
+    def _new_thumb_generation(self):
+        """Stop batching and cancel every thumbnail worker of the previous generation."""
         self.batch_timer.stop()
         self._thumb_generation += 1
+        self._thumb_token.cancel()
+        self._thumb_token = CancellationToken()
+        MemoryBudget.instance().release_all(self._thumbs_consumer)
+
+    def _thumb_pixmap(self, key, qimg) -> QPixmap:
+        pixmap = pixmap_from_image(qimg, "thumb.page")
+        MemoryBudget.instance().charge(self._thumbs_consumer, key, image_bytes(pixmap), pinned=True)
+        return pixmap
+
+    def _update_page_thumbnails(self, model:ReaderModel):
+        self._new_thumb_generation()
 
         while self.thumbnails_layout.count():
             item = self.thumbnails_layout.takeAt(0)
@@ -164,6 +181,7 @@ class PagePanel(CollapsiblePanel):
         start_index = self.current_batch_index
         end_index = min(start_index + self.BATCH_SIZE, len(self.image_paths_to_load))
         gen = self._thumb_generation
+        token = self._thumb_token
 
         self.content_area.setUpdatesEnabled(False)
         try:
@@ -186,20 +204,20 @@ class PagePanel(CollapsiblePanel):
                     if item_data['is_spread']:
                         target = right_page if right_page else left_page
                         if target and hasattr(target, 'path'):
-                            worker = ThumbnailWorker(i, target.path, self._load_thumbnail)
-                            worker.signals.finished.connect(lambda idx, img, w=widget: w.set_spread_pixmap(QPixmap.fromImage(img)))
+                            worker = ThumbnailWorker(i, target.path, self._load_thumbnail, token)
+                            worker.signals.finished.connect(lambda idx, img, w=widget: w.set_spread_pixmap(self._thumb_pixmap((idx, "spread"), img)))
                             self.thread_pool.start(worker)
                     else:
                         if left_page and hasattr(left_page, 'path'):
-                            worker_l = ThumbnailWorker(i, left_page.path, self._load_thumbnail)
-                            worker_l.signals.finished.connect(lambda idx, img, w=widget: w.set_visual_left_pixmap(QPixmap.fromImage(img)))
+                            worker_l = ThumbnailWorker(i, left_page.path, self._load_thumbnail, token)
+                            worker_l.signals.finished.connect(lambda idx, img, w=widget: w.set_visual_left_pixmap(self._thumb_pixmap((idx, "left"), img)))
                             self.thread_pool.start(worker_l)
                         else:
                             widget.set_visual_left_pixmap(empty_placeholder(100, 140))
                         
                         if right_page and hasattr(right_page, 'path'):
-                            worker_r = ThumbnailWorker(i, right_page.path, self._load_thumbnail)
-                            worker_r.signals.finished.connect(lambda idx, img, w=widget: w.set_visual_right_pixmap(QPixmap.fromImage(img)))
+                            worker_r = ThumbnailWorker(i, right_page.path, self._load_thumbnail, token)
+                            worker_r.signals.finished.connect(lambda idx, img, w=widget: w.set_visual_right_pixmap(self._thumb_pixmap((idx, "right"), img)))
                             self.thread_pool.start(worker_r)
                         else:
                             widget.set_visual_right_pixmap(empty_placeholder(100, 140))
@@ -226,7 +244,7 @@ class PagePanel(CollapsiblePanel):
                          if i < len(self.page_thumbnail_widgets):
                             self.page_thumbnail_widgets[i].set_pixmap(empty_placeholder())
                     else:
-                        worker = ThumbnailWorker(i, page_obj.path, self._load_thumbnail)
+                        worker = ThumbnailWorker(i, page_obj.path, self._load_thumbnail, token)
                         worker.signals.finished.connect(lambda idx, img, g=gen: self._on_page_thumbnail_loaded(idx, img, g))
                         self.thread_pool.start(worker)
 
@@ -245,11 +263,12 @@ class PagePanel(CollapsiblePanel):
 
     def _on_page_thumbnail_loaded(self, index, qimg, generation=None):
         if generation != self._thumb_generation:
+            WORK_STATS.record("ThumbnailWorker", "discarded")
             return
         if index < len(self.page_thumbnail_widgets):
             widget = self.page_thumbnail_widgets[index]
             if isinstance(widget, (PageThumbnail, DoublePageThumbnail)):
-                pixmap = QPixmap.fromImage(qimg)
+                pixmap = self._thumb_pixmap(index, qimg)
                 widget.set_pixmap(pixmap)
 
     def _update_page_selection(self, index, snap=True):
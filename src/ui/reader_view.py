@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (
     QFrame
 )
 from PyQt6.QtGui import QPixmap, QKeySequence, QShortcut, QColor, QMovie, QImage, QMouseEvent, QIcon
-from PyQt6.QtCore import Qt, QTimer, QEvent, QThreadPool, pyqtSignal, QSize, QRectF, QPropertyAnimation, QEasingCurve
+from PyQt6.QtCore import Qt, QTimer, QEvent, pyqtSignal, QSize, QRectF, QPropertyAnimation, QEasingCurve, QPoint
 from PyQt6.QtWidgets import QGraphicsOpacityEffect
 from src.utils.resource_utils import resource_path
 from src.utils.archive_utils import is_archive, is_zip, split_virtual_path
@@ -22,6 +22,7 @@ from src.ui.page_panel import PagePanel
 from src.ui.chapter_panel import ChapterPanel
 from src.ui.top_panel import TopPanel
 from src.ui.slider_panel import SliderPanel
+from src.ui.components.scrub_preview import ScrubPreview
 from src.ui.video_control_panel import VideoControlPanel
 from src.ui.viewer.image_view import ImageView
 from src.enums import Language
@@ -30,19 +31,24 @@ from src.ui.components.selection_panel import SelectionPanel
 import src.utils.app_settings as app_settings
 from src.data.reader_model import ReaderModel
 from src.utils.database_utils import get_db_connection
-from src.utils.img_utils import get_chapter_number
+from src.utils.img_utils import get_chapter_number, read_ahead_archive_pages
 from src.workers.view_workers import ChapterLoaderWorker, PixmapLoader, WorkerSignals, VIDEO_EXTS, IMAGE_EXTS, MODEL_EXTS, L2D_EXTS, ArchiveExtractionWorker, ImageInfoWorker, VideoExtractionWorker
 from src.workers.translate_worker import TranslateWorker
 from src.core.translation_service import TranslationService
+from src.core.task_scheduler import TaskScheduler, TaskPriority
 from src.core.alt_manager import AltManager
+from src.utils.resume_snapshot import save_snapshot, load_snapshot, pages_from_snapshot, page_signature
 
 from src.ui.viewer.image_viewer import ImageViewer
 from src.ui.viewer.video_viewer import VideoViewer
 from src.ui.viewer.strip_viewer import StripViewer
 from src.ui.viewer.model_viewer import ModelViewer
 from src.ui.viewer.l2d_viewer import L2DViewer
+from src.ui.viewer.web_engine_host import WebEngineHost
 from src.ui.l2d_panel import L2DPanel
 
+READ_AHEAD_PAGES = 6
+
 
 class ReaderView(QWidget):
     back_pressed = pyqtSignal()
@@ -63,6 +69,7 @@ class ReaderView(QWidget):
         self.model.double_image_loaded.connect(self._load_double_images)
         self.model.layout_updated.connect(self.on_layout_updated)
         self.model.page_updated.connect(self.on_page_updated)
+        self.model.spreads_updated.connect(self._update_slider_state)
 
         self.back_to_grid_callback = None
 
@@ -72,20 +79,26 @@ class ReaderView(QWidget):
         
         self.slider_panel = None
         self._restore_page_path = None
+        self._resume_signature = None # Page list painted from the resume snapshot, until verified
+        self._resume_pixmap = None
+        self.resume_overlay = None
+        # Never leave a stale picture up if the real page fails to load
+        self.resume_overlay_timer = QTimer(self)
+        self.resume_overlay_timer.setSingleShot(True)
+        self.resume_overlay_timer.setInterval(5000)
+        self.resume_overlay_timer.timeout.connect(self._hide_resume_overlay)
 
         self._last_total_scale = 1.0
 
-        # Main viewer pool: image loading/rescaling + video extraction (mutually exclusive)
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)
-
-        # Pool for chapter/page panel thumbnails
-        self.thumbnail_pool = QThreadPool()
-        self.thumbnail_pool.setMaxThreadCount(2)
-
-        # Pool for alt/frame panel thumbnails
-        self.secondary_pool = QThreadPool()
-        self.secondary_pool.setMaxThreadCount(2)
+        # All background work goes through the shared scheduler; these lanes only set the
+        # default priority. Callers pass an explicit priority for anything else.
+        scheduler = TaskScheduler.instance()
+        # Main viewer lane: image loading/rescaling + video extraction
+        self.thread_pool = scheduler.lane("reader.viewer", TaskPriority.VISIBLE)
+        # Chapter/page panel thumbnails
+        self.thumbnail_pool = scheduler.lane("reader.thumbnails", TaskPriority.THUMBNAIL)
+        # Alt/frame panel thumbnails
+        self.secondary_pool = scheduler.lane("reader.panels", TaskPriority.THUMBNAIL)
 
         self.original_view_mouse_press = None
         self.is_zoomed = False
@@ -144,6 +157,7 @@ class ReaderView(QWidget):
         TranslationService.instance().task_status_changed.connect(self._on_translation_status_changed_global)
 
         self._load_chapter_async(start_from_end=False)
+        self._try_instant_resume()
 
 
     def _on_translation_status_changed_global(self, image_path: str, lang_code: str, status: str):
@@ -268,20 +282,9 @@ class ReaderView(QWidget):
         main_layout.addWidget(self.scroll_area, 0, 0)
         self.scroll_area.hide()
 
-        # 3D model viewer (QWebEngineView) — lazy-imported so the app still runs without pyqt6-webengine
+        # Live2D / 3D model view: shared QWebEngineView, attached on first use (see WebEngineHost)
         self.model_web_view = None
-        try:
-            from PyQt6.QtWebEngineWidgets import QWebEngineView
-            from PyQt6.QtWebEngineCore import QWebEngineSettings
-            self.model_web_view = QWebEngineView(self)
-            _ws = self.model_web_view.page().settings()
-            _ws.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-            _ws.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
-            main_layout.addWidget(self.model_web_view, 0, 0)
-            self.model_web_view.hide()
-        except Exception as e:
-            print(f'ModelViewer: QWebEngineView unavailable: {e}')
-            self.model_web_view = None
+        self._main_layout = main_layout
 
         # 1. Create all panel widgets first
         self.top_panel = TopPanel(self)
@@ -290,6 +293,7 @@ class ReaderView(QWidget):
         self.video_control_panel = VideoControlPanel(self)
         self.video_control_panel.raise_()
         self.slider_panel = SliderPanel(self, model=self.model)
+        self.scrub_preview = ScrubPreview(self, self.thumbnail_pool, self.page_panel._load_thumbnail)
         self.chapter_panel = ChapterPanel(self, model=self.model, on_chapter_changed=self.set_chapter, thread_pool=self.thumbnail_pool)
         self.chapter_panel.hide_chapter_requested.connect(self._on_hide_chapter_from_panel)
         self.selection_panel = SelectionPanel(self)
@@ -365,6 +369,9 @@ class ReaderView(QWidget):
         self.video_control_panel.hide()
 
         self.slider_panel.valueChanged.connect(self.change_page_from_slider)
+        self.slider_panel.scrub_started.connect(self._on_scrub_started)
+        self.slider_panel.scrub_moved.connect(self._on_scrub_moved)
+        self.slider_panel.scrub_finished.connect(self.scrub_preview.end)
         self.top_panel.slideshow_clicked.connect(self.start_page_slideshow)
         self.top_panel.speed_changed.connect(self._on_slideshow_speed_changed)
         self.top_panel.repeat_changed.connect(self._on_slideshow_repeat_changed)
@@ -459,6 +466,7 @@ class ReaderView(QWidget):
     def resizeEvent(self, ev):
         super().resizeEvent(ev)
         self._reposition_nav_buttons()
+        self._update_resume_overlay_geometry()
         self._update_top_strip_geometry()
         if self.current_viewer:
             self.current_viewer.on_resize(ev)
@@ -966,6 +974,13 @@ class ReaderView(QWidget):
             self.top_panel.set_has_frames(False)
 
         self._update_after_load(resolved_path)
+        self._read_ahead_pages()
+
+    def _read_ahead_pages(self):
+        """Let the OS fetch the next pages of an archive chapter while this one is read."""
+        index = self.model.current_index
+        upcoming = self.model.images[index + 1:index + 1 + READ_AHEAD_PAGES]
+        read_ahead_archive_pages([page.path for page in upcoming])
 
     def _on_video_extracted_finished(self, original_path, extracted_path, success):
         self.loading_label.hide()
@@ -1030,7 +1045,7 @@ class ReaderView(QWidget):
         worker = ImageInfoWorker(items)
         worker.signals.finished.connect(self.top_panel.set_info_text)
         worker.signals.finished.connect(self.top_strip.set_info_text)
-        self.thread_pool.start(worker)
+        self.thread_pool.start(worker, TaskPriority.INFO)
 
     def set_zoom_mode(self, mode: str):
         self.last_zoom_mode = mode
@@ -1254,6 +1269,20 @@ class ReaderView(QWidget):
         target_page = self._slider_val_to_page(val)
         self.change_page(target_page)
 
+    def _on_scrub_started(self):
+        """Map every slider position to the page whose thumbnail previews it."""
+        paths = []
+        for val in range(self.slider_panel.slider.maximum() + 1):
+            idx = self._slider_val_to_page(val) - 1
+            paths.append(self.model.images[idx].path if 0 <= idx < len(self.model.images) else '')
+        self.scrub_preview.begin(paths)
+
+    def _on_scrub_moved(self, val: int):
+        slider = self.slider_panel.slider
+        handle = slider.mapTo(self, slider.handle_center())
+        top = self.slider_panel.mapTo(self, QPoint(0, 0)).y()
+        self.scrub_preview.show_value(val, QPoint(handle.x(), top - 6))
+
     def change_page_from_input(self, val: int):
         # val is 1-based index from Input (Page Number or Layout Number)
         target_page = self._slider_val_to_page(val - 1)
@@ -1338,6 +1367,7 @@ class ReaderView(QWidget):
 
     def _load_chapter_async(self, start_from_end: bool):
         self.page_panel.stop_loading_thumbnails()
+        self.scrub_preview.clear()
         self.loading_label.show()
         # Clean current view
         if self.current_viewer:
@@ -1372,12 +1402,22 @@ class ReaderView(QWidget):
             archive_str, _ = split_virtual_path(path_str)
             if is_archive(archive_str):
                 extract_worker = ArchiveExtractionWorker(archive_str)
-                self.thread_pool.start(extract_worker)
+                self.thread_pool.start(extract_worker, TaskPriority.PREFETCH)
 
     def _on_chapter_loaded(self, result: dict):
         if result["manga_dir"] != self.model.manga_dir:
             return
 
+        if self._resume_signature is not None:
+            expected, self._resume_signature = self._resume_signature, None
+            if page_signature(result["images"]) == expected:
+                # The snapshot's page list is still accurate; the reader already shows it
+                self.loading_label.hide()
+                return
+            # Chapter changed on disk since the snapshot; stay on the same image
+            if 0 <= self.model.current_index < len(self.model.images):
+                self._restore_page_path = self.model.images[self.model.current_index].images[0]
+
         self.loading_label.hide()
         # Use set_images to trigger Page creation and grouping
         self.model.set_images(result["images"])
@@ -1401,8 +1441,95 @@ class ReaderView(QWidget):
 
         self.model.refresh()
 
+    def ensure_web_view(self):
+        """Attach the shared web engine view to this reader, creating it on first use."""
+        return WebEngineHost.instance().acquire(self)
+
+    def release_web_view(self):
+        WebEngineHost.instance().release(self)
+
+    def attach_web_view(self, view):
+        self._main_layout.addWidget(view, 0, 0)
+        # Same stacking as an eagerly created view: above the media, below the panels
+        view.stackUnder(self.top_panel)
+        view.hide()
+        self.model_web_view = view
+
+    def detach_web_view(self):
+        if self.model_web_view is not None:
+            self._main_layout.removeWidget(self.model_web_view)
+            self.model_web_view.hide()
+        self.model_web_view = None
+
+    def _try_instant_resume(self):
+        """
+        Paint the snapshot saved when this chapter was last left and start decoding
+        the real page from the snapshot's page list, while ChapterLoaderWorker scans
+        the chapter to verify it.
+        """
+        if not isinstance(self.model.series, dict) or not self.model.manga_dir:
+            return
+        snapshot = load_snapshot(str(self.model.series['path']), self.model.current_chapter_path())
+        if not snapshot or snapshot.get("page_index") != self._start_page:
+            return
+        pages = pages_from_snapshot(snapshot)
+        if not pages:
+            return
+
+        if snapshot.get("view_mode") == self.model.view_mode.value:
+            image = QImage(snapshot["image_path"])
+            if not image.isNull():
+                self._show_resume_overlay(QPixmap.fromImage(image))
+
+        self.loading_label.hide()
+        self._resume_signature = page_signature(pages)
+        self.model.set_images(pages)
+        self.model.current_index = min(self._start_page, len(pages) - 1)
+        self._start_page = 0
+        self.model.refresh()
+
+    def save_resume_snapshot(self):
+        """Persist the page on screen and the page list for an instant resume."""
+        if not isinstance(self.model.series, dict) or not self.model.images:
+            return
+        if self.current_viewer is not self.image_viewer or self.model.view_mode == ViewMode.STRIP:
+            return
+        image = self.view.viewport().grab().toImage()
+        save_snapshot(str(self.model.series['path']), self.model.current_chapter_path(),
+                      self.model.current_index, self.model.view_mode.value, image, self.model.images)
+
+    def _show_resume_overlay(self, pixmap: QPixmap):
+        if self.resume_overlay is None:
+            self.resume_overlay = QLabel(self.view)
+            self.resume_overlay.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.resume_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self._resume_pixmap = pixmap
+        self._update_resume_overlay_geometry()
+        self.resume_overlay.show()
+        self.resume_overlay.raise_()
+        # Restarting drops the previous overlay's deadline
+        self.resume_overlay_timer.start()
+
+    def _update_resume_overlay_geometry(self):
+        if self.resume_overlay is None or self._resume_pixmap is None:
+            return
+        rect = self.view.rect()
+        self.resume_overlay.setGeometry(rect)
+        self.resume_overlay.setPixmap(self._resume_pixmap.scaled(
+            rect.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+
+    def _hide_resume_overlay(self):
+        self.resume_overlay_timer.stop()
+        if self.resume_overlay is not None and self._resume_pixmap is not None:
+            self.resume_overlay.hide()
+            self.resume_overlay.clear()
+            self._resume_pixmap = None
+
     def back_to_grid(self):
+        self._hide_resume_overlay()
         self.page_panel.stop_loading_thumbnails()
+        for lane in (self.thread_pool, self.thumbnail_pool, self.secondary_pool):
+            lane.clear()
         if self.current_viewer:
              self.current_viewer.cleanup()
         self.back_pressed.emit()
@@ -1548,7 +1675,7 @@ class ReaderView(QWidget):
         
         if status:
             self.top_panel.update_translate_button(status.upper())
-        elif target_lang in page.translations:
+        elif page.has_translation(target_lang):
              # Translation exists -> Offer Redo
              self.top_panel.update_translate_button('REDO')
         else:
@@ -1600,7 +1727,7 @@ class ReaderView(QWidget):
                 target_page = p
                 break
             # Check if original_path was itself a translation (edge case)
-            if original_path in p.translations.values():
+            if original_path in p.translation_paths():
                 target_page = p
                 break
         
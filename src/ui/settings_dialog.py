@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton,
 from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
 from src.core.llm_server import LLMServerManager
 import src.utils.app_settings as app_settings
+from src.core.decode_pool import default_decode_processes
 
 class DownloadWorker(QThread):
     finished = pyqtSignal(bool, str)
@@ -203,8 +204,31 @@ class SettingsDialog(QDialog):
         remove_btn.clicked.connect(self._remove_excluded_theme)
         library_layout.addWidget(remove_btn)
 
+        self.watch_library_check = QCheckBox("Watch library folders for changes")
+        self.watch_library_check.setToolTip("Rescans a series when files are added to or removed from its folder. Applies after restart.")
+        self.watch_library_check.setChecked(bool(app_settings.get("watch_library", False)))
+        self.watch_library_check.toggled.connect(lambda enabled: app_settings.set("watch_library", enabled))
+        library_layout.addWidget(self.watch_library_check)
+
         layout.addWidget(library_container)
 
+        # Performance Section
+        perf_container = QFrame()
+        perf_container.setStyleSheet("background-color: #2b2b2b; border-radius: 5px; padding: 10px; margin-top: 10px;")
+        perf_layout = QVBoxLayout(perf_container)
+
+        perf_title = QLabel("Performance")
+        perf_title.setStyleSheet("font-weight: bold; margin-bottom: 5px;")
+        perf_layout.addWidget(perf_title)
+
+        self.decode_processes_check = QCheckBox("Decode images in separate processes")
+        self.decode_processes_check.setToolTip("Keeps the reader responsive while decoding and survives corrupt files. Applies after restart.")
+        self.decode_processes_check.setChecked(int(app_settings.get("decode_processes", 0) or 0) > 0)
+        self.decode_processes_check.toggled.connect(self._save_decode_processes)
+        perf_layout.addWidget(self.decode_processes_check)
+
+        layout.addWidget(perf_container)
+
         layout.addStretch()
 
         close_btn = QPushButton("Close")
@@ -230,6 +254,9 @@ class SettingsDialog(QDialog):
         themes = [self.excluded_list.item(i).text() for i in range(self.excluded_list.count())]
         app_settings.set("excluded_themes", themes)
 
+    def _save_decode_processes(self, enabled: bool):
+        app_settings.set("decode_processes", default_decode_processes() if enabled else 0)
+
     def save_config(self):
         repo_id = self.repo_input.text().strip()
         model_name = self.model_input.text().strip()
@@ -1,13 +1,23 @@
 from PyQt6.QtWidgets import QWidget, QHBoxLayout, QComboBox, QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from src.ui.components.input_label import InputLabel
 from src.ui.components.alt_slider import AltSlider
 from src.ui.styles import PANEL_BG_STYLE
 
 
 class SliderPanel(QWidget):
-    """Single-row panel for page navigation."""
+    """Single-row panel for page navigation.
+
+    While the handle is dragged, value changes are reported as scrub_moved only;
+    valueChanged (which loads the page) fires on release or after the handle has
+    rested on a value for SCRUB_DWELL_MS.
+    """
+    SCRUB_DWELL_MS = 350
+
     valueChanged = pyqtSignal(int)
+    scrub_started = pyqtSignal()
+    scrub_moved = pyqtSignal(int)
+    scrub_finished = pyqtSignal()
     page_changed = pyqtSignal(int)
     page_input_clicked = pyqtSignal()
     zoom_mode_changed = pyqtSignal(str)
@@ -43,6 +53,14 @@ class SliderPanel(QWidget):
             }
         """)
         self.slider.valueChanged.connect(self.on_slider_value_changed)
+        self.slider.drag_started.connect(self.scrub_started.emit)
+        self.slider.drag_finished.connect(self._on_drag_finished)
+
+        self._committed_value = 0
+        self._dwell_timer = QTimer(self)
+        self._dwell_timer.setSingleShot(True)
+        self._dwell_timer.setInterval(self.SCRUB_DWELL_MS)
+        self._dwell_timer.timeout.connect(self._commit_value)
 
         self.page_input = InputLabel(1, 1)
         self.page_input.clicked.connect(self.page_input_clicked.emit)
@@ -110,6 +128,7 @@ class SliderPanel(QWidget):
         self.slider.set_alt_indices(indices)
 
     def set_value(self, value):
+        self._committed_value = value
         self.slider.blockSignals(True)
         self.slider.setValue(value)
         self.slider.blockSignals(False)
@@ -125,8 +144,24 @@ class SliderPanel(QWidget):
 
     def on_slider_value_changed(self, value):
         self.update_page_input_value(value)
+        if self.slider.is_dragging():
+            self.scrub_moved.emit(value)
+            self._dwell_timer.start()
+            return
+        self._committed_value = value
         self.valueChanged.emit(value)
 
+    def _commit_value(self):
+        value = self.slider.value()
+        if value != self._committed_value:
+            self._committed_value = value
+            self.valueChanged.emit(value)
+
+    def _on_drag_finished(self):
+        self._dwell_timer.stop()
+        self.scrub_finished.emit()
+        self._commit_value()
+
     def _on_page_input_entered(self, display_val):
         real_index = max(0, min(display_val - 1, self.slider.maximum()))
         self.page_changed.emit(real_index + 1)
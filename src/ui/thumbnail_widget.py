@@ -7,6 +7,8 @@ from pathlib import Path
 from src.utils.img_utils import crop_pixmap, get_chapter_number, load_thumbnail_from_zip
 from src.utils.archive_utils import ZIP_EXTS
 from src.ui.info_dialog import InfoDialog
+from src.core.library_manager import DETAIL
+from src.core.scan_journal import OFFLINE
 import os
 import sys
 import subprocess
@@ -219,7 +221,7 @@ class ThumbnailWidget(QWidget):
             self.get_info()
 
     def get_info(self):
-        dialog = InfoDialog(self.series, self.library_manager, self)
+        dialog = InfoDialog(self.library_manager.load_level(self.series, DETAIL), self.library_manager, self)
         if dialog.exec():
             # If dialog was accepted (Save clicked), reload the series data
             self.reload_series()
@@ -245,6 +247,11 @@ class ThumbnailWidget(QWidget):
                 if pixmap and not pixmap.isNull():
                     self.set_pixmap(pixmap)
 
+    def set_series(self, series):
+        """Show fresh data for the same series, e.g. after a rename, keeping the cover."""
+        self.series = series
+        self._update_text()
+
     def _update_text(self):
         """Updates the name label with truncation logic."""
         font_metrics = QFontMetrics(self.name_label.font())
@@ -317,7 +324,8 @@ class ThumbnailWidget(QWidget):
 
         self.image_label.setPixmap(rounded)
 
-    def set_as_missing(self):
+    def set_as_missing(self, status=None):
+        """Grey placeholder for an unreachable series; status is its scan_journal status, if known."""
         w, h = self.image_container_size.width(), self.image_container_size.height()
 
         base = QPixmap(self.image_container_size)
@@ -335,7 +343,8 @@ class ThumbnailWidget(QWidget):
         font.setBold(False)
         painter.setFont(font)
         painter.setPen(QColor(200, 200, 200))
-        painter.drawText(base.rect().adjusted(0, 0, 0, -10), Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter, "Missing")
+        painter.drawText(base.rect().adjusted(0, 0, 0, -10), Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignHCenter,
+                         "Offline" if status == OFFLINE else "Missing")
         painter.end()
 
         rounded = QPixmap(self.image_container_size)
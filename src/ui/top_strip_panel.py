@@ -12,6 +12,7 @@ from src.ui.styles import SCROLL_AREA_TRANSPARENT
 from src.utils.resource_utils import resource_path
 from src.utils.str_utils import natural_sort_key
 from src.core.alt_manager import AltManager
+from src.utils.img_utils import pixmap_from_image
 
 
 class HorizontalScrollArea(QScrollArea):
@@ -101,7 +102,7 @@ class FrameThumb(QLabel):
 
     def set_qimage(self, qimage: QImage):
         if qimage and not qimage.isNull():
-            scaled = QPixmap.fromImage(qimage).scaled(
+            scaled = pixmap_from_image(qimage, "thumb.frame").scaled(
                 self.W, self.H,
                 Qt.AspectRatioMode.KeepAspectRatio,
                 Qt.TransformationMode.SmoothTransformation,
@@ -814,7 +815,7 @@ class TopStripPanel(QWidget):
         def _apply(_, img, w=thumb):
             if img and not img.isNull():
                 try:
-                    w.set_thumb(QPixmap.fromImage(img))
+                    w.set_thumb(pixmap_from_image(img, "thumb.strip"))
                 except RuntimeError:
                     pass
 
@@ -0,0 +1,179 @@
+import io
+import threading
+import time
+from PIL import Image
+from PyQt6.QtGui import QPixmap, QMovie, QImage
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QTimer, QSize
+
+from src.workers.view_workers import AnimationDecodeWorker, retire_worker
+from src.utils.img_utils import pixmap_from_image
+from src.utils.memory_budget import MemoryBudget
+
+class PlaybackStats:
+    """Thread-safe totals of animation playback, added when each playback stops.
+
+    ``shown`` frames reached the screen, ``dropped`` ones were skipped to keep
+    wall-clock time and ``late`` ones came after the decoder had fallen behind.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = {"playbacks": 0, "shown": 0, "dropped": 0, "late": 0}
+
+    def record(self, shown: int, dropped: int, late: int):
+        with self._lock:
+            self._totals["playbacks"] += 1
+            self._totals["shown"] += shown
+            self._totals["dropped"] += dropped
+            self._totals["late"] += late
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self._totals)
+
+    def reset(self):
+        with self._lock:
+            for key in self._totals:
+                self._totals[key] = 0
+
+PLAYBACK_STATS = PlaybackStats()
+
+class AnimationPlayer(QObject):
+    """QMovie-compatible playback engine for animated GIF, WEBP and AVIF.
+
+    Frames are decoded on an AnimationDecodeWorker thread into a ring buffer holding
+    at most ``buffer_size`` frames, so memory stays flat no matter how many frames the
+    file has. Timing follows the per-frame durations stored in the container. When
+    playback falls behind, late frames are skipped and counted as dropped; the
+    counts go to PLAYBACK_STATS when playback stops.
+    """
+    frameChanged = pyqtSignal(int)
+
+    STARVED_RETRY_MS = 10
+
+    def __init__(self, source, target_size: QSize = None, buffer_size: int = 8, parent=None):
+        super().__init__(parent)
+        self.source = source # file path or raw bytes
+        self.target_size = target_size
+        self.buffer_size = buffer_size
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._next_frame)
+        self._state = QMovie.MovieState.NotRunning
+        self._worker = None
+        self._image = QImage()
+        self._pixmap = QPixmap()
+        self._due_ms = 0.0
+        self._starved = False
+        self.current_frame = -1
+        self.shown_frames = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+
+        self._source_size = QSize()
+        self._animated = False
+        try:
+            src = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+            with Image.open(src) as img:
+                self._source_size = QSize(img.width, img.height)
+                self._animated = bool(getattr(img, "is_animated", False))
+        except Exception:
+            self._animated = False
+
+    def isValid(self):
+        return self._animated
+
+    def sourceSize(self) -> QSize:
+        return self._source_size
+
+    def state(self):
+        return self._state
+
+    def start(self):
+        if not self.isValid():
+            return
+        if self._worker is None:
+            self._worker = AnimationDecodeWorker(self.source, self.target_size, self.buffer_size)
+            self._worker.failed.connect(self.stop)
+            self._worker.start()
+            MemoryBudget.instance().charge("animation", id(self), self._buffer_bytes(), pinned=True)
+        self._state = QMovie.MovieState.Running
+        self._due_ms = time.monotonic() * 1000
+        self._next_frame()
+
+    def stop(self):
+        self._state = QMovie.MovieState.NotRunning
+        self.timer.stop()
+        self.current_frame = -1
+        if self._worker is not None:
+            self._worker.stop()
+            retire_worker(self._worker)
+            self._worker = None
+            MemoryBudget.instance().release("animation", id(self))
+        if self.shown_frames:
+            PLAYBACK_STATS.record(self.shown_frames, self.dropped_frames, self.late_frames)
+            self.shown_frames = self.dropped_frames = self.late_frames = 0
+
+    def setPaused(self, paused: bool):
+        if paused:
+            if self._state == QMovie.MovieState.Running:
+                self.timer.stop()
+                self._state = QMovie.MovieState.Paused
+        elif self._state == QMovie.MovieState.Paused:
+            # The decoder kept the buffer full while paused, so resume where we left off
+            self._state = QMovie.MovieState.Running
+            self._due_ms = time.monotonic() * 1000
+            self._next_frame()
+        elif self._state == QMovie.MovieState.NotRunning:
+            self.start()
+
+    def _buffer_bytes(self) -> int:
+        """Upper bound of the decode ring buffer (ARGB32 frames at display size)."""
+        size = self._source_size
+        if self.target_size and self.target_size.isValid() and not size.isEmpty():
+            size = size.scaled(self.target_size.boundedTo(size), Qt.AspectRatioMode.KeepAspectRatio)
+        return (self.buffer_size + 1) * size.width() * size.height() * 4
+
+    def _next_frame(self):
+        if self._state != QMovie.MovieState.Running or self._worker is None:
+            return
+
+        frame = self._worker.take_frame()
+        if frame is None:
+            # Decoder has not caught up; keep the current frame on screen and retry shortly
+            self._starved = True
+            self.timer.start(self.STARVED_RETRY_MS)
+            return
+
+        now = time.monotonic() * 1000
+        index, image, duration = frame
+        if self._starved:
+            self._starved = False
+            if self.current_frame >= 0:
+                self.late_frames += 1
+            self._due_ms = now
+        else:
+            # Skip frames we are already past so playback keeps wall-clock time
+            dropped = 0
+            while now - self._due_ms >= duration:
+                nxt = self._worker.take_frame()
+                if nxt is None:
+                    break
+                self._due_ms += duration
+                index, image, duration = nxt
+                dropped += 1
+            self.dropped_frames += dropped
+
+        self._image = image
+        self._pixmap = pixmap_from_image(image, "animation.frame")
+        self.current_frame = index
+        self.shown_frames += 1
+
+        self._due_ms = max(self._due_ms + duration, now)
+        self.timer.start(int(max(0, self._due_ms - now)))
+        self.frameChanged.emit(index)
+
+    def currentImage(self) -> QImage:
+        return self._image
+
+    def currentPixmap(self) -> QPixmap:
+        return self._pixmap
@@ -0,0 +1,155 @@
+import mimetypes
+import os
+from collections import OrderedDict
+
+from PyQt6.QtCore import QUrl, QBuffer, QByteArray, QIODevice
+from PyQt6.QtWebEngineCore import QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob
+
+from src.core.task_scheduler import TaskScheduler, TaskPriority
+from src.utils.archive_utils import SevenZipHandler, split_virtual_path
+from src.utils.memory_budget import MemoryBudget
+from src.workers.view_workers import ArchiveAssetWorker
+
+SCHEME = b"mrarchive"
+MAX_CACHED_BYTES = 64 * 1024 * 1024
+
+_MIME = {
+    '.skel': 'application/octet-stream',
+    '.atlas': 'text/plain',
+    '.json': 'application/json',
+    '.glb': 'model/gltf-binary',
+    '.gltf': 'model/gltf+json',
+    '.bin': 'application/octet-stream',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.webp': 'image/webp',
+    '.ktx2': 'image/ktx2',
+}
+
+# URL host -> archive path. The host is the archive id (path + mtime), so a
+# rewritten archive gets new URLs and cached responses never go stale.
+_archives = {}
+
+
+def register_archive_scheme():
+    """Declare mrarchive:// to Chromium; must run before the QApplication is created."""
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    flags = QWebEngineUrlScheme.Flag.SecureScheme | QWebEngineUrlScheme.Flag.CorsEnabled
+    fetch_flag = getattr(QWebEngineUrlScheme.Flag, 'FetchApiAllowed', None) # Qt 6.6+
+    if fetch_flag is not None:
+        flags |= fetch_flag
+    scheme.setFlags(flags)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def archive_url(virtual_path: str) -> str:
+    """mrarchive:// URL of an 'archive|internal' path, for use inside the web viewers.
+
+    Sibling assets (.atlas, textures, .bin buffers) referenced by relative URLs
+    resolve against it and are served from the same archive.
+    """
+    archive, internal = split_virtual_path(virtual_path)
+    archive_id = SevenZipHandler.get_archive_id(archive)
+    _archives[archive_id] = archive
+    url = QUrl()
+    url.setScheme(SCHEME.decode())
+    url.setHost(archive_id)
+    url.setPath('/' + internal.replace('\\', '/'))
+    return bytes(url.toEncoded()).decode()
+
+
+class ArchiveSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Serves mrarchive:// requests straight from archives, so models need no extraction.
+
+    Members are read on the scheduler at VISIBLE priority and kept in a small LRU,
+    charged to the "web.assets" memory budget, since the viewers tend to request
+    the same textures again when a model is reloaded.
+    """
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self._pending = {} # request_id -> (job, virtual_path)
+        self._next_id = 0
+        self._cache = OrderedDict() # virtual_path -> bytes, LRU first
+        self._cached_bytes = 0
+        MemoryBudget.instance().register("web.assets", self._evict)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = ArchiveSchemeHandler()
+        return cls._instance
+
+    def install(self, profile):
+        if profile.urlSchemeHandler(SCHEME) is None:
+            profile.installUrlSchemeHandler(SCHEME, self)
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob):
+        url = job.requestUrl()
+        archive = _archives.get(url.host())
+        internal = url.path(QUrl.ComponentFormattingOption.FullyDecoded).lstrip('/')
+        if archive is None or not internal:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        virtual_path = f"{archive}|{internal}"
+        data = self._cache.get(virtual_path)
+        if data is not None:
+            self._cache.move_to_end(virtual_path)
+            self._reply(job, internal, data)
+            return
+
+        self._next_id += 1
+        request_id = self._next_id
+        self._pending[request_id] = (job, virtual_path)
+        # WebEngine owns the job and deletes it when the page navigates away;
+        # sip cannot see that, so forget the request when Qt says so
+        job.destroyed.connect(lambda _=None: self._pending.pop(request_id, None))
+        worker = ArchiveAssetWorker(self._next_id, virtual_path)
+        worker.signals.finished.connect(self._on_asset_read)
+        TaskScheduler.instance().start(worker, TaskPriority.VISIBLE)
+
+    def _on_asset_read(self, request_id: int, data):
+        job, virtual_path = self._pending.pop(request_id, (None, None))
+        if job is None:
+            return # The page went away while we were reading
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        self._store(virtual_path, data)
+        self._reply(job, split_virtual_path(virtual_path)[1], data)
+
+    def _reply(self, job, internal: str, data: bytes):
+        ext = os.path.splitext(internal)[1].lower()
+        mime = _MIME.get(ext) or mimetypes.guess_type(internal)[0] or 'application/octet-stream'
+        try:
+            # Qt 6.8+; older versions reply without extra headers
+            job.setAdditionalResponseHeaders({
+                b'Cache-Control': b'max-age=31536000, immutable',
+                b'Access-Control-Allow-Origin': b'*',
+            })
+        except (AttributeError, TypeError):
+            pass
+        buffer = QBuffer(job)
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(mime.encode(), buffer)
+
+    def _store(self, virtual_path: str, data: bytes):
+        if len(data) > MAX_CACHED_BYTES // 4 or virtual_path in self._cache:
+            return
+        self._cache[virtual_path] = data
+        self._cached_bytes += len(data)
+        MemoryBudget.instance().charge("web.assets", virtual_path, len(data))
+        while self._cached_bytes > MAX_CACHED_BYTES and self._cache:
+            old_path, old_data = self._cache.popitem(last=False)
+            self._cached_bytes -= len(old_data)
+            MemoryBudget.instance().release("web.assets", old_path)
+
+    def _evict(self, virtual_path: str):
+        data = self._cache.pop(virtual_path, None)
+        if data is not None:
+            self._cached_bytes -= len(data)
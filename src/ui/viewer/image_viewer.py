@@ -7,38 +7,50 @@ from PIL import Image, ImageQt
 
 from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsRectItem, QGraphicsTextItem, QGraphicsItem
 from PyQt6.QtGui import QPixmap, QMovie, QImage, QBrush, QPainter, QColor, QFont, QPen, QTextOption
-from PyQt6.QtCore import Qt, QTimer, QByteArray, QBuffer, QIODevice, QObject, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QObject, pyqtSignal, QSize
 
 from src.ui.viewer.base_viewer import BaseViewer
-from src.utils.img_utils import get_image_data_from_zip, empty_placeholder, get_image_format_from_ext, compress_qimage_to_size
+from src.utils.img_utils import get_image_data_from_zip, empty_placeholder, get_image_format_from_ext, compress_qimage_to_size, pixmap_from_image
 from src.enums import ViewMode
 from src.workers.view_workers import AsyncLoaderWorker, AsyncScaleWorker
+from src.core.task_scheduler import CancellationToken, WORK_STATS
+from src.utils.memory_budget import MemoryBudget, image_bytes
 
-from src.ui.viewer.avif_player import AvifPlayer
+from src.ui.viewer.animation_player import AnimationPlayer
 
 class ImageViewer(BaseViewer):
     def __init__(self, reader_view):
         super().__init__(reader_view)
         self.pixmap_item = None
         self.overlay_items = []
-        self.movie = None
-        self.movie_buffer = None # Keep reference to buffer
+        self.movie = None # AnimationPlayer for animated GIF/WEBP/AVIF
         self.original_pixmap = None # Stores the full resolution source
         self.original_qimage = None # Kept alongside original_pixmap to avoid toImage() roundtrip
         self.current_request_id = 0
+        self._load_token = CancellationToken()
+        self._pair_paths = [] # double-page request being joined
+        self._pair_results = {}
+        self._pair_pending = 0
         self.is_active = False # Flag to ignore late worker results
         
         # High Quality Scaling State
         self.scaled_pixmap_item = None # Separate item for high-quality scaled version
         self.hq_generation_id = 0
+        self._hq_token = CancellationToken()
         self.last_viewport_size = None
         self.target_hq_size = None
+        self._anim_target_size = None
         
         self.resize_timer = QTimer(reader_view)
         self.resize_timer.setSingleShot(True)
         self.resize_timer.setInterval(100) # 100ms debounce
         self.resize_timer.timeout.connect(self._trigger_hq_rescale)
 
+        self.memory = MemoryBudget.instance()
+        self._consumer = f"viewer#{id(self)}" # one per ReaderView
+        consumer = self._consumer
+        reader_view.destroyed.connect(lambda: MemoryBudget.instance().release_all(consumer))
+
     def set_active(self, active: bool):
         super().set_active(active)
         if active:
@@ -52,8 +64,8 @@ class ImageViewer(BaseViewer):
                 self.movie.start()
         else:
             self.resize_timer.stop()
-            self.hq_generation_id += 1 # Invalidate any pending HQ workers
-            self.current_request_id += 1 # Invalidate any pending async loads
+            self._invalidate_hq() # Invalidate any pending HQ workers
+            self._invalidate_load() # Invalidate any pending async loads
             
             # Hide ALL pixmap items in the scene to avoid overlapping videos/next pages
             if self.reader_view.scene:
@@ -67,6 +79,25 @@ class ImageViewer(BaseViewer):
             self.reader_view.layout_btn.hide()
             self._purge_stale_pixmaps() # Purge when deactivating too
 
+    def _invalidate_load(self) -> CancellationToken:
+        """Cancel the pending async load (queued or running) and start a new request."""
+        self._load_token.cancel()
+        self._load_token = CancellationToken()
+        self.current_request_id += 1
+        return self._load_token
+
+    def _invalidate_hq(self) -> CancellationToken:
+        self._hq_token.cancel()
+        self._hq_token = CancellationToken()
+        self.hq_generation_id += 1
+        return self._hq_token
+
+    def _account_memory(self):
+        """Report the page on screen to the memory budget; it is pinned, never evicted."""
+        self.memory.release_all(self._consumer)
+        page_bytes = image_bytes(self.original_pixmap) + image_bytes(self.original_qimage)
+        self.memory.charge(self._consumer, "page", page_bytes, pinned=True)
+
     def _purge_stale_pixmaps(self):
         """Removes ALL pixmap items from the scene except the video underlay."""
         if not (self.reader_view and self.reader_view.scene):
@@ -86,11 +117,11 @@ class ImageViewer(BaseViewer):
     def load(self, item):
         self._stop_movie()
         self.resize_timer.stop()
-        self.current_request_id += 1
+        token = self._invalidate_load()
         req_id = self.current_request_id
         
         # Reset HQ state
-        self.hq_generation_id += 1
+        self._invalidate_hq()
         self.scaled_pixmap_item = False
         self.original_pixmap = None
         self.original_qimage = None
@@ -102,28 +133,49 @@ class ImageViewer(BaseViewer):
         else:
             return
 
-        # Move animation loading to background for virtual paths to avoid UI freeze
-        if len(paths) == 1:
-            if paths[0].lower().endswith((".gif", ".webp")):
-                if '|' in paths[0]:
-                    pass  # Virtual path animation - fall through to async worker below
-                else:
-                    self._load_single_image_sync(paths[0])
-                    return
-
         vp = self.reader_view.view.viewport()
         if vp:
             base_w = vp.width() / 2 if len(paths) == 2 else vp.width()
             hint_w = int(base_w * vp.devicePixelRatio() * 2)
+            self._anim_target_size = QSize(hint_w, int(vp.height() * vp.devicePixelRatio() * 2))
         else:
             hint_w = 0
-            
-        worker = AsyncLoaderWorker(req_id, paths, hint_w)
+            self._anim_target_size = None
+            
+        if len(paths) == 2:
+            # Decode both pages of a spread as separate tasks sharing one token;
+            # _on_pair_page_loaded joins them before the double view is built
+            self._pair_paths = paths
+            self._pair_results = {}
+            self._pair_pending = 2
+            for path in paths:
+                worker = AsyncLoaderWorker(req_id, [path], hint_w, token=token)
+                worker.signals.finished.connect(self._on_pair_page_loaded)
+                self.reader_view.thread_pool.start(worker)
+            return
+
+        worker = AsyncLoaderWorker(req_id, paths, hint_w, token=token)
         worker.signals.finished.connect(self._on_async_load_finished)
         self.reader_view.thread_pool.start(worker)
 
+    def _on_pair_page_loaded(self, request_id: int, results: dict):
+        if request_id != self.current_request_id:
+            WORK_STATS.record("AsyncLoaderWorker", "discarded")
+            return
+
+        self._pair_results.update(results)
+        self._pair_pending -= 1
+        if self._pair_pending > 0:
+            return
+
+        # Keep left/right order regardless of which decode finished first
+        joined = {p: self._pair_results[p] for p in self._pair_paths if p in self._pair_results}
+        self._pair_results = {}
+        self._on_async_load_finished(request_id, joined)
+
     def _on_async_load_finished(self, request_id: int, results: dict):
         if request_id != self.current_request_id or not self.is_active:
+            WORK_STATS.record("AsyncLoaderWorker", "discarded")
             return
         
         if len(results) == 0:
@@ -137,50 +189,24 @@ class ImageViewer(BaseViewer):
             # Single
             path = loaded_keys[0]
             result = results[path]
-            # Handle new (image, data) format
-            q_img, data = result if isinstance(result, tuple) else (result, None)
+            # Handle new (image, animation source) format
+            q_img, anim_source = result if isinstance(result, tuple) else (result, None)
             
             self._clear_scene_pixmaps()
             
-            if data:
-                # This is an animation loaded from background
-                if path.lower().endswith('.avif'):
-                    self.movie = AvifPlayer(data)
+            pixmap = pixmap_from_image(q_img, "viewer.single")
+            self.original_pixmap = pixmap
+            if anim_source:
+                # Show the first frame now; the player streams the rest from a worker thread
+                self.movie = AnimationPlayer(anim_source, self._anim_target_size)
+                if self.movie.isValid():
                     self.movie.frameChanged.connect(self._on_movie_frame_changed)
-                    
-                    if self.movie.isValid():
-                        self.movie.start()
-                        pixmap = self.movie.currentPixmap()
-                        self.original_pixmap = pixmap
-                        self._set_pixmap(pixmap, path)
-                    else:
-                        self.movie = None
-                        pixmap = QPixmap.fromImage(q_img)
-                        self.original_pixmap = pixmap
-                        self._set_pixmap(pixmap, path)
+                    self.movie.start()
                 else:
-                    self.movie = QMovie()
-                    self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
-                    self.movie_buffer = QBuffer()
-                    self.movie_buffer.setData(QByteArray(data))
-                    self.movie_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
-                    self.movie.setDevice(self.movie_buffer)
-                    
-                    if self.movie.isValid():
-                        self.movie.frameChanged.connect(self._on_movie_frame_changed)
-                        self.movie.start()
-                        pixmap = self.movie.currentPixmap()
-                        self.original_pixmap = pixmap
-                        self._set_pixmap(pixmap, path)
-                    else:
-                        pixmap = QPixmap.fromImage(q_img)
-                        self.original_pixmap = pixmap
-                        self._set_pixmap(pixmap, path)
-            else:
-                pixmap = QPixmap.fromImage(q_img)
-                self.original_pixmap = pixmap
+                    self.movie = None
+            if not self.movie:
                 self.original_qimage = q_img
-                self._set_pixmap(pixmap, path)
+            self._set_pixmap(pixmap, path)
 
             self.resize_timer.start() # Attempt to load HQ version after UI stabilizes
             
@@ -208,11 +234,13 @@ class ImageViewer(BaseViewer):
                 img2 = QImage(img1.width(), img1.height(), QImage.Format.Format_RGB32)
                 img2.fill(Qt.GlobalColor.black)
 
-            pix1 = QPixmap.fromImage(img1)
-            pix2 = QPixmap.fromImage(img2)
+            pix1 = pixmap_from_image(img1, "viewer.double")
+            pix2 = pixmap_from_image(img2, "viewer.double")
             
             self._setup_double_view(pix1, pix2, path1, path2)
 
+        self._account_memory()
+        self.reader_view._hide_resume_overlay()
         self.reader_view.view.reset_zoom_state()
         self.reader_view.apply_last_zoom()
         self._trigger_hq_rescale()
@@ -261,58 +289,15 @@ class ImageViewer(BaseViewer):
         if self.movie:
              self.movie.stop()
              self.movie = None
-        if self.movie_buffer:
-             self.movie_buffer.close()
-             self.movie_buffer = None
-
-    def _load_single_image_sync(self, path: str):
-        self._clear_scene_pixmaps()
-        
-        # Handle animated images via QMovie
-        if path.lower().endswith((".gif", ".webp")):
-            self.movie = QMovie()
-            self.movie.setCacheMode(QMovie.CacheMode.CacheAll)
-            
-            loaded = False
-            if '|' in path:
-                image_data = get_image_data_from_zip(path)
-                if image_data:
-                    self.movie_buffer = QBuffer()
-                    self.movie_buffer.setData(QByteArray(image_data))
-                    self.movie_buffer.open(QIODevice.OpenModeFlag.ReadOnly)
-                    self.movie.setDevice(self.movie_buffer)
-                    loaded = True
-            elif os.path.exists(path):
-                self.movie.setFileName(path)
-                loaded = True
-                
-            if loaded and self.movie.isValid():
-                self.movie.frameChanged.connect(self._on_movie_frame_changed)
-                self.movie.start()
-                # Initial frame
-                self.original_pixmap = self.movie.currentPixmap()
-                self._set_pixmap(self.original_pixmap, path)
-            else:
-                # Fallback if QMovie fails
-                self.original_pixmap = self._load_pixmap(path)
-                self._set_pixmap(self.original_pixmap, path)
-        else:
-             # Standard sync load (fallback or specific use)
-             self.original_pixmap = self._load_pixmap(path)
-             self._set_pixmap(self.original_pixmap, path)
-        self.reader_view.view.reset_zoom_state()
-        self.reader_view.apply_last_zoom()
-        self._trigger_hq_rescale()
-        
-        # Update selection overlay bounds if active
-        if hasattr(self.reader_view.view, '_update_overlay_bounds'):
-            self.reader_view.view._update_overlay_bounds()
 
     def _on_movie_frame_changed(self, frame_number):
         if self.movie and self.pixmap_item:
             pixmap = self.movie.currentPixmap()
             if not pixmap.isNull():
                  self.pixmap_item.setPixmap(pixmap)
+                 # Frames are decoded at display resolution; keep scene coordinates in first-frame units
+                 if self.original_pixmap and pixmap.width() > 0:
+                     self.pixmap_item.setScale(self.original_pixmap.width() / pixmap.width())
 
     def _load_pixmap(self, image_source: Union[str, bytes]) -> QPixmap:
         if image_source == "placeholder":
@@ -493,26 +478,27 @@ class ImageViewer(BaseViewer):
         original_w = self.original_pixmap.width()
         
         if target_w < (original_w * 0.9):
-             self.hq_generation_id += 1
+             token = self._invalidate_hq()
              q_image = self.original_qimage if self.original_qimage and not self.original_qimage.isNull() else self.original_pixmap.toImage()
-             worker = AsyncScaleWorker(q_image, target_w, 0, self.hq_generation_id) # reusing index 0
+             worker = AsyncScaleWorker(q_image, target_w, 0, self.hq_generation_id, token=token) # reusing index 0
              worker.signals.finished.connect(self._on_hq_scale_finished)
              self.reader_view.thread_pool.start(worker)
         else:
              # Invalidate any pending HQ generation since we want original
-             self.hq_generation_id += 1
+             self._invalidate_hq()
              
              if self.scaled_pixmap_item:
                  self._restore_original_pixmap()
 
     def _on_hq_scale_finished(self, index, q_image, generation_id):
         if generation_id != self.hq_generation_id:
+            WORK_STATS.record("AsyncScaleWorker", "discarded")
             return
             
         if not self.pixmap_item:
             return
             
-        scaled_pixmap = QPixmap.fromImage(q_image)
+        scaled_pixmap = pixmap_from_image(q_image, "viewer.hq")
         
         original_w = self.original_pixmap.width()
         scaled_w = scaled_pixmap.width()
@@ -537,6 +523,7 @@ class ImageViewer(BaseViewer):
         self.pixmap_item.setScale(scale_factor)
         
         self.scaled_pixmap_item = True # flag
+        self.memory.charge(self._consumer, "hq", image_bytes(scaled_pixmap), pinned=True)
 
     def _restore_original_pixmap(self):
         if not self.original_pixmap or not self.pixmap_item:
@@ -545,6 +532,7 @@ class ImageViewer(BaseViewer):
         self.pixmap_item.setPixmap(self.original_pixmap)
         self.pixmap_item.setScale(1.0)
         self.scaled_pixmap_item = False
+        self.memory.release(self._consumer, "hq")
 
     def show_next(self):
         pass
@@ -684,6 +672,8 @@ class ImageViewer(BaseViewer):
     def cleanup(self):
         self._stop_movie()
         self.resize_timer.stop()
+        self._invalidate_load()
+        self._invalidate_hq()
 
     def show_overlays(self, overlays: list):
         self.clear_overlays()
@@ -768,4 +758,5 @@ class ImageViewer(BaseViewer):
         self.pixmap_item = None
         self.original_pixmap = None
         self.original_qimage = None
+        self.memory.release_all(self._consumer)
         self.clear_overlays()
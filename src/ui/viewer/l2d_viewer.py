@@ -4,8 +4,11 @@ from pathlib import Path
 from PyQt6.QtCore import QUrl, pyqtSignal
 from PyQt6.QtWebEngineCore import QWebEnginePage
 
+from src.ui.viewer.archive_scheme import archive_url
 from src.ui.viewer.base_viewer import BaseViewer
+from src.ui.viewer.web_engine_host import WebEngineHost
 from src.utils.resource_utils import resource_path
+from src.utils.img_utils import read_member_header
 
 
 class L2DPage(QWebEnginePage):
@@ -49,19 +52,27 @@ class L2DViewer(BaseViewer):
         self._page_ready = False
         self._current_version = None
 
-        web_view = reader_view.model_web_view
-        if web_view is not None:
+        # Created once the shared web view exists, and again if it was released
+        self.page = None
+        self._page_generation = -1
+
+    def _ensure_page(self, web_view):
+        host = WebEngineHost.instance()
+        if self.page is None or self._page_generation != host.generation:
             self.page = L2DPage(web_view)
+            self._page_generation = host.generation
+            self._page_ready = False
 
     def set_active(self, active: bool):
         super().set_active(active)
-        web_view = self.reader_view.model_web_view
+        web_view = self.reader_view.ensure_web_view() if active else self.reader_view.model_web_view
         if web_view is None:
             return
         if active:
             self.reader_view.media_stack.hide()
             self.reader_view.scroll_area.hide()
             
+            self._ensure_page(web_view)
             if web_view.page() is not self.page:
                 web_view.setPage(self.page)
                 try:
@@ -79,17 +90,22 @@ class L2DViewer(BaseViewer):
         else:
             web_view.hide()
             self.reader_view.media_stack.show()
+            self.reader_view.release_web_view()
 
     def _detect_spine_version(self, path: str) -> str:
         try:
-            with open(path, 'rb') as f:
-                data = f.read(100)
-                if b'3.8.' in data:
-                    return '3.8'
-                if b'4.0.' in data:
-                    return '4.0'
-                if b'4.1.' in data or b'4.2.' in data:
-                    return '4.1'
+            if '|' in path:
+                # Only the header; this runs on the GUI thread
+                data = read_member_header(path, 100) or b''
+            else:
+                with open(path, 'rb') as f:
+                    data = f.read(100)
+            if b'3.8.' in data:
+                return '3.8'
+            if b'4.0.' in data:
+                return '4.0'
+            if b'4.1.' in data or b'4.2.' in data:
+                return '4.1'
         except Exception:
             pass
         return '4.1'  # Default to newer
@@ -100,7 +116,8 @@ class L2DViewer(BaseViewer):
             return
 
         try:
-            model_url = QUrl.fromLocalFile(path).toString()
+            # Archive members that are not extracted are served by the mrarchive:// scheme
+            model_url = archive_url(path) if '|' in path else QUrl.fromLocalFile(path).toString()
         except Exception as e:
             print(f'L2DViewer: cannot process path {path}: {e}')
             return
@@ -222,3 +239,4 @@ class L2DViewer(BaseViewer):
 
     def cleanup(self):
         self.reset()
+        self.reader_view.release_web_view()
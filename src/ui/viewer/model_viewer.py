@@ -5,7 +5,9 @@ from pathlib import Path
 from PyQt6.QtCore import QUrl, pyqtSignal
 from PyQt6.QtWebEngineCore import QWebEnginePage
 
+from src.ui.viewer.archive_scheme import archive_url
 from src.ui.viewer.base_viewer import BaseViewer
+from src.ui.viewer.web_engine_host import WebEngineHost
 from src.utils.resource_utils import resource_path
 
 _MIME = {'.glb': 'model/gltf-binary', '.gltf': 'model/gltf+json'}
@@ -38,19 +40,27 @@ class ModelViewer(BaseViewer):
         self._pending_url = None
         self._page_ready = False
 
-        web_view = reader_view.model_web_view
-        if web_view is not None:
+        # Created once the shared web view exists, and again if it was released
+        self.page = None
+        self._page_generation = -1
+
+    def _ensure_page(self, web_view):
+        host = WebEngineHost.instance()
+        if self.page is None or self._page_generation != host.generation:
             self.page = ModelPage(web_view)
+            self._page_generation = host.generation
+            self._page_ready = False
 
     def set_active(self, active: bool):
         super().set_active(active)
-        web_view = self.reader_view.model_web_view
+        web_view = self.reader_view.ensure_web_view() if active else self.reader_view.model_web_view
         if web_view is None:
             return
         if active:
             self.reader_view.media_stack.hide()
             self.reader_view.scroll_area.hide()
             
+            self._ensure_page(web_view)
             if web_view.page() is not self.page:
                 web_view.setPage(self.page)
                 try:
@@ -66,6 +76,7 @@ class ModelViewer(BaseViewer):
         else:
             web_view.hide()
             self.reader_view.media_stack.show()
+            self.reader_view.release_web_view()
 
     def load(self, path: str):
         web_view = self.reader_view.model_web_view
@@ -74,7 +85,8 @@ class ModelViewer(BaseViewer):
 
         ext = Path(path).suffix.lower()
         try:
-            model_url = QUrl.fromLocalFile(path).toString()
+            # Archive members that are not extracted are served by the mrarchive:// scheme
+            model_url = archive_url(path) if '|' in path else QUrl.fromLocalFile(path).toString()
         except Exception as e:
             print(f'ModelViewer: cannot process path {path}: {e}')
             return
@@ -159,3 +171,4 @@ class ModelViewer(BaseViewer):
 
     def cleanup(self):
         self.reset()
+        self.reader_view.release_web_view()
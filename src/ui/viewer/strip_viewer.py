@@ -4,6 +4,9 @@ from PyQt6.QtCore import Qt, QTimer, QEvent
 
 from src.ui.viewer.base_viewer import BaseViewer
 from src.workers.view_workers import PixmapLoader, AsyncScaleWorker, VIDEO_EXTS
+from src.utils.img_utils import pixmap_from_image
+from src.core.task_scheduler import TaskPriority, CancellationToken, WORK_STATS
+from src.utils.memory_budget import MemoryBudget, image_bytes
 
 class StripViewer(BaseViewer):
     def __init__(self, reader_view):
@@ -35,6 +38,8 @@ class StripViewer(BaseViewer):
         self.eager_scale_timer.timeout.connect(self._process_eager_queue)
         self.MAX_CONCURRENT_LOADS = 4
         self.layout_generation = 0
+        self._layout_token = CancellationToken() # cancelled when layout_generation moves on
+        self._scale_token = CancellationToken() # cancelled when cached scales are invalidated
         self.current_model_images = None
         self._queue_process_scheduled = False
         self.pending_anchor = None
@@ -43,6 +48,16 @@ class StripViewer(BaseViewer):
         self.label_to_model: list[int] = []   # label_idx -> model_idx
         self.model_to_label: dict[int, int] = {}  # model_idx -> label_idx
 
+        # Decoded and scaled pages are evictable; evicted pages reload when scrolled back into view
+        self.memory = MemoryBudget.instance()
+        # Consumer names are per viewer: every opened series gets its own ReaderView
+        self._pages_consumer = f"strip.pages#{id(self)}"
+        self._scaled_consumer = f"strip.scaled#{id(self)}"
+        self.memory.register(self._pages_consumer, lambda i: self.page_pixmaps.pop(i, None))
+        self.memory.register(self._scaled_consumer, self._evict_scaled)
+        consumers = (self._pages_consumer, self._scaled_consumer)
+        reader_view.destroyed.connect(lambda: [MemoryBudget.instance().unregister(c) for c in consumers])
+
         
     def set_active(self, active: bool):
         super().set_active(active)
@@ -86,6 +101,8 @@ class StripViewer(BaseViewer):
                 del self.page_pixmaps[label_index]
             if label_index in self.scaled_pixmaps:
                 del self.scaled_pixmaps[label_index]
+            self.memory.release(self._pages_consumer, label_index)
+            self.memory.release(self._scaled_consumer, label_index)
 
             if label_index in self.loading_indices:
                 self.loading_indices.remove(label_index)
@@ -95,6 +112,8 @@ class StripViewer(BaseViewer):
         else:
             self.page_pixmaps.clear()
             self.scaled_pixmaps.clear()
+            self.memory.release_all(self._pages_consumer)
+            self.memory.release_all(self._scaled_consumer)
             self.loading_indices.clear()
 
             if self.page_labels:
@@ -111,6 +130,9 @@ class StripViewer(BaseViewer):
 
     def _show_vertical_layout(self):
         self.layout_generation += 1
+        self._layout_token.cancel()
+        self._layout_token = CancellationToken()
+        self._reset_scale_token()
         self.current_model_images = self.reader_view.model.images
 
         # Initialize zoom from ReaderView state
@@ -130,6 +152,8 @@ class StripViewer(BaseViewer):
         self.page_labels.clear()
         self.page_pixmaps.clear()
         self.scaled_pixmaps.clear()
+        self.memory.release_all(self._pages_consumer)
+        self.memory.release_all(self._scaled_consumer)
         self.load_queue.clear()
         self.scaling_indices.clear()
         self.eager_scale_queue.clear()
@@ -210,12 +234,14 @@ class StripViewer(BaseViewer):
                 continue
 
             model_idx = self.label_to_model[index]
-            worker = PixmapLoader(images[model_idx].path, index, self.reader_view.image_viewer._load_pixmap, self.layout_generation)
+            worker = PixmapLoader(images[model_idx].path, index, self.reader_view.image_viewer._load_pixmap, self.layout_generation, token=self._layout_token)
             worker.signals.finished.connect(self._on_image_loaded)
-            self.reader_view.thread_pool.start(worker)
+            priority = TaskPriority.VISIBLE if index == visible_index else TaskPriority.STRIP
+            self.reader_view.thread_pool.start(worker, priority)
 
     def _on_image_loaded(self, index: int, pixmap: QImage, generation_id: int):
         if generation_id != self.layout_generation:
+            WORK_STATS.record("PixmapLoader", "discarded")
             return
 
         if index in self.loading_indices:
@@ -223,6 +249,7 @@ class StripViewer(BaseViewer):
             
         if index < len(self.page_labels):
             self.page_pixmaps[index] = pixmap
+            self.memory.charge(self._pages_consumer, index, image_bytes(pixmap))
             
             # Scroll Anchoring Logic
             lbl = self.page_labels[index]
@@ -284,7 +311,16 @@ class StripViewer(BaseViewer):
             lbl_bottom = lbl.y() + lbl.height()
 
             if lbl_bottom >= viewport_top - 1000 and lbl_top <= viewport_bottom + 1000:
-                if i in self.page_pixmaps:
+                if i not in self.page_pixmaps:
+                    # Evicted by the memory budget; decode it again
+                    if i not in self.loading_indices and i not in self.load_queue:
+                        self.load_queue.append(i)
+                        if not self._queue_process_scheduled:
+                            self._queue_process_scheduled = True
+                            QTimer.singleShot(100, self._process_load_queue)
+                else:
+                    self.memory.touch(self._pages_consumer, i)
+                    self.memory.touch(self._scaled_consumer, i)
                     # Optimize: only resize if needed (e.g. placeholder or size mismatch)
                     # _resize_single_label handles caching
                     
@@ -306,6 +342,10 @@ class StripViewer(BaseViewer):
                  # For now, keep it simple.
                  pass
 
+    def _reset_scale_token(self):
+        self._scale_token.cancel()
+        self._scale_token = CancellationToken()
+
     def _get_target_width(self, pixmap: QPixmap, viewport_w: int = None) -> int:
         if viewport_w is None:
              viewport_w = self.reader_view.scroll_area.viewport().width()
@@ -342,12 +382,13 @@ class StripViewer(BaseViewer):
 
         # Start Async Scale
         self.scaling_indices.add(index)
-        worker = AsyncScaleWorker(orig_pix, target_w, index, self.layout_generation, high_quality=False)
+        worker = AsyncScaleWorker(orig_pix, target_w, index, self.layout_generation, high_quality=False, token=self._scale_token)
         worker.signals.finished.connect(self._on_image_scaled)
         self.reader_view.thread_pool.start(worker)
 
     def _on_image_scaled(self, index: int, q_image: QImage, generation_id: int):
         if generation_id != self.layout_generation:
+            WORK_STATS.record("AsyncScaleWorker", "discarded")
             return
 
         if index in self.scaling_indices:
@@ -360,11 +401,13 @@ class StripViewer(BaseViewer):
         target_w = self._get_target_width(self.page_pixmaps[index])
         if abs(q_image.width() - target_w) > 5:
             # Stale result (user probably resized again while this was processing)
+            WORK_STATS.record("AsyncScaleWorker", "discarded")
             return
 
         # Convert back to QPixmap on main thread
-        pixmap = QPixmap.fromImage(q_image)
+        pixmap = pixmap_from_image(q_image, "strip.scaled")
         self.scaled_pixmaps[index] = pixmap
+        self.memory.charge(self._scaled_consumer, index, image_bytes(pixmap))
         
         # Memory Safety: Cache Pruning
         if len(self.scaled_pixmaps) > 50:
@@ -373,7 +416,8 @@ class StripViewer(BaseViewer):
             keys_to_remove = sorted(self.scaled_pixmaps.keys(), key=lambda k: abs(k - current_idx), reverse=True)
             # Remove top 10 furthest
             for k in keys_to_remove[:10]:
-                del self.scaled_pixmaps[k]
+                self._evict_scaled(k)
+                self.memory.release(self._scaled_consumer, k)
         
         # Update label if still valid
         if index < len(self.page_labels):
@@ -383,6 +427,11 @@ class StripViewer(BaseViewer):
              lbl.setPixmap(pixmap)
              lbl.setFixedHeight(pixmap.height())
 
+    def _evict_scaled(self, index: int):
+        """Drop a scaled page and the label's copy of it; the label keeps its height and rescales when seen."""
+        if self.scaled_pixmaps.pop(index, None) is not None and index < len(self.page_labels):
+            self.page_labels[index].setText("Loading...")
+
     def _resize_vertical_images(self):
         if not self.reader_view.scroll_area.isVisible():
             return
@@ -407,8 +456,10 @@ class StripViewer(BaseViewer):
 
         # Invalidate cache on resize/zoom
         self.scaled_pixmaps.clear()
+        self.memory.release_all(self._scaled_consumer)
         
         self.scaling_indices.clear()
+        self._reset_scale_token()
         
         # 1. Iterate visible range first
         visible_indices = []
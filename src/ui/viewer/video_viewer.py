@@ -11,6 +11,7 @@ from src.ui.viewer.base_viewer import BaseViewer
 from src.ui.viewer.subtitle_overlay import SubtitleOverlay, FONT_SIZES
 from src.workers.view_workers import VideoMetadataWorker, VideoTimestampFrameExtractorWorker, VIDEO_EXTS
 from src.utils.img_utils import get_image_format_from_ext, compress_qimage_to_size
+from src.core.task_scheduler import TaskPriority
 
 class VideoItem(QGraphicsVideoItem):
     context_menu_requested = pyqtSignal(object) # QPointF (scene pos)
@@ -113,7 +114,7 @@ class VideoViewer(BaseViewer):
         frames_open = getattr(getattr(self.reader_view, 'top_strip', None), '_tab', -1) == 2
         self.active_meta_worker = VideoMetadataWorker(path, extract_frames=frames_open)
         self.active_meta_worker.signals.finished.connect(self._on_video_metadata)
-        self.reader_view.thread_pool.start(self.active_meta_worker)
+        self.reader_view.thread_pool.start(self.active_meta_worker, TaskPriority.INFO)
 
         self.media_player.setVideoOutput(self.video_item)
         self.media_player.setSource(QUrl.fromLocalFile(path))
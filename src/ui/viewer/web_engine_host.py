@@ -0,0 +1,110 @@
+from PyQt6 import sip
+from PyQt6.QtCore import QObject, QTimer
+
+IDLE_RELEASE_MS = 2 * 60 * 1000
+
+
+class WebEngineHost(QObject):
+    """Owns the one QWebEngineView shared by the Live2D and 3D model viewers.
+
+    The view (and its Chromium render process) is only created the first time a
+    .skel/.glb page is shown, then moved between readers as they need it. Once no
+    viewer uses it, the page is frozen; after IDLE_RELEASE_MS the view is deleted
+    and the memory returned. Viewers recreate their pages when ``generation`` changes.
+    """
+    _instance = None
+
+    def __init__(self):
+        super().__init__()
+        self.view = None
+        self.owner = None
+        self.generation = 0
+        self._available = None
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(IDLE_RELEASE_MS)
+        self._idle_timer.timeout.connect(self._release_view)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = WebEngineHost()
+        return cls._instance
+
+    def is_available(self) -> bool:
+        """True if pyqt6-webengine is installed; the app still runs without it."""
+        if self._available is None:
+            try:
+                # Imported, not just found: a wheel with broken Qt libraries fails only here
+                from PyQt6.QtWebEngineWidgets import QWebEngineView  # noqa: F401 - availability probe
+                self._available = True
+            except Exception as e:
+                print(f'WebEngineHost: QWebEngineView unavailable: {e}')
+                self._available = False
+        return self._available
+
+    def acquire(self, owner):
+        """Attach the shared view to owner (a ReaderView) and return it, or None."""
+        self._idle_timer.stop()
+        if not self.is_available():
+            return None
+
+        if self.view is not None and sip.isdeleted(self.view):
+            # Destroyed together with a previous owner
+            self.view = None
+            self.owner = None
+        if self.view is None:
+            self._create_view()
+
+        if self.owner is not owner:
+            if self.owner is not None and not sip.isdeleted(self.owner):
+                self.owner.detach_web_view()
+            self.owner = owner
+            self.view.setParent(owner)
+            owner.attach_web_view(self.view)
+
+        self._set_lifecycle("Active")
+        return self.view
+
+    def release(self, owner):
+        """owner no longer shows web content; freeze it and start the idle countdown."""
+        if owner is not self.owner or self.view is None or sip.isdeleted(self.view):
+            return
+        self._set_lifecycle("Frozen")
+        self._idle_timer.start()
+
+    def _create_view(self):
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebEngineCore import QWebEngineSettings
+        from src.ui.viewer.archive_scheme import ArchiveSchemeHandler
+        self.view = QWebEngineView()
+        ArchiveSchemeHandler.instance().install(self.view.page().profile())
+        ws = self.view.page().settings()
+        ws.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
+        ws.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessRemoteUrls, True)
+        self.view.hide()
+        self.generation += 1
+
+    def _set_lifecycle(self, state: str):
+        # Frozen pages stop running scripts and timers; only hidden pages may be frozen
+        try:
+            from PyQt6.QtWebEngineCore import QWebEnginePage
+            target = getattr(QWebEnginePage.LifecycleState, state)
+            page = self.view.page()
+            if page.lifecycleState() != target:
+                page.setLifecycleState(target)
+        except Exception:
+            pass
+
+    def _release_view(self):
+        if self.view is None:
+            return
+        if not sip.isdeleted(self.view):
+            if self.view.isVisible():
+                return # In use again
+            if self.owner is not None and not sip.isdeleted(self.owner):
+                self.owner.detach_web_view()
+            self.view.setParent(None)
+            self.view.deleteLater()
+        self.view = None
+        self.owner = None
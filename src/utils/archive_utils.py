@@ -1,4 +1,5 @@
 import os
+import sys
 import shutil
 import platform
 import subprocess
@@ -15,6 +16,7 @@ ARCHIVE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
 _LIST_LOCK = threading.Lock()
 _ARCHIVE_LOCKS = {}
+_LISTING_LOCKS = {}
 _LOCKS_LOCK = threading.Lock()
 _GLOBAL_7Z_SEMAPHORE = threading.Semaphore(4) # Limit concurrent 7z processes
 
@@ -42,10 +44,11 @@ def is_zip(path: str) -> bool:
 
 def split_virtual_path(path: str) -> tuple[str, str]:
     """Split a virtual path 'archive.zip|internal/file' into (archive, internal).
-    If *path* is not virtual, returns (path, '')."""
+    If *path* is not virtual, returns (path, '').
+    The archive part is interned, so every page of an archive shares one string."""
     if '|' in path:
         archive, internal = path.split('|', 1)
-        return archive, internal
+        return sys.intern(archive), internal
     return path, ''
 
 def get_archive_lock(archive_path: str) -> threading.Lock:
@@ -55,6 +58,14 @@ def get_archive_lock(archive_path: str) -> threading.Lock:
             _ARCHIVE_LOCKS[path_str] = threading.Lock()
         return _ARCHIVE_LOCKS[path_str]
 
+def get_listing_lock(archive_path: str) -> threading.Lock:
+    """Per-archive lock for 7z listings, apart from the extraction lock so a listing never waits on extract_all."""
+    path_str = str(archive_path)
+    with _LOCKS_LOCK:
+        if path_str not in _LISTING_LOCKS:
+            _LISTING_LOCKS[path_str] = threading.Lock()
+        return _LISTING_LOCKS[path_str]
+
 def find_executable(names: list[str], extra_paths: list[str] = []) -> Optional[str]:
     """
     Find an executable by trying multiple names and extra paths.
@@ -117,6 +128,12 @@ class SevenZipHandler:
             if cache_key in SevenZipHandler.LIST_CACHE:
                 return SevenZipHandler.LIST_CACHE[cache_key]
 
+        # Only one listing per archive; different archives are listed concurrently
+        with get_listing_lock(path_str):
+            with _LIST_LOCK:
+                if cache_key in SevenZipHandler.LIST_CACHE:
+                    return SevenZipHandler.LIST_CACHE[cache_key]
+
             try:
                 cmd = [SEVEN_ZIP_PATH, "l", "-slt", path_str, "-sccUTF-8"]
                 
@@ -125,7 +142,8 @@ class SevenZipHandler:
                     startupinfo = subprocess.STARTUPINFO()
                     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
                     
-                with _GLOBAL_7Z_SEMAPHORE:
+                from src.utils.io_scheduler import IOScheduler
+                with _GLOBAL_7Z_SEMAPHORE, IOScheduler.instance().read_slot(path_str):
                     result = subprocess.run(
                         cmd, 
                         capture_output=True, 
@@ -161,7 +179,8 @@ class SevenZipHandler:
                 if current_path and not is_folder:
                     files.append(current_path)
                     
-                SevenZipHandler.LIST_CACHE[cache_key] = files
+                with _LIST_LOCK:
+                    SevenZipHandler.LIST_CACHE[cache_key] = files
                 return files
             except subprocess.TimeoutExpired:
                 print(f"7z Timeout listing {archive_path}")
@@ -210,7 +229,8 @@ class SevenZipHandler:
                         startupinfo = subprocess.STARTUPINFO()
                         startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
 
-                    with _GLOBAL_7Z_SEMAPHORE:
+                    from src.utils.io_scheduler import IOScheduler
+                    with _GLOBAL_7Z_SEMAPHORE, IOScheduler.instance().read_slot(str(archive_path)):
                         subprocess.run(cmd, capture_output=True, startupinfo=startupinfo, timeout=timeout)
 
                     if target_path.exists():
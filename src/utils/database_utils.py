@@ -1,27 +1,112 @@
 
 import sys
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 
+STATEMENT_CACHE_SIZE = 512
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",        # readers no longer block the writer (persists in the file)
+    "PRAGMA synchronous = NORMAL",      # safe with WAL; fsync at checkpoints only
+    "PRAGMA cache_size = -65536",       # 64 MB page cache per connection
+    "PRAGMA mmap_size = 268435456",     # read through up to 256 MB of memory-mapped I/O
+    "PRAGMA temp_store = MEMORY",
+)
+
+POOL_SIZE = 4 # idle connections kept open between calls; any more are closed when released
+
+_local = threading.local()
+_connections = set() # every open connection, idle or in use
+_idle = [] # open connections no thread holds, most recently released last
+_connections_lock = threading.Lock()
+
 def _db_path() -> Path:
     if getattr(sys, 'frozen', False):
         return Path(sys.executable).parent / "library.db"
     return Path(__file__).resolve().parent.parent.parent / "library.db"
 
+class ManagedConnection(sqlite3.Connection):
+    """Pooled connection, held by one thread from get_db_connection() to the matching close().
+
+    close() rolls back what the caller left uncommitted, which is what closing a
+    throwaway connection used to do, and hands the connection back to the pool once
+    the thread's outermost user is done. close_all_connections() really closes it.
+    """
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+        if getattr(_local, 'conn', None) is not self:
+            return
+        _local.depth -= 1
+        if _local.depth > 0:
+            return
+        _local.conn = None
+        with _connections_lock:
+            if self not in _connections:
+                return # closed by close_all_connections() meanwhile
+            if len(_idle) < POOL_SIZE:
+                _idle.append(self)
+                return
+            _connections.discard(self)
+        self._close()
+
+    def _close(self):
+        super().close()
+
 def get_db_connection():
-    db_path = _db_path()
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """A library connection for the calling thread until it calls close(), opened and tuned on first use.
+
+    Nested calls in one thread share the connection. Threads that come and go (pool
+    workers, web server requests) reuse the pool's idle connections instead of each
+    keeping one open.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        _local.depth += 1
+        return conn
+    with _connections_lock:
+        conn = _idle.pop() if _idle else None
+    if conn is None:
+        conn = sqlite3.connect(_db_path(), factory=ManagedConnection,
+                               cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        with _connections_lock:
+            _connections.add(conn)
+    _local.conn = conn
+    _local.depth = 1
     return conn
 
+def close_all_connections():
+    """Close every open connection, e.g. on quit. Must not race with running queries."""
+    with _connections_lock:
+        connections = list(_connections)
+        _connections.clear()
+        _idle.clear()
+    _local.conn = None
+    for conn in connections:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.execute("PRAGMA optimize")
+            conn._close()
+        except sqlite3.Error:
+            pass
+
 @contextmanager
 def db_cursor():
-    """Context manager that opens a connection and yields (conn, cursor), closing on exit."""
+    """Context manager yielding (conn, cursor) on the thread's connection.
+
+    Anything left uncommitted on exit is rolled back.
+    """
     conn = get_db_connection()
+    cursor = conn.cursor()
     try:
-        yield conn, conn.cursor()
+        yield conn, cursor
     finally:
+        cursor.close()
         conn.close()
 
 def create_tables():
@@ -137,4 +222,116 @@ def create_tables():
                 cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col} {col_type}")
 
     conn.commit()
+    _apply_schema_versions(conn)
     conn.close()
+
+# (tag table, junction table, junction column) for each kind of series tag
+TAG_TABLES = (
+    ('authors', 'series_authors', 'author_id'),
+    ('genres',  'series_genres',  'genre_id'),
+    ('themes',  'series_themes',  'theme_id'),
+    ('formats', 'series_formats', 'format_id'),
+)
+
+# All author names of one series, space separated, as indexed in series_search
+_SERIES_AUTHORS_TEXT = """(SELECT coalesce(group_concat(a.name, ' '), '') FROM series_authors sa
+    JOIN authors a ON a.id = sa.author_id WHERE sa.series_id = {sid})"""
+
+# Versioned migrations, applied in order and tracked in PRAGMA user_version
+SCHEMA_VERSIONS = [
+    (1, [
+        # Chapter lists and _populate_metadata look chapters up by series
+        "CREATE INDEX IF NOT EXISTS idx_chapters_series ON chapters (series_id)",
+        # Junction tables are keyed (series_id, tag_id); filtering by tag needs the reverse
+        "CREATE INDEX IF NOT EXISTS idx_series_authors_author ON series_authors (author_id, series_id)",
+        "CREATE INDEX IF NOT EXISTS idx_series_genres_genre ON series_genres (genre_id, series_id)",
+        "CREATE INDEX IF NOT EXISTS idx_series_themes_theme ON series_themes (theme_id, series_id)",
+        "CREATE INDEX IF NOT EXISTS idx_series_formats_format ON series_formats (format_id, series_id)",
+        "CREATE INDEX IF NOT EXISTS idx_series_last_opened ON series (last_opened_date) WHERE last_opened_date IS NOT NULL",
+        "ANALYZE",
+    ]),
+    (2, [
+        # Full-text search over titles, authors and descriptions. The trigram tokenizer
+        # matches any substring of 3+ characters, so CJK titles (no word breaks) work too.
+        "CREATE VIRTUAL TABLE IF NOT EXISTS series_search USING fts5(name, authors, description, tokenize = 'trigram')",
+        """CREATE TRIGGER IF NOT EXISTS series_search_insert AFTER INSERT ON series BEGIN
+            INSERT INTO series_search (rowid, name, authors, description)
+            VALUES (new.id, new.name, '', coalesce(new.description, ''));
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS series_search_update AFTER UPDATE OF name, description ON series BEGIN
+            UPDATE series_search SET name = new.name, description = coalesce(new.description, '')
+            WHERE rowid = new.id;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS series_search_delete AFTER DELETE ON series BEGIN
+            DELETE FROM series_search WHERE rowid = old.id;
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS series_search_author_insert AFTER INSERT ON series_authors BEGIN
+            UPDATE series_search SET authors = {_SERIES_AUTHORS_TEXT.format(sid='new.series_id')}
+            WHERE rowid = new.series_id;
+        END""",
+        f"""CREATE TRIGGER IF NOT EXISTS series_search_author_delete AFTER DELETE ON series_authors BEGIN
+            UPDATE series_search SET authors = {_SERIES_AUTHORS_TEXT.format(sid='old.series_id')}
+            WHERE rowid = old.series_id;
+        END""",
+        "DELETE FROM series_search",
+        f"""INSERT INTO series_search (rowid, name, authors, description)
+            SELECT s.id, s.name, {_SERIES_AUTHORS_TEXT.format(sid='s.id')}, coalesce(s.description, '')
+            FROM series s""",
+    ]),
+    (3, [
+        # Each tag keeps the number of series using it, maintained as tags are linked
+        # and unlinked, so facet counts need no GROUP BY over the junction tables
+        statement
+        for table, junction, fk in TAG_TABLES
+        for statement in (
+            f"ALTER TABLE {table} ADD COLUMN series_count INTEGER NOT NULL DEFAULT 0",
+            f"""CREATE TRIGGER IF NOT EXISTS {junction}_count_insert AFTER INSERT ON {junction} BEGIN
+                UPDATE {table} SET series_count = series_count + 1 WHERE id = new.{fk};
+            END""",
+            f"""CREATE TRIGGER IF NOT EXISTS {junction}_count_delete AFTER DELETE ON {junction} BEGIN
+                UPDATE {table} SET series_count = series_count - 1 WHERE id = old.{fk};
+            END""",
+            f"UPDATE {table} SET series_count = (SELECT COUNT(*) FROM {junction} j WHERE j.{fk} = {table}.id)",
+        )
+    ]),
+    (4, [
+        # What the last scan of each series path saw (folder mtimes and listings, archive
+        # sizes, mtimes and chapters, the scan result) so rescans only re-walk what
+        # changed, and whether the folder was missing or offline. See core/scan_journal.
+        """CREATE TABLE IF NOT EXISTS scan_journal (
+            path TEXT PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'ok',
+            state TEXT,
+            result TEXT,
+            scanned_at DATETIME
+        )""",
+    ]),
+]
+
+# Versions whose features the app can run without (FTS5 may not be compiled in)
+_OPTIONAL_VERSIONS = {2}
+
+def _apply_schema_versions(conn):
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    for version, statements in SCHEMA_VERSIONS:
+        if version <= current:
+            continue
+        try:
+            conn.execute("BEGIN") # DDL included, so a failed version leaves nothing behind
+            for statement in statements:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            if version not in _OPTIONAL_VERSIONS:
+                print(f"Error migrating library database to version {version}: {e}")
+                return
+            print(f"Skipping library database version {version} ({e}); continuing without it")
+            conn.execute(f"PRAGMA user_version = {version}")
+
+def has_search_index() -> bool:
+    """Whether the FTS5 series_search table exists (SQLite built without FTS5 has none)."""
+    with db_cursor() as (_, cursor):
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'series_search'")
+        return cursor.fetchone() is not None
@@ -0,0 +1,293 @@
+import io
+import json
+import statistics
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from PyQt6.QtCore import QBuffer, QByteArray, QSize, QT_VERSION_STR
+from PyQt6.QtGui import QImage, QImageReader
+
+from src.core.decode_process import apply_orientation
+
+try:
+    import pillow_avif  # noqa: F401 - registers the AVIF plugin with Pillow
+except ImportError:
+    pass
+
+BENCHMARK_PATH = Path('.cache/decoder_benchmark.json')
+LARGE_PIXELS = 4_000_000 # above this, an image is in the "large" resolution class
+MAX_MEAN_ERROR = 4.0 # per channel, 0-255; JPEG IDCT implementations differ slightly
+MAX_SCALED_MEAN_ERROR = 12.0 # scaled decodes also differ in resampling filter
+
+
+def sniff_format(header: bytes) -> str:
+    """Image format from magic bytes ('jpeg', 'png', ...), or '' if unknown."""
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'png'
+    if header.startswith((b'GIF87a', b'GIF89a')):
+        return 'gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'webp'
+    if header[4:8] == b'ftyp' and header[8:12] in (b'avif', b'avis'):
+        return 'avif'
+    if header.startswith(b'BM'):
+        return 'bmp'
+    return ''
+
+
+def read_magic(source) -> bytes:
+    """First bytes of a file path or in-memory image."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:32])
+    try:
+        with open(source, 'rb') as f:
+            return f.read(32)
+    except OSError:
+        return b''
+
+
+def resolution_class(size: QSize) -> str:
+    if size.isValid() and size.width() * size.height() > LARGE_PIXELS:
+        return 'large'
+    return 'small'
+
+
+class QtDecoder:
+    """QImageReader; scaled decodes let the JPEG plugin skip DCT coefficients."""
+    name = 'qt'
+    formats = frozenset({'jpeg', 'png', 'gif', 'webp', 'bmp', 'avif'})
+
+    def _reader(self, source):
+        if isinstance(source, (bytes, bytearray)):
+            buffer = QBuffer()
+            buffer.setData(QByteArray(bytes(source)))
+            buffer.open(QBuffer.OpenModeFlag.ReadOnly)
+            return QImageReader(buffer), buffer
+        return QImageReader(source), None
+
+    def probe(self, source) -> QSize:
+        reader, buffer = self._reader(source)
+        return reader.size()
+
+    def decode(self, source, size: QSize = None) -> QImage:
+        reader, buffer = self._reader(source)
+        reader.setAutoTransform(True)
+        if size is not None and size.isValid():
+            reader.setScaledSize(size)
+        return reader.read()
+
+
+class PillowDecoder:
+    """Pillow (and pillow-avif). JPEGs are drafted, i.e. libjpeg-turbo decodes at 1/2..1/8 scale."""
+    name = 'pillow'
+    formats = frozenset({'jpeg', 'png', 'gif', 'webp', 'bmp', 'avif'})
+
+    def _open(self, source):
+        return Image.open(io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source)
+
+    def probe(self, source) -> QSize:
+        with self._open(source) as img:
+            return QSize(img.width, img.height)
+
+    def decode(self, source, size: QSize = None) -> QImage:
+        # Like QImageReader.setScaledSize, size is in stored (pre-rotation) pixels: scale, then rotate
+        with self._open(source) as img:
+            orientation = img.getexif().get(0x0112, 1)
+            if size is not None and size.isValid() and img.format == 'JPEG':
+                img.draft('RGB', (size.width(), size.height()))
+            img = img.convert('RGBA')
+        if size is not None and size.isValid() and img.size != (size.width(), size.height()):
+            img = img.resize((size.width(), size.height()), Image.Resampling.LANCZOS)
+        img = apply_orientation(img, orientation)
+        data = img.tobytes('raw', 'RGBA')
+        return QImage(data, img.width, img.height, img.width * 4, QImage.Format.Format_RGBA8888).copy()
+
+
+class DecoderRegistry:
+    """Picks an image decoder by sniffed format and resolution class.
+
+    Without benchmark results, Qt is tried first and Pillow second. ``run_benchmark``
+    times every backend on a generated corpus, drops backends whose output differs
+    from the others, and stores the fastest order per (format, resolution class).
+    A backend that fails on a file always falls through to the next one.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._decoders = {}
+        self._default_order = []
+        self._preferred = {} # (format, resolution class) -> [decoder names]
+        self._lock = threading.Lock()
+        self.process_pool = None # DecodePool, when decoding in worker processes is enabled
+        self.register(QtDecoder())
+        self.register(PillowDecoder())
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = DecoderRegistry()
+        return cls._instance
+
+    def register(self, decoder):
+        self._decoders[decoder.name] = decoder
+        if decoder.name not in self._default_order:
+            self._default_order.append(decoder.name)
+
+    def candidates(self, fmt: str, res_class: str = 'small') -> list:
+        preferred = self._preferred.get((fmt, res_class), [])
+        names = preferred + [n for n in self._default_order if n not in preferred]
+        return [self._decoders[n] for n in names if n in self._decoders and (not fmt or fmt in self._decoders[n].formats)]
+
+    def probe(self, source) -> QSize:
+        """Pixel size from the image header, or an invalid QSize."""
+        fmt = sniff_format(read_magic(source))
+        for decoder in self.candidates(fmt):
+            try:
+                size = decoder.probe(source)
+            except Exception:
+                continue
+            if size.isValid():
+                return size
+        return QSize()
+
+    def decode(self, source, size: QSize = None, source_size: QSize = None) -> QImage:
+        """Decode a file path or bytes, scaled to size if given. Returns a null QImage on failure."""
+        if self.process_pool is not None:
+            # A null image here means the file crashed a worker; do not retry it in-process
+            image = self.process_pool.decode(source, size)
+            if image is not None:
+                return image
+        fmt = sniff_format(read_magic(source))
+        res_class = resolution_class(source_size if source_size is not None else (size or QSize()))
+        for decoder in self.candidates(fmt, res_class):
+            try:
+                image = decoder.decode(source, size)
+            except Exception as e:
+                print(f"Decoder {decoder.name} failed on {fmt or 'unknown'} image: {e}")
+                continue
+            if not image.isNull():
+                return image
+        return QImage()
+
+    # --- benchmark ---
+
+    def _benchmark_key(self) -> str:
+        import PIL
+        return f"qt={QT_VERSION_STR};pil={PIL.__version__};decoders={','.join(sorted(self._decoders))}"
+
+    def load_benchmark(self) -> bool:
+        """Apply stored benchmark results; False if there are none for this environment."""
+        try:
+            with open(BENCHMARK_PATH, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if data.get('key') != self._benchmark_key():
+            return False
+        self._apply(data.get('order', {}))
+        return True
+
+    def _apply(self, order: dict):
+        preferred = {}
+        for key, names in order.items():
+            fmt, _, res_class = key.partition('/')
+            preferred[(fmt, res_class)] = list(names)
+        with self._lock:
+            self._preferred = preferred
+
+    def run_benchmark(self, repeats: int = 3) -> dict:
+        """Time each backend per format and resolution class, then store and apply the order."""
+        order = {}
+        timings = {}
+        for res_class, (w, h) in (('small', (800, 1200)), ('large', (2000, 3000))):
+            reference_image = _corpus_image(w, h)
+            for fmt in ('jpeg', 'png', 'webp', 'avif'):
+                data = _encode(reference_image, fmt)
+                if not data:
+                    continue
+                scaled = QSize(w // 3, h // 3)
+                # Outputs are compared at full size and scaled, and for JPEG also on an
+                # EXIF-rotated copy, so a backend with a different size convention is caught
+                checked = [data]
+                if fmt == 'jpeg':
+                    checked.append(_encode(reference_image, fmt, orientation=6))
+                reference = None
+                results = []
+                for decoder in self._decoders.values():
+                    if fmt not in decoder.formats:
+                        continue
+                    try:
+                        outputs = []
+                        for sample in checked:
+                            outputs.append((decoder.decode(sample), MAX_MEAN_ERROR))
+                            outputs.append((decoder.decode(sample, scaled), MAX_SCALED_MEAN_ERROR))
+                        if any(image.isNull() for image, _ in outputs):
+                            continue
+                        pixels = [_pixels(image) for image, _ in outputs]
+                        if reference is None:
+                            reference = pixels
+                        elif any(p.shape != r.shape or np.abs(p - r).mean() > limit
+                                 for p, r, (_, limit) in zip(pixels, reference, outputs)):
+                            print(f"Decoder {decoder.name} output differs on {fmt}; not used for it")
+                            continue
+                        samples = []
+                        for _ in range(repeats):
+                            start = time.perf_counter()
+                            decoder.decode(data)
+                            decoder.decode(data, scaled)
+                            samples.append(time.perf_counter() - start)
+                        results.append((statistics.median(samples), decoder.name))
+                    except Exception as e:
+                        print(f"Decoder {decoder.name} failed benchmark on {fmt}: {e}")
+                if results:
+                    results.sort()
+                    key = f"{fmt}/{res_class}"
+                    order[key] = [name for _, name in results]
+                    timings[key] = {name: round(t * 1000.0, 2) for t, name in results}
+
+        self._apply(order)
+        try:
+            BENCHMARK_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(BENCHMARK_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'key': self._benchmark_key(), 'order': order, 'timings_ms': timings}, f, indent=2)
+        except OSError as e:
+            print(f"Error saving decoder benchmark: {e}")
+        return timings
+
+
+def _corpus_image(width: int, height: int) -> Image.Image:
+    """Synthetic page: smooth gradients plus hard-edged line art, like a scanned manga page."""
+    y, x = np.mgrid[0:height, 0:width]
+    r = (x * 255 // max(1, width - 1)).astype(np.uint8)
+    g = (y * 255 // max(1, height - 1)).astype(np.uint8)
+    b = ((np.sin(x / 17.0) * np.cos(y / 23.0) + 1) * 127).astype(np.uint8)
+    pixels = np.stack([r, g, b], axis=-1)
+    pixels[(x // 40 + y // 40) % 7 == 0] = 0
+    return Image.fromarray(pixels, 'RGB')
+
+
+def _encode(img: Image.Image, fmt: str, orientation: int = 1) -> bytes | None:
+    buf = io.BytesIO()
+    extra = {}
+    if orientation != 1:
+        exif = Image.Exif()
+        exif[0x0112] = orientation
+        extra['exif'] = exif.tobytes()
+    try:
+        img.save(buf, format=fmt.upper(), quality=90, **extra)
+    except Exception:
+        return None # e.g. no AVIF encoder installed
+    return buf.getvalue()
+
+
+def _pixels(image: QImage) -> np.ndarray:
+    image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+    ptr = image.constBits()
+    ptr.setsize(image.sizeInBytes())
+    arr = np.frombuffer(ptr, np.uint8).reshape(image.height(), image.bytesPerLine())
+    return arr[:, :image.width() * 4].astype(np.int16)
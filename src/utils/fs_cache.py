@@ -0,0 +1,175 @@
+import os
+import stat as stat_module
+import threading
+from contextlib import contextmanager
+
+# On Windows a DirEntry carries the stat fields read during the listing; elsewhere
+# DirEntry.stat() is one more syscall, so plain os.stat is used (and can be counted)
+_ENTRY_STATS = os.name == 'nt'
+
+_local = threading.local()
+
+
+class StatCache:
+    """Directory listings and stats read during one operation (a series scan, a chapter load).
+
+    A listed folder answers exists/is_file/is_dir for its entries from the DirEntry
+    types scandir already returned. A name missing from the listing is stat'ed:
+    Windows, macOS and FAT volumes match names case-insensitively (macOS also
+    normalises Unicode), so it may exist under another spelling. Entries are never
+    refreshed: keep the cache short-lived and forget() paths the operation writes.
+    """
+    def __init__(self):
+        self._listings = {} # folder -> {name: DirEntry}, or the OSError listing it raised
+        self._stats = {} # path -> os.stat_result or None (missing)
+
+    def scandir(self, folder) -> list:
+        """DirEntries of the folder, in scandir order. Raises OSError like os.scandir."""
+        return list(self._listing(os.fspath(folder)).values())
+
+    def _listing(self, folder: str) -> dict:
+        listing = self._listings.get(folder)
+        if listing is None:
+            try:
+                with os.scandir(folder) as it:
+                    listing = {entry.name: entry for entry in it}
+            except OSError as e:
+                listing = e
+            self._listings[folder] = listing
+        if isinstance(listing, OSError):
+            raise listing
+        return listing
+
+    def _entry(self, path: str):
+        """DirEntry of the path from its already listed parent, or None if it must be stat'ed."""
+        parent, name = os.path.split(path)
+        listing = self._listings.get(parent)
+        if listing is None or isinstance(listing, OSError):
+            return None
+        return listing.get(name)
+
+    def stat(self, path):
+        """os.stat_result of the path (following symlinks), or None if it does not exist."""
+        path = os.fspath(path)
+        if path in self._stats:
+            return self._stats[path]
+        entry = self._entry(path)
+        result = None
+        try:
+            result = entry.stat() if entry is not None and _ENTRY_STATS else os.stat(path)
+        except OSError:
+            pass
+        self._stats[path] = result
+        return result
+
+    def exists(self, path) -> bool:
+        if self._entry(os.fspath(path)) is not None:
+            return True
+        return self.stat(path) is not None
+
+    def is_dir(self, path) -> bool:
+        entry = self._entry(os.fspath(path))
+        if entry is not None:
+            return _entry_is(entry.is_dir)
+        st = self.stat(path)
+        return st is not None and stat_module.S_ISDIR(st.st_mode)
+
+    def is_file(self, path) -> bool:
+        entry = self._entry(os.fspath(path))
+        if entry is not None:
+            return _entry_is(entry.is_file)
+        st = self.stat(path)
+        return st is not None and stat_module.S_ISREG(st.st_mode)
+
+    def forget(self, path):
+        """Drop what is known about the path and its folder, after writing to it."""
+        path = os.fspath(path)
+        self._stats.pop(path, None)
+        self._listings.pop(path, None)
+        self._listings.pop(os.path.dirname(path), None)
+
+
+def _entry_is(check) -> bool:
+    try:
+        return check()
+    except OSError:
+        return False
+
+
+@contextmanager
+def stat_cache():
+    """Share one StatCache among the fs_cache calls this thread makes inside the block.
+
+    Nested blocks join the outer one; outside any block the calls go to the filesystem.
+    """
+    cache = getattr(_local, 'cache', None)
+    if cache is not None:
+        yield cache
+        return
+    _local.cache = cache = StatCache()
+    try:
+        yield cache
+    finally:
+        _local.cache = None
+
+
+def _current():
+    return getattr(_local, 'cache', None)
+
+
+def scandir(folder) -> list:
+    """DirEntries of the folder. Raises OSError like os.scandir."""
+    cache = _current()
+    if cache is not None:
+        return cache.scandir(folder)
+    with os.scandir(folder) as it:
+        return list(it)
+
+
+def stat(path):
+    """os.stat_result of the path, or None if it does not exist."""
+    cache = _current()
+    if cache is not None:
+        return cache.stat(path)
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def exists(path) -> bool:
+    cache = _current()
+    return cache.exists(path) if cache is not None else os.path.exists(path)
+
+
+def is_dir(path) -> bool:
+    cache = _current()
+    return cache.is_dir(path) if cache is not None else os.path.isdir(path)
+
+
+def is_file(path) -> bool:
+    cache = _current()
+    return cache.is_file(path) if cache is not None else os.path.isfile(path)
+
+
+def getmtime(path) -> float:
+    """Like os.path.getmtime, raising OSError if the path does not exist."""
+    st = stat(path)
+    if st is None:
+        raise FileNotFoundError(path)
+    return st.st_mtime
+
+
+def getctime(path) -> float:
+    """Like os.path.getctime, raising OSError if the path does not exist."""
+    st = stat(path)
+    if st is None:
+        raise FileNotFoundError(path)
+    return st.st_ctime
+
+
+def forget(path):
+    """Drop cached knowledge of a path the current operation wrote to."""
+    cache = _current()
+    if cache is not None:
+        cache.forget(path)
@@ -1,15 +1,20 @@
 import re
 import os
+import time
 import hashlib
 from typing import Union, List, Optional
 from pathlib import Path
 from PyQt6.QtGui import QPixmap, QImageReader, QColor, QImage
-from PyQt6.QtCore import Qt, QSize, QBuffer, QByteArray, QRect
+from PyQt6.QtCore import Qt, QSize, QBuffer, QByteArray
 import zipfile
 import threading
 from collections import OrderedDict
 from src.utils.str_utils import find_number
 from src.utils.archive_utils import decode_zip_filename, ARCHIVE_EXTS, ZIP_EXTS, split_virtual_path
+from src.utils.memory_budget import MemoryBudget
+from src.utils.decoders import DecoderRegistry
+from src.utils.io_scheduler import IOScheduler
+from src.utils import fs_cache
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -43,11 +48,15 @@ def imwrite_unicode(path: str, img, params=None):
 
 class ZipCache:
     """Thread-safe LRU cache for open ZipFile objects."""
+    ENTRY_BYTES = 512 # rough size of one parsed ZipInfo, for the memory budget
+
     def __init__(self, max_size: int = 5):
         self.cache = OrderedDict()
         self.max_size = max_size
         self.lock = threading.Lock()
         self.read_lock = threading.Lock() # Lock for actual file I/O operations
+        self.memory = MemoryBudget.instance()
+        self.memory.register("zip", self.evict)
 
     def get_zip(self, path: str) -> zipfile.ZipFile:
         with self.lock:
@@ -57,6 +66,7 @@ class ZipCache:
                     # Quick check if the zip is still usable
                     if zf.fp is not None:
                         self.cache.move_to_end(path)
+                        self.memory.touch("zip", path)
                         return zf
                 except Exception:
                     pass
@@ -67,15 +77,18 @@ class ZipCache:
                 except Exception:
                     pass
                 del self.cache[path]
+                self.memory.release("zip", path)
             
             # Create new ZipFile
             try:
                 zf = zipfile.ZipFile(path, 'r')
                 self.cache[path] = zf
+                self.memory.charge("zip", path, len(zf.filelist) * self.ENTRY_BYTES)
                 
                 # Evict oldest if full
                 if len(self.cache) > self.max_size:
-                    _, zip_to_close = self.cache.popitem(last=False)
+                    old_path, zip_to_close = self.cache.popitem(last=False)
+                    self.memory.release("zip", old_path)
                     try:
                         zip_to_close.close()
                     except Exception:
@@ -85,6 +98,22 @@ class ZipCache:
             except Exception:
                 return None
 
+    def peek(self, path: str):
+        """The open ZipFile for path if it is cached, without opening it."""
+        with self.lock:
+            return self.cache.get(path)
+
+    def evict(self, path: str):
+        """Close one archive, e.g. when the memory budget reclaims it."""
+        with self.lock:
+            zf = self.cache.pop(path, None)
+        if zf is not None:
+            with self.read_lock:
+                try:
+                    zf.close()
+                except Exception:
+                    pass
+
     def clear(self):
         with self.lock:
             for zf in self.cache.values():
@@ -93,9 +122,65 @@ class ZipCache:
                 except Exception:
                     pass
             self.cache.clear()
+        self.memory.release_all("zip")
 
 ZIP_CACHE = ZipCache(max_size=5)
 
+def is_display_format(image: QImage) -> bool:
+    """True if QPixmap.fromImage can upload *image* without a format conversion."""
+    return image.format() in (QImage.Format.Format_RGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
+def to_display_format(image: QImage) -> QImage:
+    """Convert a decoded image to the raster backend's native pixmap format.
+
+    Call this in worker threads so the GUI-thread QPixmap.fromImage is a plain copy
+    instead of a full-frame RGB888/RGBA8888/Indexed8 conversion.
+    """
+    if image is None or image.isNull() or is_display_format(image):
+        return image
+    fmt = QImage.Format.Format_ARGB32_Premultiplied if image.hasAlphaChannel() else QImage.Format.Format_RGB32
+    return image.convertToFormat(fmt)
+
+class PixmapUploadStats:
+    """Thread-safe per-call-site totals for GUI-thread QPixmap.fromImage calls."""
+    SLOW_MS = 8.0
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sites = {} # tag -> {count, total_ms, max_ms, slow, converted}
+
+    def record(self, tag: str, elapsed_ms: float, converted: bool):
+        with self.lock:
+            site = self.sites.setdefault(tag, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "slow": 0, "converted": 0})
+            site["count"] += 1
+            site["total_ms"] += elapsed_ms
+            site["max_ms"] = max(site["max_ms"], elapsed_ms)
+            if elapsed_ms >= self.SLOW_MS:
+                site["slow"] += 1
+            if converted:
+                site["converted"] += 1
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {tag: dict(site) for tag, site in self.sites.items()}
+
+    def reset(self):
+        with self.lock:
+            self.sites.clear()
+
+PIXMAP_UPLOAD_STATS = PixmapUploadStats()
+
+def pixmap_from_image(image: QImage, tag: str = "") -> QPixmap:
+    """QPixmap.fromImage with timing recorded in PIXMAP_UPLOAD_STATS under *tag*.
+
+    'converted' counts images that reached the GUI thread in a non-native format.
+    """
+    converted = not is_display_format(image)
+    start = time.perf_counter()
+    pixmap = QPixmap.fromImage(image)
+    PIXMAP_UPLOAD_STATS.record(tag, (time.perf_counter() - start) * 1000.0, converted)
+    return pixmap
+
 def qimage_reader_from_bytes(data: bytes):
     """Create a QImageReader from raw bytes. Returns (reader, buffer) — keep buffer in scope.
 
@@ -185,7 +270,7 @@ CACHE_DIR.mkdir(parents=True, exist_ok=True)
 def get_cache_key(path: str, width: int, height: int, crop: str = None) -> str:
     """Generate a cache key for a file path and thumbnail settings."""
     try:
-        mod_time = os.path.getmtime(path)
+        mod_time = fs_cache.getmtime(path)
     except OSError:
         mod_time = 0
     settings = f"{width}x{height}{'_' + crop if crop else ''}"
@@ -195,7 +280,7 @@ def get_virtual_path_cache_key(virtual_path: str, width: int, height: int, crop:
     """Generate a cache key for a virtual path and thumbnail settings."""
     zip_path, _ = split_virtual_path(virtual_path)
     try:
-        mod_time = os.path.getmtime(zip_path)
+        mod_time = fs_cache.getmtime(zip_path)
     except OSError:
         mod_time = 0
     settings = f"{width}x{height}{'_' + crop if crop else ''}"
@@ -204,10 +289,8 @@ def get_virtual_path_cache_key(virtual_path: str, width: int, height: int, crop:
 IMG_EXTS = ('.jpg', '.jpeg', '.jpe', '.png', '.bmp', '.gif', '.webp', '.avif')
 
 def is_image_folder(folder: Union[Path, str]) -> bool:
-    if isinstance(folder, str):
-        folder = Path(folder)
-    files = [f for f in folder.iterdir() if f.is_file()]
-    return bool(files) and all(f.suffix.lower() in IMG_EXTS for f in files)
+    files = [f.name for f in fs_cache.scandir(folder) if f.is_file()]
+    return bool(files) and all(os.path.splitext(name)[1].lower() in IMG_EXTS for name in files)
 
 def is_image_monotone(image_path: str, threshold: float = 10.0) -> bool:
     """
@@ -287,6 +370,27 @@ def load_thumbnail(reader:QImageReader, width:int, height:int, quality:int=50, s
     
     return crop_qimage(image, width, height)
 
+def decode_thumbnail(source, width: int, height: int, crop: str = None) -> QImage | None:
+    """Cover-scaled thumbnail of a file path or image bytes, decoded at (near) thumbnail size.
+
+    crop 'left'/'right' takes that half of a landscape image, as for split spreads.
+    """
+    decoders = DecoderRegistry.instance()
+    size = decoders.probe(source)
+    if size.isEmpty():
+        return None
+    halve = crop in ('left', 'right') and size.width() > size.height()
+    effective_width = size.width() // 2 if halve else size.width()
+    scale = max(width / effective_width, height / size.height())
+    scaled = QSize(max(1, int(size.width() * scale)), max(1, int(size.height() * scale)))
+    image = decoders.decode(source, scaled, source_size=size)
+    if image.isNull():
+        return None
+    if halve:
+        half = image.width() // 2
+        image = image.copy(0 if crop == 'left' else half, 0, half, image.height())
+    return crop_qimage(image, width, height)
+
 def load_thumbnail_from_path(path, width=150, height=200, crop=None) -> QImage:
     path_str = str(path)
     try:
@@ -331,38 +435,8 @@ def load_thumbnail_from_path(path, width=150, height=200, crop=None) -> QImage:
         except Exception as e:
             print(f"Error creating video thumbnail: {e}")
             q_image = None # Ensure q_image is None on error
-    elif file_ext == '.avif':
-        try:
-            pil_img = Image.open(path_str).convert('RGBA')
-            if crop and pil_img.width > pil_img.height:
-                half = pil_img.width // 2
-                if crop == 'left':
-                    pil_img = pil_img.crop((0, 0, half, pil_img.height))
-                elif crop == 'right':
-                    pil_img = pil_img.crop((half, 0, pil_img.width, pil_img.height))
-            scale = max(width / pil_img.width, height / pil_img.height)
-            new_w, new_h = int(pil_img.width * scale), int(pil_img.height * scale)
-            pil_img = pil_img.resize((new_w, new_h), Image.Resampling.LANCZOS)
-            data = pil_img.tobytes('raw', 'RGBA')
-            q_image = QImage(data, pil_img.width, pil_img.height, pil_img.width * 4, QImage.Format.Format_RGBA8888).copy()
-        except Exception as e:
-            print(f"Error loading AVIF thumbnail: {e}")
     else:
-        # Existing image loading logic
-        reader = QImageReader(path_str)
-        original_size = reader.size()
-
-        effective_size = original_size
-        if crop:
-            if original_size.width() > original_size.height():
-                if crop == 'left':
-                    effective_size = QSize(original_size.width() // 2, original_size.height())
-                    reader.setClipRect(QRect(0, 0, original_size.width() // 2, original_size.height()))
-                elif crop == 'right':
-                    effective_size = QSize(original_size.width() // 2, original_size.height())
-                    reader.setClipRect(QRect(original_size.width() // 2, 0, original_size.width() // 2, original_size.height()))
-
-        q_image = load_thumbnail(reader, width, height, source_size=effective_size)
+        q_image = decode_thumbnail(path_str, width, height, crop)
 
     if q_image and not q_image.isNull():
         # Scale (Crop) and save the thumbnail
@@ -399,7 +473,8 @@ def load_thumbnail_from_zip(path, width=150, height=200) -> QImage:
             zf = ZIP_CACHE.get_zip(path)
             if zf:
                 try:
-                    with ZIP_CACHE.read_lock:
+                    image_data = None
+                    with IOScheduler.instance().read_slot(path_str), ZIP_CACHE.read_lock:
                         # Get list of files with proper encoding fallback
                         namelist = []
                         for info in zf.infolist():
@@ -411,14 +486,15 @@ def load_thumbnail_from_zip(path, width=150, height=200) -> QImage:
                             decoded_name, original_name = image_files[0]
                             with zf.open(original_name) as f:
                                 image_data = f.read()
-                            
-                            reader, buffer = qimage_reader_from_bytes(image_data)
-                            q_image = load_thumbnail(reader, width, height)
 
-                            if q_image and not q_image.isNull():
-                                q_image.save(str(cached_thumb_path), "PNG")
+                    # Decode and save after the read slot is released, so other readers of the device can go
+                    if image_data is not None:
+                        q_image = decode_thumbnail(image_data, width, height)
+
+                        if q_image and not q_image.isNull():
+                            q_image.save(str(cached_thumb_path), "PNG")
 
-                            return q_image
+                        return q_image
                 except (zipfile.BadZipFile, KeyError, RuntimeError, OSError, PermissionError, Exception) as e:
                     print(f"Error reading zip for thumbnail {path}: {e}")
                     pass
@@ -433,8 +509,7 @@ def load_thumbnail_from_zip(path, width=150, height=200) -> QImage:
                 image_data = SevenZipHandler.read_file(path_str, first_image_name)
                 
                 if image_data:
-                    reader, buffer = qimage_reader_from_bytes(image_data)
-                    q_image = load_thumbnail(reader, width, height)
+                    q_image = decode_thumbnail(image_data, width, height)
 
                     if q_image and not q_image.isNull():
                         q_image.save(str(cached_thumb_path), "PNG")
@@ -460,12 +535,9 @@ def load_thumbnail_from_virtual_path(virtual_path, width=150, height=200, crop=N
         image_data = get_image_data_from_zip(virtual_path)
 
         if image_data:
-            reader, buffer = qimage_reader_from_bytes(image_data)
-            reader.setAutoTransform(True)
-            original_image = reader.read()
+            thumb_image = decode_thumbnail(image_data, width, height, crop)
 
-            if not original_image.isNull():
-                thumb_image = create_thumbnail(original_image, width, height)
+            if thumb_image is not None:
                 # Save to cache
                 if not CACHE_DIR.exists():
                     CACHE_DIR.mkdir(parents=True)
@@ -487,10 +559,25 @@ def get_image_data_from_zip(virtual_path):
         if data: return data
     
     # Standard Zip support (cached)
+    return _read_zip_member(zip_path_str, image_name)
+
+def _zip_info(zf: zipfile.ZipFile, name: str) -> zipfile.ZipInfo | None:
+    for candidate in (name, name.replace('\\', '/')):
+        try:
+            return zf.getinfo(candidate)
+        except KeyError:
+            continue
+    return None
+
+def _member_offset(zf: zipfile.ZipFile, name: str) -> int:
+    info = _zip_info(zf, name)
+    return info.header_offset if info else 0
+
+def _read_zip_member(zip_path_str: str, image_name: str) -> bytes | None:
     try:
         zf = ZIP_CACHE.get_zip(zip_path_str)
         if zf:
-            with ZIP_CACHE.read_lock:
+            with IOScheduler.instance().read_slot(zip_path_str, _member_offset(zf, image_name)), ZIP_CACHE.read_lock:
                 # Direct try
                 try:
                     with zf.open(image_name) as f:
@@ -517,29 +604,123 @@ def get_image_data_from_zip(virtual_path):
         pass
     return None
 
-def load_qimage_for_thumbnailing(path: str, target_width: int = 0) -> QImage | None:
-    reader = None
-    buffer = None # Keep buffer in scope
+def read_archive_member(virtual_path: str) -> bytes | None:
+    """Bytes of one archive member, without extracting the archive to disk.
 
-    if '|' in path:
-        image_data = get_image_data_from_zip(path)
-        if image_data:
-            reader, buffer = qimage_reader_from_bytes(image_data)
-    else:
-        reader = QImageReader(path)
+    Zip members are inflated straight from the cached ZipFile; other formats go
+    through 7-Zip, whose single-file extraction is reused by later reads.
+    """
+    zip_path_str, internal = split_virtual_path(virtual_path)
+    if os.path.splitext(zip_path_str)[1].lower() in ZIP_EXTS:
+        data = _read_zip_member(zip_path_str, internal)
+        if data is not None:
+            return data
+    return get_image_data_from_zip(virtual_path)
 
-    if reader is None or not reader.canRead():
+ZIP_LOCAL_HEADER_SLACK = 30 + 1024 # fixed local header plus room for name and extra fields
+
+def read_ahead_archive_pages(virtual_paths: list):
+    """Hint the OS to fetch the zip members behind upcoming pages before they are decoded.
+
+    Only archives already open in ZIP_CACHE are considered, so this never blocks on
+    reading a central directory and is cheap enough for the GUI thread.
+    """
+    by_archive = {}
+    for virtual_path in virtual_paths:
+        if virtual_path and '|' in virtual_path:
+            archive, internal = split_virtual_path(virtual_path)
+            by_archive.setdefault(archive, []).append(internal)
+    for archive, names in by_archive.items():
+        zf = ZIP_CACHE.peek(archive)
+        if zf is None:
+            continue
+        ranges = []
+        for name in names:
+            info = _zip_info(zf, name)
+            if info is not None:
+                ranges.append((info.header_offset, ZIP_LOCAL_HEADER_SLACK + info.compress_size))
+        IOScheduler.instance().read_ahead(archive, ranges)
+
+HEADER_READ_BYTES = 64 * 1024 # enough for the size fields of every supported format
+
+def _read_zip_header(virtual_path: str, nbytes: int) -> bytes | None:
+    """First nbytes of a .zip/.cbz member, without inflating the rest of it."""
+    zip_path_str, image_name = split_virtual_path(virtual_path)
+    zf = ZIP_CACHE.get_zip(zip_path_str)
+    if not zf:
         return None
+    with IOScheduler.instance().read_slot(zip_path_str, _member_offset(zf, image_name)), ZIP_CACHE.read_lock:
+        for name in (image_name, image_name.replace('\\', '/')):
+            try:
+                with zf.open(name) as f:
+                    return f.read(nbytes)
+            except (KeyError, ValueError, RuntimeError, OSError):
+                continue
+    return None
+
+def read_member_header(virtual_path: str, nbytes: int) -> bytes | None:
+    """First nbytes of an archive member, without reading the whole member.
+
+    Comes from the extraction cache or, for zips, the member's first inflated bytes.
+    None for other archives, which could only be read by running 7z.
+    """
+    archive_path, internal = split_virtual_path(virtual_path)
+    from src.utils.archive_utils import SevenZipHandler, is_zip
+    extracted = SevenZipHandler.get_extract_dir(archive_path) / internal.replace('\\', '/')
+    try:
+        with open(extracted, 'rb') as f:
+            return f.read(nbytes)
+    except OSError:
+        pass
+    if is_zip(archive_path):
+        return _read_zip_header(virtual_path, nbytes)
+    return None
+
+def read_image_size(path: str) -> QSize:
+    """Pixel size of an image file or archive page, read from its header where possible.
 
-    reader.setAutoTransform(True)
+    Extracted archive pages are read from the extraction cache; zip members only have
+    their first HEADER_READ_BYTES inflated. Returns an invalid QSize on failure.
+    """
+    decoders = DecoderRegistry.instance()
+    if '|' not in path:
+        return decoders.probe(path)
+
+    archive_path, internal = split_virtual_path(path)
+    from src.utils.archive_utils import SevenZipHandler, is_zip
+    extracted = SevenZipHandler.get_extract_dir(archive_path) / internal.replace('\\', '/')
+    if extracted.is_file():
+        return decoders.probe(str(extracted))
+
+    if is_zip(archive_path):
+        header = _read_zip_header(path, HEADER_READ_BYTES)
+        if header:
+            size = decoders.probe(header)
+            if size.isValid():
+                return size
+
+    # Other archive types, or a header too large for the prefix (e.g. big EXIF blocks)
+    data = get_image_data_from_zip(path)
+    if not data:
+        return QSize()
+    return decoders.probe(data)
+
+def load_qimage_for_thumbnailing(path: str, target_width: int = 0) -> QImage | None:
+    source = get_image_data_from_zip(path) if '|' in path else path
+    if not source:
+        return None
+
+    decoders = DecoderRegistry.instance()
+    target = None
     if target_width > 0:
-        original_size = reader.size()
+        original_size = decoders.probe(source)
+        if not original_size.isValid():
+            return None
         if original_size.width() > target_width:
             height = int(original_size.height() * (target_width / original_size.width()))
-            reader.setScaledSize(QSize(target_width, height))
-            reader.setQuality(10)
+            target = QSize(target_width, height)
 
-    image = reader.read()
+    image = decoders.decode(source, target)
     if image.isNull():
         return None
 
@@ -665,16 +846,17 @@ def _get_first_media_path(chapter_input):
     path_obj = Path(path_str)
     # If it's an archive file (not a virtual path yet)
     if path_obj.suffix.lower() in ARCHIVE_EXTS:
-        if not os.path.isfile(path_str): # Check if the archive file actually exists
+        if not fs_cache.is_file(path_str): # Check if the archive file actually exists
             return None
         # Re-use the virtual path logic for the root
         return _get_first_media_path(f"{path_str}|")
             
     # 2. Handle Directories
-    elif path_obj.is_dir():
+    elif fs_cache.is_dir(path_obj):
         valid_exts = IMG_EXTS + tuple(VIDEO_EXTS)
         try:
-            media_files = [p for p in sorted(path_obj.iterdir()) if p.suffix.lower() in valid_exts and p.is_file()]
+            entries = [e for e in fs_cache.scandir(path_obj) if os.path.splitext(e.name)[1].lower() in valid_exts and e.is_file()]
+            media_files = sorted(Path(e.path) for e in entries)
             if media_files:
                 return str(media_files[0])
         except Exception as e:
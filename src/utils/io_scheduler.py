@@ -0,0 +1,250 @@
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QRunnable
+
+from src.core.task_scheduler import TaskScheduler, TaskPriority, current_task_priority
+
+READ_AHEAD_CHUNK = 1024 * 1024
+MERGE_GAP = 256 * 1024 # ranges closer than this are read ahead as one
+
+
+# Filesystem types (from /proc/self/mountinfo) whose reads go over the network
+NETWORK_FILESYSTEMS = {
+    'nfs', 'nfs4', 'cifs', 'smb3', 'smbfs', '9p', 'afs', 'ceph', 'glusterfs', 'davfs',
+    'fuse.sshfs', 'fuse.rclone', 'fuse.s3fs', 'fuse.gvfsd-fuse',
+}
+
+
+def _is_slow_device(path: str) -> bool:
+    """True for spinning, removable or network storage, where random reads cost seeks."""
+    try:
+        if sys.platform.startswith('linux'):
+            return _linux_device_is_slow(path)
+        if sys.platform == 'win32':
+            return _windows_drive_is_slow(path)
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+def _linux_device_is_slow(path: str) -> bool:
+    st = os.stat(path)
+    dev = f"{os.major(st.st_dev)}:{os.minor(st.st_dev)}"
+    if _linux_mount_type(dev) in NETWORK_FILESYSTEMS:
+        return True
+    block = os.path.realpath(f"/sys/dev/block/{dev}")
+    if '/usb' in block: # USB sticks and enclosures, whatever they report as rotational
+        return True
+    # Partitions have no queue/ or removable of their own; their parent disk does
+    for base in (block, os.path.dirname(block)):
+        removable = os.path.join(base, 'removable')
+        if os.path.exists(removable):
+            with open(removable) as f:
+                if f.read().strip() == '1':
+                    return True
+        flag = os.path.join(base, 'queue', 'rotational')
+        if os.path.exists(flag):
+            with open(flag) as f:
+                return f.read().strip() == '1'
+    return False
+
+
+def _linux_mount_type(dev: str):
+    """Filesystem type of the mount with this major:minor, or None if not listed."""
+    with open('/proc/self/mountinfo') as f:
+        for line in f:
+            # 36 35 98:0 /mnt1 /mnt2 rw,noatime master:1 - ext3 /dev/root rw
+            fields, _, rest = line.partition(' - ')
+            fields = fields.split()
+            if len(fields) > 2 and fields[2] == dev:
+                return rest.split(' ', 1)[0]
+    return None
+
+
+def _windows_drive_is_slow(path: str) -> bool:
+    import ctypes
+    import struct
+    from ctypes import wintypes
+
+    drive = os.path.splitdrive(os.path.abspath(path))[0]
+    if not drive:
+        return False
+    kernel32 = ctypes.windll.kernel32
+    kind = kernel32.GetDriveTypeW(drive + '\\')
+    if kind in (2, 4, 5): # DRIVE_REMOVABLE, DRIVE_REMOTE, DRIVE_CDROM
+        return True
+    if kind != 3 or not drive.endswith(':'): # DRIVE_FIXED
+        return False
+
+    # Fixed drives: ask the volume whether it incurs a seek penalty (i.e. is an HDD)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    handle = kernel32.CreateFileW(f"\\\\.\\{drive}", 0, 0x3, None, 3, 0, None) # FILE_SHARE_READ|WRITE, OPEN_EXISTING
+    if handle in (None, wintypes.HANDLE(-1).value):
+        return False
+    try:
+        query = struct.pack('<II4x', 7, 0) # StorageDeviceSeekPenaltyProperty, PropertyStandardQuery
+        out = ctypes.create_string_buffer(12) # DEVICE_SEEK_PENALTY_DESCRIPTOR
+        returned = wintypes.DWORD()
+        ok = kernel32.DeviceIoControl(wintypes.HANDLE(handle), 0x2D1400, query, len(query), out, len(out),
+                                      ctypes.byref(returned), None) # IOCTL_STORAGE_QUERY_PROPERTY
+        return bool(ok) and out.raw[8] != 0
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(handle))
+
+
+def _merge_ranges(ranges: list) -> list:
+    merged = []
+    for offset, length in sorted(ranges):
+        if merged and offset <= merged[-1][0] + merged[-1][1] + MERGE_GAP:
+            start = merged[-1][0]
+            merged[-1] = (start, max(merged[-1][1], offset + length - start))
+        else:
+            merged.append((offset, length))
+    return merged
+
+
+class _DeviceQueue:
+    """Grants reads on one slow device one at a time.
+
+    Waiters are served by task priority first, then in elevator order: the next
+    (archive, offset) at or after the last read, wrapping around, so queued reads
+    sweep each archive front to back instead of seeking between workers.
+    """
+    def __init__(self, slots: int = 1):
+        self.slots = slots
+        self.active = 0
+        self.head = ('', 0)
+        self.waiting = []
+        self.cond = threading.Condition()
+
+    def _next(self):
+        top = min(t[0] for t in self.waiting)
+        candidates = [t for t in self.waiting if t[0] == top]
+        ahead = [t for t in candidates if (t[1], t[2]) >= self.head]
+        return min(ahead or candidates, key=lambda t: (t[1], t[2]))
+
+    def acquire(self, path: str, offset: int, priority: int):
+        ticket = [priority, path, offset]
+        with self.cond:
+            if self.active < self.slots and not self.waiting:
+                self.active += 1
+                self.head = (path, offset)
+                return
+            self.waiting.append(ticket)
+            while not (self.active < self.slots and self._next() is ticket):
+                self.cond.wait()
+            self.waiting.remove(ticket)
+            self.active += 1
+            self.head = (path, offset)
+
+    def release(self):
+        with self.cond:
+            self.active -= 1
+            self.cond.notify_all()
+
+
+class ReadAheadWorker(QRunnable):
+    """Reads byte ranges and throws the data away, so the OS cache holds them (no fadvise)."""
+    def __init__(self, path: str, ranges: list):
+        super().__init__()
+        self.path = path
+        self.ranges = ranges
+
+    def run(self):
+        try:
+            with open(self.path, 'rb', buffering=0) as f:
+                for offset, length in self.ranges:
+                    end = offset + length
+                    while offset < end:
+                        with IOScheduler.instance().read_slot(self.path, offset):
+                            f.seek(offset)
+                            data = f.read(min(READ_AHEAD_CHUNK, end - offset))
+                        if not data:
+                            break
+                        offset += len(data)
+        except OSError:
+            pass
+
+
+class IOScheduler:
+    """Per-device ordering of archive reads, plus read-ahead hints for upcoming pages.
+
+    Reads on fast storage pass straight through. On spinning, removable and network
+    storage, concurrent readers (page decoder, thumbnails, scans) are queued per
+    physical device and served as described in _DeviceQueue.
+    """
+    _instance = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._devices = {} # st_dev -> _DeviceQueue, or None for fast devices
+        self._path_devices = {} # path -> st_dev
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = IOScheduler()
+        return cls._instance
+
+    def device(self, path: str):
+        """The device path lives on (its st_dev), or None if path cannot be reached."""
+        with self._lock:
+            dev = self._path_devices.get(path)
+        if dev is None:
+            try:
+                dev = os.stat(path).st_dev
+            except OSError:
+                return None
+            with self._lock:
+                self._path_devices[path] = dev
+        return dev
+
+    def _queue_for(self, path: str):
+        dev = self.device(path)
+        if dev is None:
+            return None
+        with self._lock:
+            if dev in self._devices:
+                return self._devices[dev]
+        queue = _DeviceQueue() if _is_slow_device(path) else None
+        with self._lock:
+            return self._devices.setdefault(dev, queue)
+
+    def is_slow(self, path: str) -> bool:
+        return self._queue_for(path) is not None
+
+    @contextmanager
+    def read_slot(self, path: str, offset: int = 0):
+        """Hold while reading path at offset; waits for the device's turn on slow storage."""
+        queue = self._queue_for(path)
+        if queue is None:
+            yield
+            return
+        queue.acquire(path, offset, current_task_priority())
+        try:
+            yield
+        finally:
+            queue.release()
+
+    def read_ahead(self, path: str, ranges: list):
+        """Ask the OS to start reading (offset, length) ranges of path that will be needed soon."""
+        if not ranges:
+            return
+        ranges = _merge_ranges(ranges)
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                return
+            try:
+                for offset, length in ranges:
+                    os.posix_fadvise(fd, offset, length, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        elif self.is_slow(path):
+            TaskScheduler.instance().start(ReadAheadWorker(path, ranges), TaskPriority.BACKGROUND)
@@ -0,0 +1,202 @@
+import sys
+import threading
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, Qt
+from PyQt6.QtGui import QImage, QPixmap
+
+import src.utils.app_settings as app_settings
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+DEFAULT_BUDGET_MB = 1024
+PRESSURE_FREE_MB = 512      # react when the system has less than this available
+PRESSURE_CHECK_MS = 5000
+
+
+def image_bytes(image) -> int:
+    """Decoded size of a QImage/QPixmap in bytes (0 for None or null images)."""
+    if image is None or image.isNull():
+        return 0
+    if isinstance(image, QImage):
+        return image.sizeInBytes()
+    if isinstance(image, QPixmap):
+        return image.width() * image.height() * max(image.depth(), 8) // 8
+    return 0
+
+
+def _memory_status():
+    """(available, total) physical memory in bytes, or (None, None) if unknown."""
+    if psutil is not None:
+        vm = psutil.virtual_memory()
+        return vm.available, vm.total
+    if sys.platform == "win32":
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return status.ullAvailPhys, status.ullTotalPhys
+        return None, None
+    try:
+        info = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                info[key] = int(value.split()[0]) * 1024
+        return info.get("MemAvailable"), info.get("MemTotal")
+    except (OSError, ValueError):
+        return None, None
+
+
+class MemoryBudget(QObject):
+    """Process-wide accountant for decoded images and other evictable caches.
+
+    Caches ``charge`` their entries under a consumer name and ``release`` them when
+    dropped. Consumers that can rebuild their data ``register`` an evict callback; once
+    the total exceeds the budget, entries are evicted least-recently-used first across
+    all of them. Pinned entries (e.g. the page on screen) are counted but never evicted.
+    Eviction always runs on the GUI thread from the event loop, so callbacks may touch
+    widgets and never run in the middle of a cache's own iteration.
+    """
+    _instance = None
+    _enforce_requested = pyqtSignal()
+
+    def __init__(self, budget_bytes: int = None):
+        super().__init__()
+        if budget_bytes is None:
+            budget_bytes = self.default_budget_bytes()
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict() # (consumer, key) -> [nbytes, pinned], LRU first
+        self._usage = {}
+        self._total = 0
+        self._evictors = {}
+        self._enforce_pending = False
+        self.evictions = 0
+        self.pressure_events = 0
+        self._pressure_timer = None
+        self._enforce_requested.connect(self._enforce, Qt.ConnectionType.QueuedConnection)
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = MemoryBudget()
+        return cls._instance
+
+    @staticmethod
+    def default_budget_bytes() -> int:
+        mb = app_settings.get("memory_budget_mb")
+        if mb:
+            return int(mb) * 1024 * 1024
+        _, total = _memory_status()
+        if total:
+            # A quarter of physical memory, within 512 MB .. 2 GB
+            return max(512 * 1024 * 1024, min(total // 4, 2048 * 1024 * 1024))
+        return DEFAULT_BUDGET_MB * 1024 * 1024
+
+    def register(self, consumer: str, evict_fn):
+        """evict_fn(key) drops the consumer's entry; it is called on the GUI thread."""
+        self._evictors[consumer] = evict_fn
+
+    def unregister(self, consumer: str):
+        self._evictors.pop(consumer, None)
+        self.release_all(consumer)
+
+    def charge(self, consumer: str, key, nbytes: int, pinned: bool = False):
+        """Add or update an entry and mark it most recently used."""
+        with self._lock:
+            entry = self._entries.pop((consumer, key), None)
+            if entry is not None:
+                self._add_usage(consumer, -entry[0])
+            self._entries[(consumer, key)] = [nbytes, pinned]
+            self._add_usage(consumer, nbytes)
+            over = self._total > self.budget_bytes and not self._enforce_pending
+            if over:
+                self._enforce_pending = True
+        if over:
+            self._enforce_requested.emit()
+
+    def touch(self, consumer: str, key):
+        with self._lock:
+            if (consumer, key) in self._entries:
+                self._entries.move_to_end((consumer, key))
+
+    def release(self, consumer: str, key):
+        with self._lock:
+            entry = self._entries.pop((consumer, key), None)
+            if entry is not None:
+                self._add_usage(consumer, -entry[0])
+
+    def release_all(self, consumer: str):
+        with self._lock:
+            for ck in [ck for ck in self._entries if ck[0] == consumer]:
+                self._add_usage(consumer, -self._entries.pop(ck)[0])
+
+    def usage(self) -> dict:
+        """Bytes currently charged per consumer."""
+        with self._lock:
+            return {c: b for c, b in self._usage.items() if b}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "budget": self.budget_bytes,
+                "total": self._total,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "pressure_events": self.pressure_events,
+            }
+
+    def start_pressure_monitor(self):
+        """Poll available system memory and shed evictable entries when it runs low."""
+        if self._pressure_timer is not None:
+            return
+        self._pressure_timer = QTimer(self)
+        self._pressure_timer.timeout.connect(self._check_pressure)
+        self._pressure_timer.start(PRESSURE_CHECK_MS)
+
+    def _check_pressure(self):
+        available, _ = _memory_status()
+        if available is None or available >= PRESSURE_FREE_MB * 1024 * 1024:
+            return
+        self.pressure_events += 1
+        # Drop to half of what we hold now; the OS needs the memory more than our caches
+        self._enforce(self._total // 2)
+
+    def _add_usage(self, consumer: str, delta: int):
+        self._usage[consumer] = self._usage.get(consumer, 0) + delta
+        self._total += delta
+
+    def _enforce(self, limit: int = None):
+        limit = self.budget_bytes if limit is None else limit
+        victims = []
+        with self._lock:
+            self._enforce_pending = False
+            for ck in list(self._entries):
+                if self._total <= limit:
+                    break
+                nbytes, pinned = self._entries[ck]
+                if pinned or ck[0] not in self._evictors:
+                    continue
+                del self._entries[ck]
+                self._add_usage(ck[0], -nbytes)
+                victims.append(ck)
+            self.evictions += len(victims)
+
+        for consumer, key in victims:
+            try:
+                self._evictors[consumer](key)
+            except Exception as e:
+                print(f"Error evicting {consumer} entry {key}: {e}")
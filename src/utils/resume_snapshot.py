@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from PyQt6.QtGui import QImage
+
+from src.data.page import Page
+
+RESUME_DIR = Path('.cache/resume')
+MAX_SNAPSHOTS = 20
+SNAPSHOT_QUALITY = 85
+
+
+def _snapshot_key(series_path: str, chapter_path: str) -> str:
+    return hashlib.sha1(f"{series_path}\n{chapter_path}".encode('utf-8')).hexdigest()[:16]
+
+
+def _snapshot_paths(series_path: str, chapter_path: str) -> tuple[Path, Path]:
+    key = _snapshot_key(series_path, chapter_path)
+    return RESUME_DIR / f"{key}.json", RESUME_DIR / f"{key}.jpg"
+
+
+def save_snapshot(series_path: str, chapter_path: str, page_index: int, view_mode: int, image: QImage, pages: list):
+    """Persist what the reader shows right now, so reopening the chapter can paint it at once.
+
+    Stores the on-screen image at display resolution and the grouped page list
+    (variants, translations, spread flags) of the chapter.
+    """
+    if image is None or image.isNull() or not pages:
+        return
+    meta_path, image_path = _snapshot_paths(series_path, chapter_path)
+    try:
+        RESUME_DIR.mkdir(parents=True, exist_ok=True)
+        if not image.save(str(image_path), "JPG", SNAPSHOT_QUALITY):
+            return
+        data = {
+            "series_path": series_path,
+            "chapter_path": chapter_path,
+            "page_index": page_index,
+            "view_mode": view_mode,
+            "pages": [
+                {
+                    "images": list(page.images),
+                    "translations": dict(page.translations) if page.translation_paths() else {},
+                    "is_spread": page.is_spread,
+                    "is_spread_explicit": page.is_spread_explicit,
+                }
+                for page in pages
+            ],
+        }
+        tmp_path = meta_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, meta_path)
+        _prune_snapshots()
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Error saving resume snapshot: {e}")
+
+
+def load_snapshot(series_path: str, chapter_path: str) -> dict | None:
+    """Snapshot metadata for the chapter with an extra 'image_path' key, or None."""
+    meta_path, image_path = _snapshot_paths(series_path, chapter_path)
+    if not meta_path.is_file() or not image_path.is_file():
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Error reading resume snapshot: {e}")
+        return None
+    if data.get("series_path") != series_path or data.get("chapter_path") != chapter_path:
+        return None
+    data["image_path"] = str(image_path)
+    return data
+
+
+def has_snapshot(series_path: str, chapter_path: str) -> bool:
+    meta_path, image_path = _snapshot_paths(series_path, chapter_path)
+    return meta_path.is_file() and image_path.is_file()
+
+
+def pages_from_snapshot(data: dict) -> list:
+    pages = []
+    for entry in data.get("pages", []):
+        if not entry.get("images"):
+            continue
+        page = Page(list(entry["images"]), entry.get("translations") or None)
+        page.is_spread = bool(entry.get("is_spread", False))
+        page.is_spread_explicit = bool(entry.get("is_spread_explicit", False))
+        pages.append(page)
+    return pages
+
+
+def page_signature(pages: list) -> list:
+    """Comparable form of a grouped page list, to check a snapshot against a fresh scan."""
+    return [(tuple(page.images), page.is_spread) for page in pages]
+
+
+def _prune_snapshots():
+    """Keep only the most recently written snapshots."""
+    metas = sorted(RESUME_DIR.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+    for meta in metas[MAX_SNAPSHOTS:]:
+        for path in (meta, meta.with_suffix('.jpg')):
+            try:
+                path.unlink()
+            except OSError:
+                pass
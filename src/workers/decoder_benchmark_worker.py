@@ -0,0 +1,22 @@
+from PyQt6.QtCore import QRunnable, pyqtSignal, QObject
+
+from src.utils.decoders import DecoderRegistry
+
+
+class DecoderBenchmarkSignals(QObject):
+    finished = pyqtSignal(dict) # "format/resolution" -> {decoder: ms}
+
+
+class DecoderBenchmarkWorker(QRunnable):
+    """Times the image decoders once per install so the registry can pick the fastest."""
+    def __init__(self):
+        super().__init__()
+        self.signals = DecoderBenchmarkSignals()
+
+    def run(self):
+        try:
+            timings = DecoderRegistry.instance().run_benchmark()
+        except Exception as e:
+            print(f"Decoder benchmark failed: {e}")
+            timings = {}
+        self.signals.finished.emit(timings)
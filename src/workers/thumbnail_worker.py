@@ -1,21 +1,29 @@
 from PyQt6.QtGui import QImage
 from PyQt6.QtCore import pyqtSignal, QRunnable, QObject
+from src.utils.img_utils import to_display_format
+from src.core.task_scheduler import CancellationToken, WORK_STATS, check_cancelled
 
 class ThumbnailWorker(QRunnable):
     class Signals(QObject):
         finished = pyqtSignal(int, QImage)
 
-    def __init__(self, index, path, load_thumb_func):
+    def __init__(self, index, path, load_thumb_func, token: CancellationToken = None):
         super().__init__()
         self.index = index
         self.path = path
         self.load_thumb = load_thumb_func # Returns QImage
+        self.token = token
         self.signals = self.Signals()
 
     def run(self):
+        if check_cancelled(self.token, "ThumbnailWorker", "read"):
+            return
         thumb = self.load_thumb(self.path) # QImage
+        if check_cancelled(self.token, "ThumbnailWorker", "convert"):
+            return
         if thumb and not thumb.isNull():
-            self.signals.finished.emit(self.index, thumb)
+            self.signals.finished.emit(self.index, to_display_format(thumb))
+            WORK_STATS.record("ThumbnailWorker", "completed")
 
 
 class ChapterThumbnailWorker(QRunnable):
@@ -39,4 +47,4 @@ class ChapterThumbnailWorker(QRunnable):
             return
         thumb = self.load_thumb(path)
         if thumb and not thumb.isNull():
-            self.signals.finished.emit(self.index, thumb)
+            self.signals.finished.emit(self.index, to_display_format(thumb))
@@ -2,20 +2,28 @@ import zipfile
 from pathlib import Path
 import io
 import os
+import random
+import threading
+from collections import deque
 from PIL import Image, ImageQt, ImageFilter
 
-from PyQt6.QtCore import Qt, QRunnable, pyqtSlot, QObject, pyqtSignal, QRectF, QBuffer, QIODevice, QSize
+from PyQt6.QtCore import Qt, QRunnable, QThread, pyqtSlot, QObject, pyqtSignal, QRectF, QSize
 from PyQt6.QtGui import QPixmap, QImage, QPainter, QFont, QColor, QTextOption, QImageReader
 
-from src.utils.img_utils import get_chapter_number, get_image_data_from_zip
+from src.utils.img_utils import get_chapter_number, get_image_data_from_zip, to_display_format, read_image_size, read_archive_member
 from src.utils.str_utils import natural_sort_key
 from src.utils.archive_utils import ARCHIVE_EXTS, ZIP_EXTS, split_virtual_path
 from src.core.alt_manager import AltManager
+from src.core.task_scheduler import CancellationToken, WORK_STATS, check_cancelled
+from src.utils.decoders import DecoderRegistry, sniff_format, read_magic
+from src.core.decode_pool import DecodePool
+from src.utils import fs_cache
 
 VIDEO_EXTS = {'.mp4', '.webm', '.mkv', '.avi', '.mov'}
 IMAGE_EXTS = {'.png', '.jpg', '.jpeg', '.jpe', '.bmp', '.gif', '.webp', '.avif'}
 MODEL_EXTS = {'.glb', '.gltf'}
 L2D_EXTS = {'.skel'}
+ANIMATED_FORMATS = {'gif', 'webp', 'avif'}
 
 class ArchiveExtractionSignals(QObject):
     finished = pyqtSignal(str, bool) # archive_path, success
@@ -32,6 +40,26 @@ class ArchiveExtractionWorker(QRunnable):
         success = SevenZipHandler.extract_all(self.archive_path)
         self.signals.finished.emit(self.archive_path, success)
 
+class ArchiveAssetSignals(QObject):
+    finished = pyqtSignal(int, object) # request_id, bytes or None
+
+class ArchiveAssetWorker(QRunnable):
+    """Reads one archive member for the web viewers' mrarchive:// scheme."""
+    def __init__(self, request_id: int, virtual_path: str):
+        super().__init__()
+        self.request_id = request_id
+        self.virtual_path = virtual_path
+        self.signals = ArchiveAssetSignals()
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            data = read_archive_member(self.virtual_path)
+        except Exception as e:
+            print(f"Error reading archive asset {self.virtual_path}: {e}")
+            data = None
+        self.signals.finished.emit(self.request_id, data)
+
 class VideoExtractionSignals(QObject):
     finished = pyqtSignal(str, str, bool) # original_path, extracted_path, success
 
@@ -54,58 +82,109 @@ class VideoExtractionWorker(QRunnable):
         success = extracted_path is not None and os.path.exists(extracted_path)
         self.signals.finished.emit(self.original_path, extracted_path if success else "", success)
 
-class AnimationFrameLoaderSignals(QObject):
-    finished = pyqtSignal(dict)
+# QThreads must outlive their run(); stopped workers are parked here until they exit
+_RETIRED_THREADS = set()
+
+def retire_worker(worker: QThread):
+    """Keep a stopped QThread referenced until it finishes so it is not destroyed while running."""
+    _RETIRED_THREADS.add(worker)
+    worker.finished.connect(lambda w=worker: _RETIRED_THREADS.discard(w))
+    if worker.isFinished() or not worker.isRunning():
+        _RETIRED_THREADS.discard(worker)
+
+class AnimationDecodeWorker(QThread):
+    """Streams the frames of an animated GIF/WEBP/AVIF into a bounded ring buffer.
 
-class AnimationFrameLoaderWorker(QRunnable):
-    def __init__(self, path: str, image_data: bytes):
+    Frames are decoded sequentially, scaled down to ``target_size`` and converted to
+    premultiplied ARGB so the GUI thread only has to upload them. The thread blocks
+    once ``buffer_size`` frames are queued, so memory does not grow with frame count.
+    Each buffered entry is (frame_index, QImage, duration_ms) with the duration taken
+    from the container.
+    """
+    failed = pyqtSignal()
+
+    def __init__(self, source, target_size: QSize = None, buffer_size: int = 8):
         super().__init__()
-        self.path = path
-        self.image_data = image_data
-        self.signals = AnimationFrameLoaderSignals()
+        self.source = source # file path or raw bytes
+        self.target_size = target_size
+        self.buffer_size = max(1, buffer_size)
+        self._frames = deque()
+        self._cond = threading.Condition()
+        self._stopped = False
+
+    def take_frame(self):
+        """Pop the next decoded frame, or None if the decoder has not caught up."""
+        with self._cond:
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._cond.notify()
+            return frame
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._frames.clear()
+            self._cond.notify_all()
 
-    @pyqtSlot()
     def run(self):
-        """
-        Load frames for animated images (GIF, animated WEBP). If the path refers to a video
-        file (mp4, webm, etc.) we skip processing here — videos are handled by the media player.
-        """
-        frames = []
-        duration = 100
-
-        # Normalize path for zip entries like "archive.zip|file.ext"
-        path_lower = self.path.lower() if isinstance(self.path, str) else ""
-        _, internal = split_virtual_path(path_lower)
-        ext = Path(internal if internal else path_lower).suffix.lower()
-
-        # Skip video and 3D model formats (handled by their own viewers)
-        if ext in VIDEO_EXTS or ext in MODEL_EXTS or ext in L2D_EXTS:
-            result = {"path": self.path, "frames": [], "duration": duration}
-            self.signals.finished.emit(result)
+        try:
+            src = io.BytesIO(self.source) if isinstance(self.source, (bytes, bytearray)) else self.source
+            img = Image.open(src)
+        except Exception as e:
+            print(f"Error opening animation {self.source if isinstance(self.source, str) else '<bytes>'}: {e}")
+            self.failed.emit()
             return
 
-        try:
-            img = Image.open(io.BytesIO(self.image_data))
-            if getattr(img, "is_animated", False):
-                # prefer duration from info if available
-                duration = img.info.get('duration', 100)
-                for i in range(getattr(img, "n_frames", 1)):
-                    try:
-                        img.seek(i)
-                        q_image = ImageQt.toqimage(img).copy()
-                        frames.append(q_image)
-                    except Exception:
-                        # If a single frame fails, skip it and continue
-                        continue
-        except Exception:
-            frames = []  # Return empty list on error
+        index = 0
+        with img:
+            while True:
+                with self._cond:
+                    while len(self._frames) >= self.buffer_size and not self._stopped:
+                        self._cond.wait()
+                    if self._stopped:
+                        return
 
-        result = {
-            "path": self.path,
-            "frames": frames,
-            "duration": duration
-        }
-        self.signals.finished.emit(result)
+                try:
+                    img.seek(index)
+                    duration = img.info.get('duration') or 0
+                    frame = self._to_display_image(img)
+                except EOFError:
+                    if index == 0:
+                        self.failed.emit()
+                        return
+                    index = 0 # Loop back to the first frame
+                    continue
+                except Exception as e:
+                    print(f"Error decoding animation frame {index}: {e}")
+                    if index == 0:
+                        self.failed.emit()
+                        return
+                    index = 0
+                    continue
+
+                # Browsers clamp near-zero delays to 100ms; do the same
+                if duration <= 10:
+                    duration = 100
+
+                with self._cond:
+                    if self._stopped:
+                        return
+                    self._frames.append((index, frame, int(duration)))
+                index += 1
+
+    def _to_display_image(self, img) -> QImage:
+        frame = img.convert('RGBA')
+        if self.target_size and self.target_size.isValid():
+            tw, th = self.target_size.width(), self.target_size.height()
+            if frame.width > tw or frame.height > th:
+                scale = min(tw / frame.width, th / frame.height)
+                size = (max(1, int(frame.width * scale)), max(1, int(frame.height * scale)))
+                frame = frame.resize(size, Image.Resampling.BILINEAR)
+        data = frame.tobytes('raw', 'RGBA')
+        q_image = QImage(data, frame.width, frame.height, frame.width * 4, QImage.Format.Format_RGBA8888)
+        # convertToFormat makes a deep copy, so 'data' may be released afterwards
+        return q_image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
 
 class ChapterLoaderSignals(QObject):
     finished = pyqtSignal(dict) # Contains initial_image: QImage
@@ -132,50 +211,52 @@ class ChapterLoaderWorker(QRunnable):
             })
             return
 
-        # Perform I/O and grouping in the worker thread
-        image_list = self._get_image_list()
-        image_list = self._sort_image_list(image_list)
-
-        alt_config = AltManager.load_alts(self.series_path)
-        path_str_for_name = str(self.manga_dir)
-        if '|' in path_str_for_name:
-            _, _internal = path_str_for_name.split('|', 1)
-            chapter_name = Path(_internal.rstrip('/')).name or Path(path_str_for_name.split('|')[0]).stem
-        else:
-            chapter_name = Path(path_str_for_name).name
-        chapter_alts = alt_config.get(chapter_name, {})
-
-        # Filter blacklisted pages
-        blacklisted_pages = AltManager.get_blacklisted_pages(self.series_path, chapter_name)
-        if blacklisted_pages:
-            image_list = [p for p in image_list if Path(p.split('|')[-1]).name not in blacklisted_pages]
-
-        grouped_pages = AltManager.group_images(image_list, chapter_alts)
-
-        initial_index = 0
-        if self.start_from_end:
-            initial_index = len(grouped_pages) - 1
-
-        initial_image = None
-        if grouped_pages:
-            if 0 <= initial_index < len(grouped_pages):
-                # Use the first variant of the page
-                page = grouped_pages[initial_index]
-                candidate = page.images[0]
-                suffix = Path(candidate.split('|')[-1]).suffix.lower()
-                if suffix in IMAGE_EXTS:
-                    # Resolve path for extraction cache if needed
-                    resolved = self._resolve_path(candidate)
+        # Perform I/O and grouping in the worker thread; listing, sorting, alt lookup and
+        # path resolution share one stat cache
+        with fs_cache.stat_cache():
+            image_list = self._get_image_list()
+            image_list = self._sort_image_list(image_list)
+
+            alt_config = AltManager.load_alts(self.series_path)
+            path_str_for_name = str(self.manga_dir)
+            if '|' in path_str_for_name:
+                _, _internal = path_str_for_name.split('|', 1)
+                chapter_name = Path(_internal.rstrip('/')).name or Path(path_str_for_name.split('|')[0]).stem
+            else:
+                chapter_name = Path(path_str_for_name).name
+            chapter_alts = alt_config.get(chapter_name, {})
+
+            # Filter blacklisted pages
+            blacklisted_pages = AltManager.get_blacklisted_pages(self.series_path, chapter_name)
+            if blacklisted_pages:
+                image_list = [p for p in image_list if Path(p.split('|')[-1]).name not in blacklisted_pages]
+
+            grouped_pages = AltManager.group_images(image_list, chapter_alts)
+
+            initial_index = 0
+            if self.start_from_end:
+                initial_index = len(grouped_pages) - 1
+
+            initial_image = None
+            if grouped_pages:
+                if 0 <= initial_index < len(grouped_pages):
+                    # Use the first variant of the page
+                    page = grouped_pages[initial_index]
+                    candidate = page.images[0]
+                    suffix = Path(candidate.split('|')[-1]).suffix.lower()
+                    if suffix in IMAGE_EXTS:
+                        # Resolve path for extraction cache if needed
+                        resolved = self._resolve_path(candidate)
                     
-                    if '|' not in resolved:
-                        reader = QImageReader(resolved)
-                        initial_image = reader.read()
+                        if '|' not in resolved:
+                            reader = QImageReader(resolved)
+                            initial_image = reader.read()
+                        else:
+                            img_data = get_image_data_from_zip(resolved)
+                            if img_data:
+                                initial_image = QImage.fromData(img_data)
                     else:
-                        img_data = get_image_data_from_zip(resolved)
-                        if img_data:
-                            initial_image = QImage.fromData(img_data)
-                else:
-                    initial_image = None
+                        initial_image = None
 
         result = {
             "manga_dir": self.manga_dir,
@@ -196,7 +277,7 @@ class ChapterLoaderWorker(QRunnable):
         extract_dir = SevenZipHandler.get_extract_dir(archive_path)
         target = extract_dir / internal.replace('/', os.sep).replace('\\', os.sep)
         
-        if target.exists():
+        if fs_cache.exists(target):
             return str(target)
             
         return path
@@ -220,7 +301,7 @@ class ChapterLoaderWorker(QRunnable):
             def _mtime(p):
                 real = p.split('|')[0] if '|' in p else p
                 try:
-                    return os.path.getmtime(real)
+                    return fs_cache.getmtime(real)
                 except OSError:
                     return 0.0
             return sorted(image_list, key=_mtime, reverse=desc)
@@ -229,7 +310,7 @@ class ChapterLoaderWorker(QRunnable):
             def _ctime(p):
                 real = p.split('|')[0] if '|' in p else p
                 try:
-                    return os.path.getctime(real)
+                    return fs_cache.getctime(real)
                 except OSError:
                     return 0.0
             return sorted(image_list, key=_ctime, reverse=desc)
@@ -241,98 +322,6 @@ class ChapterLoaderWorker(QRunnable):
 
         return sorted(image_list, key=_name_key, reverse=desc)
 
-    def _detect_spreads_in_background(self, pages):
-        """Perform spread detection using extracted files or ZipFile data."""
-        if not pages:
-            return
-
-        import os
-        from PyQt6.QtGui import QImageReader
-        import zipfile
-        from src.utils.img_utils import ZIP_CACHE
-
-        # 1. Samples
-        ratios = []
-        sample_indices = []
-        if len(pages) > 0:
-            indices = list(range(len(pages)))
-            import random
-            sample_indices = random.sample(indices, min(5, len(indices)))
-            
-        for i in sample_indices:
-            page = pages[i]
-            path = page.path
-            resolved = self._resolve_path(path)
-            
-            if '|' not in resolved:
-                reader = QImageReader(resolved)
-                size = reader.size()
-                if size.isValid() and size.height() > 0:
-                    ratios.append(size.width() / size.height())
-            else:
-                zip_path, internal = split_virtual_path(path)
-                zf = ZIP_CACHE.get_zip(zip_path)
-                if zf:
-                    try:
-                        with zf.open(internal) as f:
-                            data = f.read()
-                            buffer = QBuffer()
-                            buffer.setData(data)
-                            buffer.open(QBuffer.OpenModeFlag.ReadOnly)
-                            reader = QImageReader(buffer)
-                            size = reader.size()
-                            if size.isValid() and size.height() > 0:
-                                ratios.append(size.width() / size.height())
-                    except Exception:
-                        pass
-
-        if not ratios:
-            return
-
-        median_ratio = sorted(ratios)[len(ratios) // 2]
-        if median_ratio == 0: return
-        is_consistent = all(abs(r - median_ratio) / median_ratio < 0.1 for r in ratios)
-        if not is_consistent: return
-
-        spread_threshold = median_ratio * 1.5
-        
-        # 2. All pages
-        for page in pages:
-            if getattr(page, 'is_spread_explicit', False):
-                continue
-                
-            path = page.path
-            resolved = self._resolve_path(path)
-            is_spread = False
-            
-            if '|' not in resolved:
-                reader = QImageReader(resolved)
-                size = reader.size()
-                if size.isValid() and size.height() > 0:
-                    is_spread = (size.width() / size.height()) > spread_threshold
-            else:
-                # Read only enough header bytes for dimension detection instead of the full file
-                zip_path_str, internal = split_virtual_path(resolved if '|' in resolved else path)
-                zf = ZIP_CACHE.get_zip(zip_path_str)
-                if zf:
-                    try:
-                        with zf.open(internal) as f:
-                            header_data = f.read(65536)  # 64KB is enough for all image headers
-                        if header_data:
-                            from PyQt6.QtCore import QBuffer, QByteArray
-                            byte_array = QByteArray(header_data)
-                            buffer = QBuffer(byte_array)
-                            buffer.open(QBuffer.OpenModeFlag.ReadOnly)
-                            reader = QImageReader(buffer)
-                            size = reader.size()
-                            if size.isValid() and size.height() > 0:
-                                is_spread = (size.width() / size.height()) > spread_threshold
-                    except Exception:
-                        pass
-            
-            if is_spread != page.is_spread:
-                page.is_spread = is_spread
-
     def _get_image_list(self):
         if not self.manga_dir:
             return []
@@ -421,25 +410,112 @@ class ChapterLoaderWorker(QRunnable):
         if Path(path_str).suffix.lower() in ARCHIVE_EXTS:
             return scan_archive_internal(path_str, "")
         
-        manga_path = Path(path_str)
-        if manga_path.is_dir():
+        manga_path = str(Path(path_str))
+        if fs_cache.is_dir(manga_path):
             files = []
-            files.extend([str(p) for p in manga_path.iterdir() 
-                          if p.suffix.lower() in valid_exts and p.is_file() and "_detached_" not in p.name and p.stem.lower() != 'cover'])
+            for entry in fs_cache.scandir(manga_path):
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() in valid_exts and "_detached_" not in entry.name and stem.lower() != 'cover' and entry.is_file():
+                    files.append(entry.path)
             return sorted(files, key=get_chapter_number)
             
         return []
 
+class SpreadDetectionSignals(QObject):
+    measured = pyqtSignal(dict) # page_index -> (width, height, is_spread), in batches
+    finished = pyqtSignal(bool) # True if the whole chapter was measured
+
+class SpreadDetectionWorker(QRunnable):
+    """Measures page sizes off the GUI thread and classifies double-page spreads.
+
+    A few pages from the middle of the chapter establish the common aspect ratio;
+    chapters without a consistent one (art books, photo dumps) are left alone. Archive
+    pages are measured from their header bytes only. Results are emitted in batches so
+    the double layout fills in while the rest of the chapter is still being read.
+    """
+    SAMPLE_SIZE = 5
+    BATCH_SIZE = 24
+
+    def __init__(self, pages: list, skip: set = None, token: CancellationToken = None):
+        super().__init__()
+        self.pages = pages # [(page_index, main image path)]
+        self.skip = skip or set() # indices whose flag was set explicitly
+        self.token = token
+        self.signals = SpreadDetectionSignals()
+
+    def _measure(self, path: str):
+        if Path(path.split('|')[-1]).suffix.lower() not in IMAGE_EXTS:
+            return None
+        try:
+            size = read_image_size(path)
+        except Exception as e:
+            print(f"Error measuring {path}: {e}")
+            return None
+        if size.isValid() and size.height() > 0:
+            return size.width(), size.height()
+        return None
+
+    @pyqtSlot()
+    def run(self):
+        kind = type(self).__name__
+        pages = self.pages
+        sizes = {}
+
+        # 1. Common aspect ratio, sampled from the middle half of the chapter
+        middle = pages[len(pages) // 4: len(pages) * 3 // 4] if len(pages) > 10 else pages
+        ratios = []
+        for index, path in random.sample(middle, min(self.SAMPLE_SIZE, len(middle))):
+            if check_cancelled(self.token, kind, "sample"):
+                return
+            sizes[index] = self._measure(path)
+            if sizes[index]:
+                w, h = sizes[index]
+                ratios.append(w / h)
+
+        if not ratios:
+            # Nothing could be measured (read errors, an offline drive): leave it for the next open
+            self.signals.finished.emit(False)
+            return
+        median_ratio = sorted(ratios)[len(ratios) // 2]
+        if not all(abs(r - median_ratio) / median_ratio < 0.1 for r in ratios):
+            # Not a manga-like chapter; nothing to pair
+            self.signals.finished.emit(True)
+            return
+
+        # Spread is roughly double the width, so ratio should be ~2x the common one
+        spread_threshold = median_ratio * 1.5
+
+        # 2. Every page, streamed in batches
+        batch = {}
+        for index, path in pages:
+            if index in self.skip:
+                continue
+            if check_cancelled(self.token, kind, "read"):
+                return
+            size = sizes[index] if index in sizes else self._measure(path)
+            if size:
+                w, h = size
+                batch[index] = (w, h, w / h > spread_threshold)
+            if len(batch) >= self.BATCH_SIZE:
+                self.signals.measured.emit(batch)
+                batch = {}
+        if batch:
+            self.signals.measured.emit(batch)
+
+        WORK_STATS.record(kind, "completed")
+        self.signals.finished.emit(True)
+
 class WorkerSignals(QObject):
     finished = pyqtSignal(int, QImage, int)
 
 class PixmapLoader(QRunnable):
-    def __init__(self, path: str, index: int, load_func, generation_id: int):
+    def __init__(self, path: str, index: int, load_func, generation_id: int, token: CancellationToken = None):
         super().__init__()
         self.path = path
         self.index = index
         self.load_func = load_func
         self.generation_id = generation_id
+        self.token = token
         self.signals = WorkerSignals()
 
     @pyqtSlot()
@@ -448,15 +524,23 @@ class PixmapLoader(QRunnable):
         # For simplicity in this project's current structure, we'll try to use QImageReader directly or wrapper
         from src.utils.img_utils import get_image_data_from_zip
         
+        if check_cancelled(self.token, "PixmapLoader", "read"):
+            return
+
         q_image = QImage()
         if '|' in self.path:
             img_data = get_image_data_from_zip(self.path)
+            if check_cancelled(self.token, "PixmapLoader", "decode"):
+                return
             if img_data:
                 q_image.loadFromData(img_data)
         else:
             q_image.load(self.path)
-            
-        self.signals.finished.emit(self.index, q_image, self.generation_id)
+
+        if check_cancelled(self.token, "PixmapLoader", "convert"):
+            return
+        self.signals.finished.emit(self.index, to_display_format(q_image), self.generation_id)
+        WORK_STATS.record("PixmapLoader", "completed")
 
 class VideoFrameExtractorSignals(QObject):
     finished = pyqtSignal(str, QImage, int, float) # path, image, total_frames, fps
@@ -507,7 +591,7 @@ class VideoFrameExtractorWorker(QRunnable):
                     bytes_per_line = frame.strides[0]
                     q_image = QImage(frame.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
                     # We must make a copy of the data, because 'frame' (numpy array) will be garbage collected
-                    q_image = q_image.copy()
+                    q_image = to_display_format(q_image.copy())
                     self.signals.finished.emit(self.path, q_image, frame_count, fps)
         except Exception as e:
             print(f"Error in async video extraction: {e}")
@@ -575,7 +659,7 @@ class VideoMetadataWorker(QRunnable):
                     rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
                     rh, rw, _ = rgb.shape
                     q_image = QImage(rgb.data, rw, rh, rgb.strides[0], QImage.Format.Format_RGB888)
-                    initial_frames[idx] = q_image.copy()
+                    initial_frames[idx] = to_display_format(q_image.copy())
 
             cap.release()
             if not self.cancelled:
@@ -629,11 +713,12 @@ class AsyncLoaderSignals(QObject):
     finished = pyqtSignal(int, dict) # request_id, results {path: QImage}
 
 class AsyncLoaderWorker(QRunnable):
-    def __init__(self, request_id: int, paths: list[str], hint_width: int = 0):
+    def __init__(self, request_id: int, paths: list[str], hint_width: int = 0, token: CancellationToken = None):
         super().__init__()
         self.request_id = request_id
         self.paths = paths
         self.hint_width = hint_width
+        self.token = token
         self.signals = AsyncLoaderSignals()
 
     @pyqtSlot()
@@ -641,7 +726,9 @@ class AsyncLoaderWorker(QRunnable):
         results = {}
         for path in self.paths:
             if not path: continue
-            
+            if check_cancelled(self.token, "AsyncLoaderWorker", "read"):
+                return
+
             if path == "placeholder":
                 # Create a small black image, will be resized by consumer
                 img = QImage(1, 1, QImage.Format.Format_RGB32)
@@ -650,7 +737,7 @@ class AsyncLoaderWorker(QRunnable):
                 continue
             
             try:
-                image_data = None
+                anim_source = None # bytes or file path, set only for genuinely animated images
                 path_str = path
                 crop = None
                 
@@ -662,56 +749,36 @@ class AsyncLoaderWorker(QRunnable):
                         path_str = path[:-6]
                         crop = "right"
 
-                is_anim = path_str.lower().endswith((".gif", ".webp"))
-                is_avif = path_str.lower().endswith('.avif')
-
                 if '|' in path_str:
-                    image_data = get_image_data_from_zip(path_str)
+                    source = get_image_data_from_zip(path_str)
                 elif os.path.exists(path_str):
-                    if is_anim or is_avif:
-                        with open(path_str, 'rb') as f:
-                            image_data = f.read()
+                    source = path_str
+                else:
+                    source = None
+
+                if check_cancelled(self.token, "AsyncLoaderWorker", "decode"):
+                    return
 
                 q_image = QImage()
-                if image_data:
-                    if is_avif:
-                        pil_img = Image.open(io.BytesIO(image_data))
-                        # Check if AVIF is animated
-                        if getattr(pil_img, 'is_animated', False) or getattr(pil_img, 'n_frames', 1) > 1:
-                            is_anim = True
-                            
-                        pil_img = pil_img.convert('RGBA')
-                            
-                        if self.hint_width > 0 and pil_img.width > self.hint_width:
-                            aspect = pil_img.height / pil_img.width
-                            pil_img = pil_img.resize((self.hint_width, int(self.hint_width * aspect)), Image.Resampling.LANCZOS)
-                        data = pil_img.tobytes('raw', 'RGBA')
-                        q_image = QImage(data, pil_img.width, pil_img.height, pil_img.width * 4, QImage.Format.Format_RGBA8888).copy()
-                    else:
-                        buf = QBuffer()
-                        buf.setData(image_data if isinstance(image_data, (bytes, bytearray)) else bytes(image_data))
-                        buf.open(QIODevice.OpenModeFlag.ReadOnly)
-                        reader = QImageReader(buf)
-                        reader.setAutoTransform(True)
-                        if self.hint_width > 0 and not is_anim:
-                            orig = reader.size()
-                            if orig.isValid() and orig.width() > self.hint_width:
-                                aspect = orig.height() / orig.width()
-                                reader.setScaledSize(QSize(self.hint_width, int(self.hint_width * aspect)))
-                        q_image = reader.read()
-                elif os.path.exists(path_str):
-                    if is_anim:
-                        q_image.load(path_str)
-                    else:
-                        reader = QImageReader(path_str)
-                        reader.setAutoTransform(True)
-                        if self.hint_width > 0:
-                            orig = reader.size()
-                            if orig.isValid() and orig.width() > self.hint_width:
-                                aspect = orig.height() / orig.width()
-                                reader.setScaledSize(QSize(self.hint_width, int(self.hint_width * aspect)))
-                        q_image = reader.read()
+                if source:
+                    fmt = sniff_format(read_magic(source))
+                    if fmt in ANIMATED_FORMATS and self._is_animated(source):
+                        anim_source = source # bytes or file path; playback streams the other frames
+
+                    decoders = DecoderRegistry.instance()
+                    target = None
+                    source_size = None
+                    # Animations keep their full size, like the frames the animation player shows
+                    if self.hint_width > 0 and anim_source is None:
+                        source_size = decoders.probe(source)
+                        if source_size.isValid() and source_size.width() > self.hint_width:
+                            aspect = source_size.height() / source_size.width()
+                            target = QSize(self.hint_width, int(self.hint_width * aspect))
+                    q_image = decoders.decode(source, target, source_size)
                 
+                if check_cancelled(self.token, "AsyncLoaderWorker", "convert"):
+                    return
+
                 if not q_image.isNull() and crop:
                     w = q_image.width()
                     h = q_image.height()
@@ -721,39 +788,66 @@ class AsyncLoaderWorker(QRunnable):
                         q_image = q_image.copy(w // 2, 0, w // 2, h)
 
                 if not q_image.isNull():
-                    # Return (Image, Data) - data only needed for animations
-                    results[path] = (q_image, image_data if is_anim else None)
+                    # Return (Image, animation source) - source only set for animations
+                    results[path] = (to_display_format(q_image), anim_source if not crop else None)
                     
             except Exception as e:
                 print(f"Error loading image async {path}: {e}")
 
         self.signals.finished.emit(self.request_id, results)
+        WORK_STATS.record("AsyncLoaderWorker", "completed")
+
+    @staticmethod
+    def _is_animated(source) -> bool:
+        """Header-level check so static GIF/WEBP files never start a playback engine."""
+        try:
+            src = io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+            with Image.open(src) as img:
+                return bool(getattr(img, 'is_animated', False))
+        except Exception:
+            return False
 
 class AsyncScaleSignals(QObject):
     finished = pyqtSignal(int, QImage, int)
 
 class AsyncScaleWorker(QRunnable):
-    def __init__(self, image: QImage, target_width: int, index: int, generation_id: int, high_quality: bool = True):
+    def __init__(self, image: QImage, target_width: int, index: int, generation_id: int, high_quality: bool = True, token: CancellationToken = None):
         super().__init__()
         self.q_image = image.copy() 
         self.target_width = target_width
         self.index = index
         self.generation_id = generation_id
         self.high_quality = high_quality
+        self.token = token
         self.signals = AsyncScaleSignals()
 
     @pyqtSlot()
     def run(self):
         if self.q_image.isNull():
             return
+        if check_cancelled(self.token, "AsyncScaleWorker", "scale"):
+            return
 
         try:
             if not self.high_quality:
                 # Fast path using Qt
                 scaled = self.q_image.scaledToWidth(self.target_width, Qt.TransformationMode.SmoothTransformation)
-                self.signals.finished.emit(self.index, scaled, self.generation_id)
+                if check_cancelled(self.token, "AsyncScaleWorker", "convert"):
+                    return
+                self.signals.finished.emit(self.index, to_display_format(scaled), self.generation_id)
+                WORK_STATS.record("AsyncScaleWorker", "completed")
                 return
 
+            pool = DecodePool.instance()
+            if pool.enabled:
+                scaled = pool.scale(self.q_image, self.target_width)
+                if scaled is not None and not scaled.isNull():
+                    if check_cancelled(self.token, "AsyncScaleWorker", "convert"):
+                        return
+                    self.signals.finished.emit(self.index, scaled, self.generation_id)
+                    WORK_STATS.record("AsyncScaleWorker", "completed")
+                    return
+
             # 1. Convert QImage -> PIL directly via raw pixel buffer (avoids PNG encode/decode round-trip)
             q_img = self.q_image.convertToFormat(QImage.Format.Format_RGBA8888)
             ptr = q_img.bits()
@@ -764,18 +858,21 @@ class AsyncScaleWorker(QRunnable):
             h_size = int((float(pil_img.size[1]) * float(w_percent)))
             
             pil_resized = pil_img.resize((self.target_width, h_size), Image.Resampling.LANCZOS)
+            if check_cancelled(self.token, "AsyncScaleWorker", "sharpen"):
+                return
 
             pil_resized = pil_resized.filter(ImageFilter.UnsharpMask(radius=0.8, percent=80, threshold=3))
             
             q_out = ImageQt.ImageQt(pil_resized).copy()
             
-            self.signals.finished.emit(self.index, q_out, self.generation_id)
+            self.signals.finished.emit(self.index, to_display_format(q_out), self.generation_id)
+            WORK_STATS.record("AsyncScaleWorker", "completed")
             
         except Exception as e:
             print(f"Error in scale: {e}")
             # Fallback to Qt scaling if PIL fails
             scaled = self.q_image.scaledToWidth(self.target_width, Qt.TransformationMode.SmoothTransformation)
-            self.signals.finished.emit(self.index, scaled, self.generation_id)
+            self.signals.finished.emit(self.index, to_display_format(scaled), self.generation_id)
 
 class ImageInfoSignals(QObject):
     finished = pyqtSignal(str)
@@ -930,7 +1027,7 @@ class VideoBatchFrameExtractorWorker(QRunnable):
                     rh, rw, rch = rgb_frame.shape
                     bytes_per_line = rgb_frame.strides[0]
                     q_image = QImage(rgb_frame.data, rw, rh, bytes_per_line, QImage.Format.Format_RGB888)
-                    results[idx] = q_image.copy()
+                    results[idx] = to_display_format(q_image.copy())
             
             cap.release()
             if results and not self.cancelled: